@@ -1,26 +1,16 @@
 """
 Configuration modules for the trading system.
+
+Strategy, backtest and risk settings are imported eagerly. Real-time
+settings are loaded on first attribute access so code paths that never
+touch them (e.g. backtests) do not pay for the import.
 """
 
-from .settings import (
-    PREMIUM_SELLING_CONFIG,
-    BACKTEST_CONFIG,
-    RISK_CONFIG,
-)
-from .realtime_settings import (
-    REALTIME_CONFIG,
-    MOCK_PROVIDER_CONFIG,
-    ANGEL_ONE_PROVIDER_CONFIG,
-    get_realtime_config,
-    get_provider_config,
-    get_token_for_symbol,
-    get_symbol_for_token,
-)
+from .settings import *  # noqa: F401,F403
+from .settings import __all__ as _settings_all
 
-__all__ = [
-    "PREMIUM_SELLING_CONFIG",
-    "BACKTEST_CONFIG",
-    "RISK_CONFIG",
+# Names re-exported lazily from .realtime_settings
+_REALTIME_NAMES = (
     "REALTIME_CONFIG",
     "MOCK_PROVIDER_CONFIG",
     "ANGEL_ONE_PROVIDER_CONFIG",
@@ -28,4 +18,16 @@ __all__ = [
     "get_provider_config",
     "get_token_for_symbol",
     "get_symbol_for_token",
-]
+)
+
+__all__ = [*_settings_all, *_REALTIME_NAMES]
+
+
+def __getattr__(name: str):
+    """Load real-time settings on first access (PEP 562)."""
+    if name in _REALTIME_NAMES:
+        from . import realtime_settings
+        value = getattr(realtime_settings, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
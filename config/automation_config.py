@@ -4,7 +4,9 @@ Automation Configuration Module.
 Configuration settings for automated trading and data management.
 """
 
-from typing import Any, Dict
+import copy
+from types import MappingProxyType
+from typing import Any, Dict, Mapping
 
 # Automation configuration
 AUTOMATION_CONFIG: Dict[str, Any] = {
@@ -127,55 +129,114 @@ AUTOMATION_CONFIG: Dict[str, Any] = {
     },
 }
 
+# Trading modes
+MODE_PAPER = "paper"
+MODE_LIVE = "live"
 
-def get_automation_config() -> Dict[str, Any]:
+# Accepted values for validate_automation_config
+_VALID_MODES = frozenset({MODE_PAPER, MODE_LIVE})
+_VALID_INTERVALS = frozenset({"1m", "5m", "15m", "30m", "1h", "1d"})
+
+# Read-only views built once at import; the getters below hand these out
+# instead of copying the configuration on every call.
+_EMPTY_VIEW: Mapping[str, Any] = MappingProxyType({})
+_SECTION_VIEWS: Dict[str, Mapping[str, Any]] = {
+    name: MappingProxyType(section) for name, section in AUTOMATION_CONFIG.items()
+}
+_AUTOMATION_VIEW: Mapping[str, Any] = MappingProxyType(_SECTION_VIEWS)
+
+# Read-only trading section for hot-path readers, e.g.
+# TRADING_CONFIG_VIEW["strategy_interval_seconds"]
+TRADING_CONFIG_VIEW: Mapping[str, Any] = _SECTION_VIEWS["trading"]
+
+
+def _section(name: str) -> Mapping[str, Any]:
+    """
+    Get a read-only view of one configuration section.
+    
+    Args:
+        name: Section name ("trading", "data", "notifications", "safety")
+        
+    Returns:
+        Read-only mapping over the section dictionary
+    """
+    return _SECTION_VIEWS.get(name, _EMPTY_VIEW)
+
+
+def get_automation_config(mutable: bool = False) -> Mapping[str, Any]:
     """
     Get the full automation configuration.
     
+    Args:
+        mutable: Return an independent deep copy instead of a read-only view
+    
     Returns:
-        Dictionary with automation configuration
+        Read-only mapping with automation configuration, or a dictionary
+        if mutable is True
     """
-    return AUTOMATION_CONFIG.copy()
+    if mutable:
+        return copy.deepcopy(AUTOMATION_CONFIG)
+    return _AUTOMATION_VIEW
 
 
-def get_trading_config() -> Dict[str, Any]:
+def get_trading_config(mutable: bool = False) -> Mapping[str, Any]:
     """
     Get trading automation configuration.
     
+    Args:
+        mutable: Return an independent deep copy instead of a read-only view
+    
     Returns:
-        Dictionary with trading configuration
+        Mapping with trading configuration
     """
-    return AUTOMATION_CONFIG.get("trading", {}).copy()
+    if mutable:
+        return copy.deepcopy(AUTOMATION_CONFIG.get("trading", {}))
+    return TRADING_CONFIG_VIEW
 
 
-def get_data_config() -> Dict[str, Any]:
+def get_data_config(mutable: bool = False) -> Mapping[str, Any]:
     """
     Get data pipeline configuration.
     
+    Args:
+        mutable: Return an independent deep copy instead of a read-only view
+    
     Returns:
-        Dictionary with data configuration
+        Mapping with data configuration
     """
-    return AUTOMATION_CONFIG.get("data", {}).copy()
+    if mutable:
+        return copy.deepcopy(AUTOMATION_CONFIG.get("data", {}))
+    return _section("data")
 
 
-def get_notification_config() -> Dict[str, Any]:
+def get_notification_config(mutable: bool = False) -> Mapping[str, Any]:
     """
     Get notification configuration.
     
+    Args:
+        mutable: Return an independent deep copy instead of a read-only view
+    
     Returns:
-        Dictionary with notification configuration
+        Mapping with notification configuration
     """
-    return AUTOMATION_CONFIG.get("notifications", {}).copy()
+    if mutable:
+        return copy.deepcopy(AUTOMATION_CONFIG.get("notifications", {}))
+    return _section("notifications")
 
 
-def get_safety_config() -> Dict[str, Any]:
+def get_safety_config(mutable: bool = False) -> Mapping[str, Any]:
     """
     Get safety configuration.
     
+    Args:
+        mutable: Return an independent deep copy instead of a read-only view
+    
     Returns:
-        Dictionary with safety configuration
+        Mapping with safety configuration
     """
-    return AUTOMATION_CONFIG.get("safety", {}).copy()
+    if mutable:
+        return copy.deepcopy(AUTOMATION_CONFIG.get("safety", {}))
+    return _section("safety")
 
 
 def validate_automation_config(config: Dict[str, Any]) -> bool:
@@ -192,23 +253,23 @@ def validate_automation_config(config: Dict[str, Any]) -> bool:
         ValueError: If configuration is invalid
     """
     # Validate trading config
-    trading = config.get("trading", {})
+    trading = config.get("trading") or {}
     if trading.get("enabled", False):
-        if trading.get("mode") not in ["paper", "live"]:
+        mode = trading.get("mode")
+        if mode not in _VALID_MODES:
             raise ValueError("Trading mode must be 'paper' or 'live'")
         
         if trading.get("strategy_interval_seconds", 0) < 1:
             raise ValueError("Strategy interval must be at least 1 second")
         
-        if trading.get("mode") == "live" and not trading.get("live_trading_confirmed"):
+        if mode == MODE_LIVE and not trading.get("live_trading_confirmed"):
             raise ValueError("Live trading requires 'live_trading_confirmed' to be True")
     
     # Validate data config
-    data = config.get("data", {})
+    data = config.get("data") or {}
     if data.get("enabled", False):
-        valid_intervals = ["1m", "5m", "15m", "30m", "1h", "1d"]
-        for interval in data.get("intervals", []):
-            if interval not in valid_intervals:
+        for interval in data.get("intervals", ()):
+            if interval not in _VALID_INTERVALS:
                 raise ValueError(f"Invalid interval: {interval}")
         
         if data.get("realtime_interval_seconds", 0) < 1:
@@ -221,26 +282,40 @@ def create_paper_trading_config() -> Dict[str, Any]:
     """
     Create a configuration for paper trading.
     
+    Only the trading section is copied; the other sections are shared
+    with AUTOMATION_CONFIG and should be treated as read-only.
+    
     Returns:
         Dictionary with paper trading configuration
     """
-    config = get_automation_config()
-    config["trading"]["mode"] = "paper"
-    config["trading"]["live_trading_confirmed"] = False
-    return config
+    return {
+        **AUTOMATION_CONFIG,
+        "trading": {
+            **AUTOMATION_CONFIG["trading"],
+            "mode": MODE_PAPER,
+            "live_trading_confirmed": False,
+        },
+    }
 
 
 def create_live_trading_config(confirmed: bool = False) -> Dict[str, Any]:
     """
     Create a configuration for live trading.
     
+    Only the trading section is copied; the other sections are shared
+    with AUTOMATION_CONFIG and should be treated as read-only.
+    
     Args:
         confirmed: Whether live trading is confirmed
         
     Returns:
         Dictionary with live trading configuration
     """
-    config = get_automation_config()
-    config["trading"]["mode"] = "live"
-    config["trading"]["live_trading_confirmed"] = confirmed
-    return config
+    return {
+        **AUTOMATION_CONFIG,
+        "trading": {
+            **AUTOMATION_CONFIG["trading"],
+            "mode": MODE_LIVE,
+            "live_trading_confirmed": confirmed,
+        },
+    }
@@ -9,25 +9,84 @@ Never commit actual API keys, passwords, or TOTP secrets to the repository.
 """
 
 import os
-from typing import Any, Dict
+import threading
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, NamedTuple, Optional
 
-# Angel One SmartAPI Configuration
-# Credentials are loaded from environment variables for security
+from .automation_config import MODE_LIVE, MODE_PAPER
+
+# Angel One API credentials (from Angel One developer portal)
+# Maps config key -> environment variable. Values are read on first use
+# (see get_angel_one_credentials) rather than at import time.
 # Set these in your environment or .env file before running live trading
-ANGEL_ONE_CONFIG: Dict[str, Any] = {
-    # API credentials (from Angel One developer portal)
-    # Load from environment variables to avoid committing secrets
-    "api_key": os.environ.get("ANGEL_ONE_API_KEY", ""),
-    "client_id": os.environ.get("ANGEL_ONE_CLIENT_ID", ""),
-    "password": os.environ.get("ANGEL_ONE_PASSWORD", ""),
-    "totp_secret": os.environ.get("ANGEL_ONE_TOTP_SECRET", ""),
-    
-    # Auto-generated tokens (set after login)
-    "feed_token": None,
-    "jwt_token": None,
-    "refresh_token": None,
+ANGEL_ONE_CREDENTIAL_ENV: Dict[str, str] = {
+    "api_key": "ANGEL_ONE_API_KEY",
+    "client_id": "ANGEL_ONE_CLIENT_ID",
+    "password": "ANGEL_ONE_PASSWORD",
+    "totp_secret": "ANGEL_ONE_TOTP_SECRET",
 }
 
+
+class AngelOneTokenStore:
+    """
+    Thread-safe holder for Angel One session tokens.
+    
+    Tokens are generated on login and change at runtime, so they are kept
+    apart from the static configuration dictionaries.
+    """
+    
+    __slots__ = ("feed_token", "jwt_token", "refresh_token", "_lock")
+    
+    def __init__(self):
+        """Initialize an empty token store."""
+        self.feed_token: Optional[str] = None
+        self.jwt_token: Optional[str] = None
+        self.refresh_token: Optional[str] = None
+        self._lock = threading.Lock()
+    
+    def update(
+        self,
+        feed_token: Optional[str] = None,
+        jwt_token: Optional[str] = None,
+        refresh_token: Optional[str] = None,
+    ) -> None:
+        """
+        Replace all three tokens in a single step.
+        
+        Args:
+            feed_token: Feed token for WebSocket streaming
+            jwt_token: JWT session token
+            refresh_token: Token used to renew the session
+        """
+        with self._lock:
+            self.feed_token = feed_token
+            self.jwt_token = jwt_token
+            self.refresh_token = refresh_token
+        _live_view.cache_clear()
+    
+    def clear(self) -> None:
+        """Drop all tokens (e.g. on logout)."""
+        self.update()
+    
+    def snapshot(self) -> Dict[str, Optional[str]]:
+        """
+        Get a consistent copy of the current tokens.
+        
+        Returns:
+            Dictionary with feed_token, jwt_token and refresh_token
+        """
+        with self._lock:
+            return {
+                "feed_token": self.feed_token,
+                "jwt_token": self.jwt_token,
+                "refresh_token": self.refresh_token,
+            }
+
+
+# Angel One SmartAPI session tokens (set after login)
+ANGEL_ONE_TOKENS = AngelOneTokenStore()
+
 # General Broker Configuration
 BROKER_CONFIG: Dict[str, Any] = {
     # Trading mode: "live" for real trading, "paper" for simulation
@@ -103,6 +162,84 @@ BROKER_RISK_CONFIG: Dict[str, Any] = {
 }
 
 
+class BrokerRuntimeConfig(NamedTuple):
+    """Immutable general broker settings with attribute access."""
+    mode: str
+    default_exchange: str
+    default_product_type: str
+    max_requests_per_second: int
+    max_orders_per_minute: int
+    max_retries: int
+    retry_delay_seconds: int
+    log_orders: bool
+    log_market_data: bool
+
+
+# Built once; safe to share across threads without copying
+_PAPER_RUNTIME = BrokerRuntimeConfig(**{**BROKER_CONFIG, "mode": MODE_PAPER})
+_LIVE_RUNTIME = BrokerRuntimeConfig(**{**BROKER_CONFIG, "mode": MODE_LIVE})
+
+# Keys validate_config requires for each mode
+_REQUIRED_PAPER = ("initial_capital", "slippage_pct")
+_REQUIRED_LIVE = ("api_key", "client_id", "password")
+
+
+@lru_cache(maxsize=None)
+def _env_str(key: str, default: str = "") -> str:
+    """Read an environment variable once and cache the value."""
+    return os.environ.get(key, default)
+
+
+def get_angel_one_credentials() -> Dict[str, str]:
+    """
+    Get Angel One credentials from the environment.
+    
+    Values are cached after the first read; call refresh_env() to pick
+    up changed environment variables.
+    
+    Returns:
+        Dictionary with api_key, client_id, password and totp_secret
+    """
+    return {key: _env_str(var) for key, var in ANGEL_ONE_CREDENTIAL_ENV.items()}
+
+
+def refresh_env() -> None:
+    """Drop cached environment values so the next read sees current values."""
+    _env_str.cache_clear()
+    _live_view.cache_clear()
+
+
+# Merged configurations per mode, built once at import.
+# Live credentials and session tokens are not part of the template; they
+# are merged in on demand from get_angel_one_credentials() and
+# ANGEL_ONE_TOKENS.
+_PAPER_TEMPLATE: Dict[str, Any] = {
+    **BROKER_CONFIG,
+    **BROKER_RISK_CONFIG,
+    **PAPER_TRADING_CONFIG,
+    "mode": MODE_PAPER,
+}
+
+_LIVE_TEMPLATE: Dict[str, Any] = {
+    **BROKER_CONFIG,
+    **BROKER_RISK_CONFIG,
+    **WEBSOCKET_CONFIG,
+    "mode": MODE_LIVE,
+}
+
+_PAPER_VIEW: Mapping[str, Any] = MappingProxyType(_PAPER_TEMPLATE)
+
+
+@lru_cache(maxsize=1)
+def _live_view() -> Mapping[str, Any]:
+    """Build the read-only live configuration including credentials and tokens."""
+    return MappingProxyType({
+        **_LIVE_TEMPLATE,
+        **get_angel_one_credentials(),
+        **ANGEL_ONE_TOKENS.snapshot(),
+    })
+
+
 def get_broker_config(mode: str = None) -> Dict[str, Any]:
     """
     Get broker configuration for specified mode.
@@ -113,25 +250,56 @@ def get_broker_config(mode: str = None) -> Dict[str, Any]:
     Returns:
         Combined configuration dictionary
     """
-    mode = mode or BROKER_CONFIG.get("mode", "paper")
-    
-    config = {
-        **BROKER_CONFIG,
-        **BROKER_RISK_CONFIG,
-    }
-    
-    if mode == "live":
-        config.update({
-            **ANGEL_ONE_CONFIG,
-            **WEBSOCKET_CONFIG,
-        })
+    mode = mode or BROKER_CONFIG.get("mode", MODE_PAPER)
+    
+    if mode == MODE_LIVE:
+        config = {
+            **_LIVE_TEMPLATE,
+            **get_angel_one_credentials(),
+            **ANGEL_ONE_TOKENS.snapshot(),
+        }
     else:
-        config.update(PAPER_TRADING_CONFIG)
+        config = _PAPER_TEMPLATE.copy()
     
     config["mode"] = mode
     return config
 
 
+def get_broker_config_view(mode: str = None) -> Mapping[str, Any]:
+    """
+    Get a read-only view of the broker configuration for specified mode.
+    
+    Unlike get_broker_config, no copy is made. Any mode other than
+    "live" returns the paper configuration.
+    
+    Args:
+        mode: Trading mode ("live" or "paper"). Uses default if None.
+        
+    Returns:
+        Read-only combined configuration mapping
+    """
+    mode = mode or BROKER_CONFIG.get("mode", MODE_PAPER)
+    return _live_view() if mode == MODE_LIVE else _PAPER_VIEW
+
+
+def get_broker_runtime_config(mode: str = None) -> BrokerRuntimeConfig:
+    """
+    Get general broker settings as an immutable named tuple.
+    
+    Intended for hot paths that read a few fields repeatedly
+    (e.g. ``cfg.max_retries``). Any mode other than "live" returns
+    the paper settings.
+    
+    Args:
+        mode: Trading mode ("live" or "paper"). Uses default if None.
+        
+    Returns:
+        Shared BrokerRuntimeConfig instance for the mode
+    """
+    mode = mode or BROKER_CONFIG.get("mode", MODE_PAPER)
+    return _LIVE_RUNTIME if mode == MODE_LIVE else _PAPER_RUNTIME
+
+
 def validate_config(config: Dict[str, Any]) -> bool:
     """
     Validate broker configuration.
@@ -145,18 +313,13 @@ def validate_config(config: Dict[str, Any]) -> bool:
     Raises:
         ValueError: If configuration is invalid
     """
-    required_paper = ["initial_capital", "slippage_pct"]
-    required_live = ["api_key", "client_id", "password"]
-    
-    mode = config.get("mode", "paper")
-    
-    if mode == "paper":
-        for key in required_paper:
-            if key not in config or config[key] is None:
+    if config.get("mode", MODE_PAPER) == MODE_PAPER:
+        for key in _REQUIRED_PAPER:
+            if config.get(key) is None:
                 raise ValueError(f"Missing required config: {key}")
     else:
-        for key in required_live:
-            if key not in config or not config[key]:
+        for key in _REQUIRED_LIVE:
+            if not config.get(key):
                 raise ValueError(f"Missing required config for live trading: {key}")
     
     return True
@@ -6,8 +6,9 @@ environments (development, staging, production).
 """
 
 import os
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from enum import Enum
+from functools import lru_cache
 from typing import Dict, Optional
 
 
@@ -18,7 +19,7 @@ class Environment(Enum):
     PRODUCTION = "prod"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ResourceConfig:
     """Container resource configuration."""
     cpu: int  # CPU units (256 = 0.25 vCPU)
@@ -28,7 +29,7 @@ class ResourceConfig:
     desired_instances: int = 1
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class DatabaseConfig:
     """Database configuration."""
     instance_class: str = "db.t3.micro"
@@ -39,7 +40,7 @@ class DatabaseConfig:
     delete_protection: bool = False
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class LoggingConfig:
     """Logging configuration."""
     level: str = "INFO"
@@ -47,7 +48,7 @@ class LoggingConfig:
     enable_debug: bool = False
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ScalingConfig:
     """Auto-scaling configuration."""
     enabled: bool = False
@@ -57,7 +58,16 @@ class ScalingConfig:
     scale_out_cooldown: int = 60
 
 
-@dataclass
+# Shared defaults; the config classes are frozen so one instance of each
+# can back every EnvironmentConfig that does not override it.
+_DEFAULT_RESOURCES = ResourceConfig(cpu=256, memory=512)
+_DEFAULT_DATABASE = DatabaseConfig()
+_DEFAULT_LOGGING = LoggingConfig()
+_DEFAULT_SCALING = ScalingConfig()
+_RESOURCES_MEDIUM = ResourceConfig(cpu=512, memory=1024)
+
+
+@dataclass(frozen=True, slots=True)
 class EnvironmentConfig:
     """Complete environment configuration."""
     name: str
@@ -65,18 +75,18 @@ class EnvironmentConfig:
     aws_region: str = "ap-south-1"
     
     # Service configurations
-    trading_resources: ResourceConfig = field(default_factory=lambda: ResourceConfig(cpu=256, memory=512))
-    dashboard_resources: ResourceConfig = field(default_factory=lambda: ResourceConfig(cpu=256, memory=512))
-    data_service_resources: ResourceConfig = field(default_factory=lambda: ResourceConfig(cpu=256, memory=512))
+    trading_resources: ResourceConfig = _DEFAULT_RESOURCES
+    dashboard_resources: ResourceConfig = _DEFAULT_RESOURCES
+    data_service_resources: ResourceConfig = _DEFAULT_RESOURCES
     
     # Database
-    database: DatabaseConfig = field(default_factory=DatabaseConfig)
+    database: DatabaseConfig = _DEFAULT_DATABASE
     
     # Logging
-    logging: LoggingConfig = field(default_factory=LoggingConfig)
+    logging: LoggingConfig = _DEFAULT_LOGGING
     
     # Scaling
-    scaling: ScalingConfig = field(default_factory=ScalingConfig)
+    scaling: ScalingConfig = _DEFAULT_SCALING
     
     # Feature flags
     paper_trading: bool = True
@@ -94,17 +104,11 @@ DEVELOPMENT_CONFIG = EnvironmentConfig(
     name="development",
     environment=Environment.DEVELOPMENT,
     trading_resources=ResourceConfig(cpu=256, memory=512, min_instances=1, max_instances=2),
-    dashboard_resources=ResourceConfig(cpu=256, memory=512),
-    data_service_resources=ResourceConfig(cpu=256, memory=512),
-    database=DatabaseConfig(
-        instance_class="db.t3.micro",
-        allocated_storage=20,
-        multi_az=False,
-        backup_retention_days=7,
-        delete_protection=False
-    ),
+    dashboard_resources=_DEFAULT_RESOURCES,
+    data_service_resources=_DEFAULT_RESOURCES,
+    database=_DEFAULT_DATABASE,  # db.t3.micro, 20 GB, single AZ
     logging=LoggingConfig(level="DEBUG", retention_days=7, enable_debug=True),
-    scaling=ScalingConfig(enabled=False),
+    scaling=_DEFAULT_SCALING,
     paper_trading=True,
     enable_monitoring=True,
     enable_alerting=False,
@@ -117,8 +121,8 @@ STAGING_CONFIG = EnvironmentConfig(
     name="staging",
     environment=Environment.STAGING,
     trading_resources=ResourceConfig(cpu=512, memory=1024, min_instances=1, max_instances=2),
-    dashboard_resources=ResourceConfig(cpu=256, memory=512),
-    data_service_resources=ResourceConfig(cpu=256, memory=512),
+    dashboard_resources=_DEFAULT_RESOURCES,
+    data_service_resources=_DEFAULT_RESOURCES,
     database=DatabaseConfig(
         instance_class="db.t3.small",
         allocated_storage=50,
@@ -146,8 +150,8 @@ PRODUCTION_CONFIG = EnvironmentConfig(
         max_instances=5,
         desired_instances=2
     ),
-    dashboard_resources=ResourceConfig(cpu=512, memory=1024),
-    data_service_resources=ResourceConfig(cpu=512, memory=1024),
+    dashboard_resources=_RESOURCES_MEDIUM,
+    data_service_resources=_RESOURCES_MEDIUM,
     database=DatabaseConfig(
         instance_class="db.t3.medium",
         allocated_storage=100,
@@ -182,6 +186,12 @@ CONFIGS: Dict[str, EnvironmentConfig] = {
 }
 
 
+@lru_cache(maxsize=1)
+def _default_environment() -> str:
+    """Read the ENVIRONMENT env var once per process."""
+    return os.getenv("ENVIRONMENT", "dev")
+
+
 def get_config(environment: Optional[str] = None) -> EnvironmentConfig:
     """
     Get configuration for the specified environment.
@@ -189,6 +199,8 @@ def get_config(environment: Optional[str] = None) -> EnvironmentConfig:
     Args:
         environment: Environment name (dev, staging, prod).
                     If not specified, reads from ENVIRONMENT env var.
+                    The env var is read once and cached; call
+                    reset_config() to re-read it.
     
     Returns:
         EnvironmentConfig for the specified environment.
@@ -197,34 +209,38 @@ def get_config(environment: Optional[str] = None) -> EnvironmentConfig:
         ValueError: If environment is invalid.
     """
     if environment is None:
-        environment = os.getenv("ENVIRONMENT", "dev")
+        environment = _default_environment()
     
-    env_lower = environment.lower()
-    
-    if env_lower not in CONFIGS:
-        valid_envs = list(CONFIGS.keys())
+    config = CONFIGS.get(environment.lower())
+    if config is None:
         raise ValueError(
             f"Invalid environment: {environment}. "
-            f"Valid environments: {valid_envs}"
+            f"Valid environments: {list(CONFIGS)}"
         )
     
-    return CONFIGS[env_lower]
+    return config
 
 
+@lru_cache(maxsize=1)
 def get_current_environment() -> Environment:
     """Get the current deployment environment."""
-    config = get_config()
-    return config.environment
+    return get_config().environment
 
 
 def is_production() -> bool:
     """Check if running in production environment."""
-    return get_current_environment() == Environment.PRODUCTION
+    return get_current_environment() is Environment.PRODUCTION
 
 
 def is_development() -> bool:
     """Check if running in development environment."""
-    return get_current_environment() == Environment.DEVELOPMENT
+    return get_current_environment() is Environment.DEVELOPMENT
+
+
+def reset_config() -> None:
+    """Clear cached environment lookups so ENVIRONMENT is read again."""
+    _default_environment.cache_clear()
+    get_current_environment.cache_clear()
 
 
 # Export convenience functions and classes
@@ -239,6 +255,7 @@ __all__ = [
     "get_current_environment",
     "is_production",
     "is_development",
+    "reset_config",
     "DEVELOPMENT_CONFIG",
     "STAGING_CONFIG",
     "PRODUCTION_CONFIG",
@@ -4,7 +4,36 @@ Real-Time Data Configuration Settings.
 Configuration parameters for real-time data providers, managers, and aggregators.
 """
 
-from typing import Dict, Any, List
+from enum import IntEnum
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Any, List, Mapping
+
+__all__ = [
+    "REALTIME_CONFIG",
+    "MOCK_PROVIDER_CONFIG",
+    "ANGEL_ONE_PROVIDER_CONFIG",
+    "SYMBOL_TOKEN_MAP",
+    "EXCHANGE_TYPE_MAP",
+    "ExchangeType",
+    "get_realtime_config",
+    "get_provider_config",
+    "get_token_for_symbol",
+    "get_symbol_for_token",
+    "get_exchange_type",
+    "register_symbol_token",
+]
+
+
+class ExchangeType(IntEnum):
+    """Angel One exchange type codes."""
+    NSE = 1
+    NFO = 2
+    BSE = 3
+    BFO = 4
+    MCX = 5
+    CDS = 6
+
 
 # Real-Time Data Manager Configuration
 REALTIME_CONFIG: Dict[str, Any] = {
@@ -54,8 +83,8 @@ MOCK_PROVIDER_CONFIG: Dict[str, Any] = {
 
 # Angel One Provider Configuration
 ANGEL_ONE_PROVIDER_CONFIG: Dict[str, Any] = {
-    # Default exchange type (2 = NFO for options)
-    'exchange_type': 2,
+    # Default exchange type (NFO for options)
+    'exchange_type': ExchangeType.NFO,
     
     # Connection timeout in seconds
     'connection_timeout': 10,
@@ -71,35 +100,46 @@ SYMBOL_TOKEN_MAP: Dict[str, str] = {
     'FINNIFTY': '99926037',
     
     # Add more symbol-token mappings as needed
+    # (use register_symbol_token at runtime)
+}
+
+# Reverse mapping (token -> symbol), kept in sync by register_symbol_token
+_TOKEN_SYMBOL_MAP: Dict[str, str] = {
+    token: symbol for symbol, token in SYMBOL_TOKEN_MAP.items()
 }
 
 
-# Exchange Type Mapping
+# Exchange Type Mapping (name -> code), kept for dict-style callers
 EXCHANGE_TYPE_MAP: Dict[str, int] = {
-    'NSE': 1,
-    'NFO': 2,
-    'BSE': 3,
-    'BFO': 4,
-    'MCX': 5,
-    'CDS': 6,
+    exchange.name: exchange.value for exchange in ExchangeType
 }
 
 
-def get_realtime_config() -> Dict[str, Any]:
+# Read-only views handed out by the getters below (no per-call copies).
+# Callers that need to modify a config should take dict(view).
+_PROVIDER_VIEWS: Dict[str, Mapping[str, Any]] = {
+    'mock': MappingProxyType(MOCK_PROVIDER_CONFIG),
+    'angel_one': MappingProxyType(ANGEL_ONE_PROVIDER_CONFIG),
+}
+_EMPTY_VIEW: Mapping[str, Any] = MappingProxyType({})
+_REALTIME_VIEW: Mapping[str, Any] = MappingProxyType({
+    **REALTIME_CONFIG,
+    'mock_provider': _PROVIDER_VIEWS['mock'],
+    'angel_one_provider': _PROVIDER_VIEWS['angel_one'],
+})
+
+
+def get_realtime_config() -> Mapping[str, Any]:
     """
     Get the complete real-time configuration.
     
     Returns:
-        Dictionary with all real-time configuration settings
+        Read-only mapping with all real-time configuration settings
     """
-    return {
-        **REALTIME_CONFIG,
-        'mock_provider': MOCK_PROVIDER_CONFIG,
-        'angel_one_provider': ANGEL_ONE_PROVIDER_CONFIG,
-    }
+    return _REALTIME_VIEW
 
 
-def get_provider_config(provider_type: str) -> Dict[str, Any]:
+def get_provider_config(provider_type: str) -> Mapping[str, Any]:
     """
     Get configuration for a specific provider.
     
@@ -107,16 +147,13 @@ def get_provider_config(provider_type: str) -> Dict[str, Any]:
         provider_type: Provider type ('mock' or 'angel_one')
         
     Returns:
-        Provider-specific configuration dictionary
+        Read-only provider-specific configuration mapping (empty for
+        unknown providers)
     """
-    if provider_type == 'mock':
-        return MOCK_PROVIDER_CONFIG.copy()
-    elif provider_type == 'angel_one':
-        return ANGEL_ONE_PROVIDER_CONFIG.copy()
-    else:
-        return {}
+    return _PROVIDER_VIEWS.get(provider_type, _EMPTY_VIEW)
 
 
+@lru_cache(maxsize=512)
 def get_token_for_symbol(symbol: str) -> str:
     """
     Get the token ID for a symbol.
@@ -130,6 +167,7 @@ def get_token_for_symbol(symbol: str) -> str:
     return SYMBOL_TOKEN_MAP.get(symbol.upper(), symbol)
 
 
+@lru_cache(maxsize=512)
 def get_symbol_for_token(token: str) -> str:
     """
     Get the symbol for a token ID.
@@ -140,13 +178,33 @@ def get_symbol_for_token(token: str) -> str:
     Returns:
         Symbol string
     """
-    # Reverse lookup
-    for symbol, t in SYMBOL_TOKEN_MAP.items():
-        if t == token:
-            return symbol
-    return token
+    return _TOKEN_SYMBOL_MAP.get(token, token)
+
+
+def register_symbol_token(symbol: str, token: str) -> None:
+    """
+    Add or replace a symbol-token mapping.
+    
+    Keeps SYMBOL_TOKEN_MAP, its reverse mapping and the cached lookups
+    consistent; prefer this over mutating SYMBOL_TOKEN_MAP directly.
+    
+    Args:
+        symbol: Trading symbol
+        token: Token ID
+    """
+    symbol = symbol.upper()
+    old_token = SYMBOL_TOKEN_MAP.get(symbol)
+    if old_token is not None:
+        _TOKEN_SYMBOL_MAP.pop(old_token, None)
+    
+    SYMBOL_TOKEN_MAP[symbol] = token
+    _TOKEN_SYMBOL_MAP[token] = symbol
+    
+    get_token_for_symbol.cache_clear()
+    get_symbol_for_token.cache_clear()
 
 
+@lru_cache(maxsize=512)
 def get_exchange_type(exchange: str) -> int:
     """
     Get the exchange type code.
@@ -155,6 +213,7 @@ def get_exchange_type(exchange: str) -> int:
         exchange: Exchange name (NSE, NFO, BSE, etc.)
         
     Returns:
-        Exchange type integer
+        ExchangeType code (an int); NSE for unknown exchanges
     """
-    return EXCHANGE_TYPE_MAP.get(exchange.upper(), 1)
+    member = ExchangeType.__members__.get(exchange.upper())
+    return ExchangeType.NSE if member is None else member
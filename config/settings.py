@@ -3,12 +3,35 @@ Configuration settings for the algorithmic trading system.
 
 This module contains all configurable parameters for strategies,
 backtesting, and risk management.
+
+The top-level configs are read-only mappings so they can be shared
+without defensive copies; take dict(CONFIG) to build a customised copy.
 """
 
-from typing import Dict, Any, Tuple
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Dict, Any, Mapping, Tuple
+
+__all__ = [
+    "PREMIUM_SELLING_CONFIG",
+    "BACKTEST_CONFIG",
+    "RISK_CONFIG",
+    "DATA_CONFIG",
+    "INSTRUMENT_CONFIG",
+    "IRON_CONDOR_CONFIG",
+    "CALENDAR_SPREAD_CONFIG",
+    "RATIO_SPREAD_CONFIG",
+    "STRATEGY_CONFIGS",
+    "get_strategy_config",
+    "StrategyParams",
+    "PREMIUM_SELLING_PARAMS",
+    "IRON_CONDOR_PARAMS",
+    "CALENDAR_SPREAD_PARAMS",
+    "RATIO_SPREAD_PARAMS",
+]
 
 # Strategy Parameters for Premium Selling (Short Strangle)
-PREMIUM_SELLING_CONFIG: Dict[str, Any] = {
+PREMIUM_SELLING_CONFIG: Mapping[str, Any] = MappingProxyType({
     # Entry signal: IV Rank threshold (0-100)
     # Only enter when IV Rank > this value (high implied volatility)
     "iv_rank_entry_threshold": 70,
@@ -46,10 +69,10 @@ PREMIUM_SELLING_CONFIG: Dict[str, Any] = {
         "BANKNIFTY": 15,
         "SENSEX": 10,
     },
-}
+})
 
 # Backtesting Parameters
-BACKTEST_CONFIG: Dict[str, Any] = {
+BACKTEST_CONFIG: Mapping[str, Any] = MappingProxyType({
     # Initial capital in INR (10 Lakhs)
     "initial_capital": 1_000_000,
     
@@ -86,10 +109,10 @@ BACKTEST_CONFIG: Dict[str, Any] = {
     
     # Commission structure type ('flat', 'percentage', 'tiered')
     "commission_type": "flat",
-}
+})
 
 # Risk Management Parameters
-RISK_CONFIG: Dict[str, Any] = {
+RISK_CONFIG: Mapping[str, Any] = MappingProxyType({
     # Maximum position size as percentage of capital
     "max_position_size_pct": 0.02,
     
@@ -114,10 +137,10 @@ RISK_CONFIG: Dict[str, Any] = {
     
     # Minimum capital buffer to keep (not for trading)
     "capital_buffer_pct": 0.20,
-}
+})
 
 # Data Configuration
-DATA_CONFIG: Dict[str, Any] = {
+DATA_CONFIG: Mapping[str, Any] = MappingProxyType({
     # Default lookback period for IV Rank calculation (days)
     "iv_rank_lookback_30d": 30,
     "iv_rank_lookback_252d": 252,
@@ -130,10 +153,10 @@ DATA_CONFIG: Dict[str, Any] = {
     
     # Minimum data points required for calculations
     "min_data_points": 30,
-}
+})
 
 # Instrument Configuration
-INSTRUMENT_CONFIG: Dict[str, Dict[str, Any]] = {
+INSTRUMENT_CONFIG: Mapping[str, Dict[str, Any]] = MappingProxyType({
     "NIFTY": {
         "lot_size": 50,
         "strike_interval": 50,
@@ -152,10 +175,10 @@ INSTRUMENT_CONFIG: Dict[str, Dict[str, Any]] = {
         "symbol": "SENSEX",
         "exchange": "BSE",
     },
-}
+})
 
 # Iron Condor Strategy Configuration
-IRON_CONDOR_CONFIG: Dict[str, Any] = {
+IRON_CONDOR_CONFIG: Mapping[str, Any] = MappingProxyType({
     # Entry signal: IV Rank threshold (0-100)
     # Only enter when IV Rank > this value (moderate to high IV)
     "iv_rank_entry_threshold": 50,
@@ -193,10 +216,10 @@ IRON_CONDOR_CONFIG: Dict[str, Any] = {
     
     # Maximum concurrent positions
     "max_positions": 3,
-}
+})
 
 # Calendar Spread Strategy Configuration
-CALENDAR_SPREAD_CONFIG: Dict[str, Any] = {
+CALENDAR_SPREAD_CONFIG: Mapping[str, Any] = MappingProxyType({
     # Entry signal: IV Rank threshold (0-100)
     # Enter when IV Rank < this value (low IV - expecting IV expansion)
     "iv_rank_entry_threshold": 30,
@@ -234,10 +257,10 @@ CALENDAR_SPREAD_CONFIG: Dict[str, Any] = {
     
     # Maximum concurrent positions
     "max_positions": 3,
-}
+})
 
 # Ratio Spread Strategy Configuration
-RATIO_SPREAD_CONFIG: Dict[str, Any] = {
+RATIO_SPREAD_CONFIG: Mapping[str, Any] = MappingProxyType({
     # Entry signal: IV Rank threshold (0-100)
     # Only enter when IV Rank > this value (high IV for selling extra options)
     "iv_rank_entry_threshold": 60,
@@ -278,4 +301,93 @@ RATIO_SPREAD_CONFIG: Dict[str, Any] = {
     
     # Maximum concurrent positions
     "max_positions": 2,
-}
+})
+
+
+@dataclass(frozen=True, slots=True)
+class StrategyParams:
+    """
+    Flattened range and ratio parameters from a strategy config.
+    
+    Tuple-valued settings such as ``delta_range`` are split into scalar
+    fields so strike/expiry selection loops can read them as attributes.
+    Fields that do not apply to a strategy keep their defaults.
+    """
+    delta_low: float = 0.0
+    delta_high: float = 1.0
+    min_days_to_expiry: int = 0
+    max_days_to_expiry: int = 365
+    ratio_long: int = 1
+    ratio_short: int = 1
+    near_expiry_min_days: int = 0
+    near_expiry_max_days: int = 0
+    far_expiry_min_days: int = 0
+    far_expiry_max_days: int = 0
+    
+    @classmethod
+    def from_config(cls, config: Mapping[str, Any]) -> "StrategyParams":
+        """
+        Build parameters from a strategy configuration.
+        
+        Args:
+            config: Strategy configuration (e.g. IRON_CONDOR_CONFIG)
+        
+        Returns:
+            StrategyParams instance
+        """
+        delta_low, delta_high = config.get(
+            "delta_range", config.get("short_delta_range", (0.0, 1.0))
+        )
+        ratio_long, ratio_short = config.get("ratio", (1, 1))
+        near_min, near_max = config.get("near_expiry_days_range", (0, 0))
+        far_min, far_max = config.get("far_expiry_days_range", (0, 0))
+        
+        return cls(
+            delta_low=delta_low,
+            delta_high=delta_high,
+            min_days_to_expiry=config.get("min_days_to_expiry", 0),
+            max_days_to_expiry=config.get("max_days_to_expiry", 365),
+            ratio_long=ratio_long,
+            ratio_short=ratio_short,
+            near_expiry_min_days=near_min,
+            near_expiry_max_days=near_max,
+            far_expiry_min_days=far_min,
+            far_expiry_max_days=far_max,
+        )
+
+
+PREMIUM_SELLING_PARAMS = StrategyParams.from_config(PREMIUM_SELLING_CONFIG)
+IRON_CONDOR_PARAMS = StrategyParams.from_config(IRON_CONDOR_CONFIG)
+CALENDAR_SPREAD_PARAMS = StrategyParams.from_config(CALENDAR_SPREAD_CONFIG)
+RATIO_SPREAD_PARAMS = StrategyParams.from_config(RATIO_SPREAD_CONFIG)
+
+# Strategy configurations keyed by strategy name (read-only views)
+STRATEGY_CONFIGS: Mapping[str, Mapping[str, Any]] = MappingProxyType({
+    "premium_selling": PREMIUM_SELLING_CONFIG,
+    "iron_condor": IRON_CONDOR_CONFIG,
+    "calendar_spread": CALENDAR_SPREAD_CONFIG,
+    "ratio_spread": RATIO_SPREAD_CONFIG,
+})
+
+
+def get_strategy_config(name: str) -> Mapping[str, Any]:
+    """
+    Get the configuration for a strategy.
+    
+    Args:
+        name: Strategy name (premium_selling, iron_condor,
+              calendar_spread, ratio_spread)
+    
+    Returns:
+        Read-only strategy configuration mapping
+    
+    Raises:
+        ValueError: If strategy name is unknown.
+    """
+    config = STRATEGY_CONFIGS.get(name)
+    if config is None:
+        raise ValueError(
+            f"Unknown strategy: {name}. "
+            f"Valid strategies: {list(STRATEGY_CONFIGS)}"
+        )
+    return config
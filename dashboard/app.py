@@ -20,29 +20,22 @@ Author: Algo Trading System
 Version: 1.0.0
 """
 
+import inspect
 import streamlit as st
 import sys
+from functools import lru_cache
 from pathlib import Path
 from datetime import datetime
 
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-# Import dashboard modules
+# Import dashboard modules needed for the first paint. Chart and table
+# components (plotly, pandas styling) are imported inside the tab
+# renderers that use them.
 from dashboard.utils.data_handler import DashboardDataHandler
 from dashboard.utils.theme import ThemeManager, get_custom_css
-from dashboard.utils.export import ExportManager
 from dashboard.components.sidebar import render_sidebar
-from dashboard.components.charts import (
-    render_pnl_chart,
-    render_drawdown_chart,
-    render_equity_curve,
-    render_greeks_chart,
-)
-from dashboard.components.tables import (
-    render_position_table,
-    render_order_log,
-)
 from dashboard.components.metrics import (
     render_risk_metrics,
     render_market_data,
@@ -51,7 +44,7 @@ from dashboard.components.metrics import (
     format_compact_number,
 )
 from dashboard.components.alerts import (
-    AlertManager,
+    get_alert_manager,
     AlertType,
     AlertCategory,
     render_alerts,
@@ -71,54 +64,168 @@ st.set_page_config(
     }
 )
 
+# Layout constants, built once rather than on every rerun
+_HEADER_COL_RATIO = (3, 2, 2, 1)
+_TOP_ROW_RATIO = (2, 3)
+_TAB_TITLES = ("P&L", "Positions", "Risk", "Orders", "Alerts")
+_FOOTER_HTML = (
+    "<div style='text-align: center; color: #888; font-size: 0.75rem;'>"
+    "⚠️ This dashboard is for EDUCATIONAL purposes only. "
+    "Always paper trade first. Trading involves significant risk of loss. "
+    "</div>"
+)
+
+
+@lru_cache(maxsize=1024)
+def _format_number(value: float, spec: str) -> str:
+    """Format a metric value; cached since values rarely change between reruns."""
+    return format(value, spec)
+
+
 # Initialize session state
 def init_session_state():
     """Initialize session state variables."""
     if "initialized" not in st.session_state:
         st.session_state.initialized = True
-        st.session_state.data_handler = DashboardDataHandler(initial_capital=1_000_000)
-        st.session_state.alert_manager = AlertManager()
         st.session_state.selected_underlying = "NIFTY"
         st.session_state.auto_refresh = True
         st.session_state.refresh_interval = 30
-        
-        # Generate sample alerts for demo
-        generate_sample_alerts(st.session_state.alert_manager)
+
+
+def _get_data_handler() -> DashboardDataHandler:
+    """Get the session's data handler, creating it on first use."""
+    if "data_handler" not in st.session_state:
+        st.session_state.data_handler = DashboardDataHandler(initial_capital=1_000_000)
+    return st.session_state.data_handler
+
+
+_CSS_FILE = Path(__file__).parent / "styles" / "custom.css"
+
+
+@st.cache_data(show_spinner=False)
+def _compiled_css(theme: str, mtime: float) -> str:
+    """
+    Build the theme CSS plus the external stylesheet.
+    
+    Keyed on theme and the stylesheet's mtime, so the file is only
+    re-read when it changes.
+    """
+    css = get_custom_css(theme)
+    if mtime:
+        css += f"<style>{_CSS_FILE.read_text()}</style>"
+    return css
 
 
 def load_css():
     """Load custom CSS styles."""
-    css = get_custom_css()
-    st.markdown(css, unsafe_allow_html=True)
-    
-    # Load external CSS file
-    css_file = Path(__file__).parent / "styles" / "custom.css"
-    if css_file.exists():
-        with open(css_file) as f:
-            st.markdown(f"<style>{f.read()}</style>", unsafe_allow_html=True)
+    mtime = _CSS_FILE.stat().st_mtime if _CSS_FILE.exists() else 0.0
+    theme = ThemeManager.get_current_theme()
+    st.markdown(_compiled_css(theme, mtime), unsafe_allow_html=True)
+
+
+def _run_cached(run_cache, key, factory):
+    """
+    Return factory() computed at most once per run_cache.
+    
+    main() creates a fresh dict for every script run and _live gives
+    fragment-only reruns their own, so each run sees fresh data while
+    the sections within one run share a single query.
+    """
+    if key not in run_cache:
+        run_cache[key] = factory()
+    return run_cache[key]
+
+
+def _get_market_data(data_handler, run_cache, underlying):
+    """Get market data for an underlying, once per run."""
+    return _run_cached(
+        run_cache,
+        ("market_data", underlying),
+        lambda: data_handler.get_market_data(underlying),
+    )
+
+
+def _get_risk_metrics(data_handler, run_cache):
+    """Get risk metrics, once per run."""
+    return _run_cached(run_cache, "risk_metrics", data_handler.get_risk_metrics)
+
+
+def _get_positions(data_handler, run_cache):
+    """Get open positions, once per run."""
+    return _run_cached(run_cache, "positions", data_handler.get_positions)
+
+
+def _live(render_func):
+    """
+    Wrap a renderer in a fragment that reruns every refresh interval.
+    
+    With auto-refresh off the fragment only reruns on interaction.
+    The fragment is called with the run's id and cache; a call that
+    sees the id it saw last time is a fragment-only rerun, which gets
+    an empty cache so it never serves data from an earlier run.
+    """
+    interval = st.session_state.refresh_interval if st.session_state.auto_refresh else None
+    name = render_func.__name__
+    
+    def run(data_handler, run_cache, run_id):
+        seen = st.session_state.setdefault("fragment_run_ids", {})
+        fragment_rerun = seen.get(name) == run_id
+        seen[name] = run_id
+        st.session_state.fragment_rerun = fragment_rerun
+        render_func(data_handler, {} if fragment_rerun else run_cache)
+    
+    run.__name__ = run.__qualname__ = name
+    return st.fragment(run, run_every=interval)
+
+
+# Whether this Streamlit release's st.tabs can report the selected tab
+_TABS_TRACK_STATE = {"key", "on_change"} <= inspect.signature(st.tabs).parameters.keys()
+
+
+def _lazy_tabs(titles):
+    """
+    Create the main tabs so that only the selected one is rendered.
+    
+    Switching tabs reruns the app, and hidden tabs skip their renderers,
+    so their charts, tables and live fragments are not built at all.
+    Streamlit releases without state-tracking tabs render every tab.
+    """
+    if _TABS_TRACK_STATE:
+        return st.tabs(titles, key="main_tabs", on_change="rerun")
+    return st.tabs(titles)
+
+
+def _tab_open(tab):
+    """Return whether a tab's content should run; untracked tabs always do."""
+    return getattr(tab, "open", None) is not False
 
 
 def main():
     """Main application entry point."""
     # Initialize
     init_session_state()
+    run_id = st.session_state.run_id = st.session_state.get("run_id", 0) + 1
+    run_cache = {}
     load_css()
     
-    # Get data handler and alert manager from session state
-    data_handler = st.session_state.data_handler
-    alert_manager = st.session_state.alert_manager
+    # Data handler is needed for the first paint; the alert manager is
+    # created when the first alert is raised or the alerts tab renders
+    data_handler = _get_data_handler()
     
     # Render sidebar
-    sidebar_state = render_sidebar(data_handler)
+    render_sidebar(data_handler)
     
     # Main content area
     st.title("📈 Algo Trading Dashboard")
     
     # Auto-refresh toggle in header
-    col1, col2, col3, col4 = st.columns([3, 2, 2, 1])
+    col1, col2, col3, col4 = st.columns(_HEADER_COL_RATIO)
     
     with col1:
-        st.caption(f"Last updated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+        if st.session_state.auto_refresh:
+            st.caption(f"Live data refreshes every {st.session_state.refresh_interval}s")
+        else:
+            st.caption("Auto-refresh paused")
     
     with col2:
         auto_refresh = st.checkbox(
@@ -139,82 +246,84 @@ def main():
         st.session_state.selected_underlying = underlying
     
     with col4:
-        if st.button("🔄 Refresh", key="manual_refresh"):
-            st.rerun()
-    
-    # Auto-refresh using streamlit-autorefresh
-    if st.session_state.auto_refresh:
-        try:
-            from streamlit_autorefresh import st_autorefresh
-            st_autorefresh(interval=st.session_state.refresh_interval * 1000, key="datarefresh")
-        except ImportError:
-            st.warning("Auto-refresh requires streamlit-autorefresh package")
+        # The click itself triggers a full rerun, which refetches all data;
+        # calling st.rerun() here would run the whole script a second time
+        st.button("🔄 Refresh", key="manual_refresh")
     
     st.markdown("---")
     
-    # Market data section
-    market_data = data_handler.get_market_data(st.session_state.selected_underlying)
-    
-    # Top row - Key metrics and market data
-    col1, col2 = st.columns([2, 3])
-    
-    with col1:
-        render_market_data(market_data, st.session_state.selected_underlying)
-    
-    with col2:
-        risk_metrics = data_handler.get_risk_metrics()
-        render_capital_metrics(
-            initial_capital=data_handler.initial_capital,
-            current_capital=data_handler.current_capital,
-            margin_used=risk_metrics.margin_used,
-        )
+    # Live sections rerun on their own timer (see _live); the sidebar,
+    # header, CSS and tab frames are only rebuilt on a full rerun.
+    _live(render_live_tiles)(data_handler, run_cache, run_id)
     
     st.markdown("---")
     
-    # Main content tabs
-    tab1, tab2, tab3, tab4, tab5 = st.tabs([
-        "P&L",
-        "Positions",
-        "Risk",
-        "Orders",
-        "Alerts"
-    ])
+    # Main content tabs; hidden tabs skip their renderers (see _lazy_tabs)
+    tab1, tab2, tab3, tab4, tab5 = _lazy_tabs(_TAB_TITLES)
     
     with tab1:
-        render_pnl_tab(data_handler)
+        if _tab_open(tab1):
+            _live(render_pnl_tab)(data_handler, run_cache, run_id)
     
     with tab2:
-        render_positions_tab(data_handler)
+        if _tab_open(tab2):
+            _live(render_positions_tab)(data_handler, run_cache, run_id)
     
     with tab3:
-        render_risk_tab(data_handler)
+        if _tab_open(tab3):
+            _live(render_risk_tab)(data_handler, run_cache, run_id)
     
     with tab4:
-        render_order_tab(data_handler)
+        if _tab_open(tab4):
+            render_order_tab(data_handler, run_cache)
     
     with tab5:
-        render_alerts_tab(alert_manager)
+        if _tab_open(tab5):
+            render_alerts_tab(get_alert_manager())
     
     st.markdown("---")
     
     # Bottom section - Order Log
+    from dashboard.components.tables import render_order_log
+    
     st.markdown("### 📜 Recent Orders")
     orders = data_handler.get_order_history()
     render_order_log(orders, max_rows=10, show_filters=False)
     
     # Footer
     st.markdown("---")
-    st.markdown(
-        "<div style='text-align: center; color: #888; font-size: 0.75rem;'>"
-        "⚠️ This dashboard is for EDUCATIONAL purposes only. "
-        "Always paper trade first. Trading involves significant risk of loss. "
-        "</div>",
-        unsafe_allow_html=True
-    )
+    st.html(_FOOTER_HTML)
+
+
+def render_live_tiles(data_handler, run_cache):
+    """Render the last-updated time, market data and capital metrics."""
+    st.caption(f"Last updated: {datetime.now().isoformat(sep=' ', timespec='seconds')}")
+    
+    market_data = _get_market_data(data_handler, run_cache, st.session_state.selected_underlying)
+    
+    # Top row - Key metrics and market data
+    col1, col2 = st.columns(_TOP_ROW_RATIO)
+    
+    with col1:
+        render_market_data(market_data, st.session_state.selected_underlying)
+    
+    with col2:
+        risk_metrics = _get_risk_metrics(data_handler, run_cache)
+        render_capital_metrics(
+            initial_capital=data_handler.initial_capital,
+            current_capital=data_handler.current_capital,
+            margin_used=risk_metrics.margin_used,
+        )
 
 
-def render_pnl_tab(data_handler):
+def render_pnl_tab(data_handler, run_cache):
     """Render P&L and charts tab."""
+    from dashboard.components.charts import (
+        render_pnl_chart,
+        render_drawdown_chart,
+        render_equity_curve,
+    )
+    
     st.markdown("### 💰 Profit & Loss")
     
     # P&L Chart
@@ -234,19 +343,25 @@ def render_pnl_tab(data_handler):
         render_equity_curve(equity_data, height=250)
 
 
-def render_positions_tab(data_handler):
+def render_positions_tab(data_handler, run_cache):
     """Render positions tab."""
-    positions = data_handler.get_positions()
+    from dashboard.components.charts import render_greeks_chart
+    from dashboard.components.tables import render_position_table
+    
+    positions = _get_positions(data_handler, run_cache)
     
     # Position callback for closing
     def on_close_position(symbol):
         result = data_handler.close_position(symbol)
         if result:
-            st.session_state.alert_manager.add_order_alert(
+            get_alert_manager().add_order_alert(
                 f"Position closed: {symbol}",
                 AlertType.SUCCESS
             )
-            st.rerun()
+            # During a fragment rerun only the positions fragment needs to
+            # redraw; the other live sections pick up the change on their
+            # next refresh
+            st.rerun(scope="fragment" if st.session_state.fragment_rerun else "app")
     
     render_position_table(positions, on_close_position=on_close_position)
     
@@ -262,24 +377,21 @@ def render_positions_tab(data_handler):
     with col2:
         # Greeks summary
         if positions:
-            total_delta = sum(p.delta * p.quantity for p in positions)
-            total_gamma = sum(p.gamma * p.quantity for p in positions)
-            total_theta = sum(p.theta * p.quantity for p in positions)
-            total_vega = sum(p.vega * p.quantity for p in positions)
+            total_delta, total_gamma, total_theta, total_vega = data_handler.get_greek_totals()
             
             st.markdown("#### Net Greeks")
             col_a, col_b = st.columns(2)
             with col_a:
-                st.metric("Delta", f"{total_delta:,.4f}")
-                st.metric("Gamma", f"{total_gamma:,.6f}")
+                st.metric("Delta", _format_number(total_delta, ",.4f"))
+                st.metric("Gamma", _format_number(total_gamma, ",.6f"))
             with col_b:
                 st.metric("Theta/day", format_compact_number(total_theta))
-                st.metric("Vega", f"{total_vega:,.2f}")
+                st.metric("Vega", _format_number(total_vega, ",.2f"))
 
 
-def render_risk_tab(data_handler):
+def render_risk_tab(data_handler, run_cache):
     """Render risk metrics tab."""
-    risk_metrics = data_handler.get_risk_metrics()
+    risk_metrics = _get_risk_metrics(data_handler, run_cache)
     render_risk_metrics(risk_metrics)
     
     st.markdown("---")
@@ -291,7 +403,7 @@ def render_risk_tab(data_handler):
     
     with col1:
         st.markdown("**Positions**")
-        positions = data_handler.get_positions()
+        positions = _get_positions(data_handler, run_cache)
         max_positions = 5
         st.progress(len(positions) / max_positions)
         st.caption(f"{len(positions)}/{max_positions}")
@@ -333,17 +445,17 @@ def render_risk_tab(data_handler):
     if not warnings:
         st.success("✅ All risk metrics within acceptable limits")
     else:
-        for icon, message in warnings:
-            st.warning(f"{icon} {message}")
+        # One warning element for all messages (markdown line breaks)
+        st.warning("  \n".join(f"{icon} {message}" for icon, message in warnings))
 
 
-def render_order_tab(data_handler):
+def render_order_tab(data_handler, run_cache):
     """Render order entry tab."""
     col1, col2 = st.columns([2, 1])
     
     with col1:
         def on_order_submit(order):
-            st.session_state.alert_manager.add_order_alert(
+            get_alert_manager().add_order_alert(
                 f"Order submitted: {order.get('side', '')} {order.get('symbol', '')} @ ₹{order.get('price', 0):.2f}",
                 AlertType.SUCCESS
             )
@@ -361,7 +473,7 @@ def render_order_tab(data_handler):
         st.markdown(f"**Strategy Status:** {status_icon} {status.title()}")
         st.markdown(f"**IV Rank Threshold:** {strategy['parameters'].get('iv_rank_threshold', 70)}")
         
-        market_data = data_handler.get_market_data(st.session_state.selected_underlying)
+        market_data = _get_market_data(data_handler, run_cache, st.session_state.selected_underlying)
         current_iv_rank = market_data.iv_rank
         
         if current_iv_rank >= strategy['parameters'].get('iv_rank_threshold', 70):
@@ -370,8 +482,8 @@ def render_order_tab(data_handler):
             st.info(f"ℹ️ IV Rank ({current_iv_rank:.0f}) below threshold")
         
         # Position summary
-        positions = data_handler.get_positions()
-        total_pnl = sum(p.unrealized_pnl for p in positions)
+        positions = _get_positions(data_handler, run_cache)
+        total_pnl = data_handler.get_unrealized_pnl_total()
         
         st.markdown("---")
         st.markdown("### 📋 Position Summary")
@@ -381,6 +493,11 @@ def render_order_tab(data_handler):
 
 def render_alerts_tab(alert_manager):
     """Render alerts tab."""
+    # Seed demo alerts once, off the first-paint path
+    if not st.session_state.get("alerts_seeded"):
+        st.session_state.alerts_seeded = True
+        generate_sample_alerts(alert_manager)
+    
     render_alerts(alert_manager, max_display=20, show_filters=True)
     
     st.markdown("---")
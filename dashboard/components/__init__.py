@@ -7,22 +7,36 @@ Contains reusable UI components for the trading dashboard:
 - tables: Position tables, order log
 - metrics: Risk metrics, market data display
 - alerts: Alert system and notifications
+
+Submodules are imported on first attribute access so that importing one
+component (e.g. the sidebar) does not pull in plotly via charts.
 """
 
-from .sidebar import render_sidebar
-from .charts import render_pnl_chart, render_drawdown_chart
-from .tables import render_position_table, render_order_log
-from .metrics import render_risk_metrics, render_market_data
-from .alerts import render_alerts, AlertManager
+import importlib
+
+# Exported name -> submodule that defines it
+_EXPORTS = {
+    "render_sidebar": "sidebar",
+    "render_pnl_chart": "charts",
+    "render_drawdown_chart": "charts",
+    "render_position_table": "tables",
+    "render_order_log": "tables",
+    "render_risk_metrics": "metrics",
+    "render_market_data": "metrics",
+    "render_alerts": "alerts",
+    "AlertManager": "alerts",
+    "get_alert_manager": "alerts",
+}
+
+__all__ = list(_EXPORTS)
+
 
-__all__ = [
-    "render_sidebar",
-    "render_pnl_chart",
-    "render_drawdown_chart",
-    "render_position_table",
-    "render_order_log",
-    "render_risk_metrics",
-    "render_market_data",
-    "render_alerts",
-    "AlertManager",
-]
+def __getattr__(name: str):
+    """Import the defining submodule on first access (PEP 562)."""
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(f".{module_name}", __name__)
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
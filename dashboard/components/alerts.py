@@ -8,8 +8,10 @@ Provides alert and notification components for the trading dashboard including:
 """
 
 import streamlit as st
-from typing import List, Dict, Any, Optional
+from typing import Deque, List, Dict, Any, Optional
+from collections import deque
 from datetime import datetime
+from itertools import islice
 from dataclasses import dataclass, field
 from enum import Enum
 
@@ -31,7 +33,105 @@ class AlertCategory(Enum):
     MARKET = "market"
 
 
-@dataclass
+# Styling per alert type
+_TYPE_CONFIG = {
+    AlertType.INFO: {"icon": "ℹ️", "color": "#2196f3"},
+    AlertType.SUCCESS: {"icon": "✅", "color": "#00c853"},
+    AlertType.WARNING: {"icon": "⚠️", "color": "#ffc107"},
+    AlertType.DANGER: {"icon": "🚨", "color": "#ff5252"},
+}
+
+# Category filter options and the category behind each title ("All" maps
+# to no filter)
+_CATEGORY_OPTIONS = ("All",) + tuple(c.value.title() for c in AlertCategory)
+_TITLE_TO_CATEGORY = {c.value.title(): c for c in AlertCategory}
+
+# Streamlit status element per alert type for toasts
+_TOAST_RENDERERS = {
+    AlertType.INFO: st.info,
+    AlertType.SUCCESS: st.success,
+    AlertType.WARNING: st.warning,
+    AlertType.DANGER: st.error,
+}
+
+# Category icons
+_CATEGORY_ICONS = {
+    AlertCategory.STRATEGY: "📈",
+    AlertCategory.RISK: "⚠️",
+    AlertCategory.ORDER: "📝",
+    AlertCategory.SYSTEM: "⚙️",
+    AlertCategory.MARKET: "📊",
+}
+
+# Single alert markup; fields are color, opacity, type icon, category
+# icon, message, time and index
+_ALERT_HTML = """
+        <div data-alert-index="{6}" style="
+            padding: 0.75rem;
+            margin-bottom: 0.5rem;
+            border-left: 4px solid {0};
+            background-color: {0}20;
+            border-radius: 0.25rem;
+            opacity: {1};
+        ">
+            <div style="display: flex; justify-content: space-between; align-items: center;">
+                <span style="font-weight: bold;">
+                    {2} {3} {4}
+                </span>
+                <span style="font-size: 0.75rem; color: #888;">
+                    {5}
+                </span>
+            </div>
+        </div>
+        """
+
+
+# Demo alerts for generate_sample_alerts as (message, type, category)
+_SAMPLE_ALERTS = (
+    (
+        "IV Rank above 70% for NIFTY - Entry conditions met",
+        AlertType.INFO,
+        AlertCategory.STRATEGY,
+    ),
+    (
+        "Order filled: SELL 2 lots NIFTY 19500CE @ ₹125.50",
+        AlertType.SUCCESS,
+        AlertCategory.ORDER,
+    ),
+    (
+        "Margin utilization at 75% - approaching limit",
+        AlertType.WARNING,
+        AlertCategory.RISK,
+    ),
+    (
+        "Position profit target reached: NIFTY Strangle +50%",
+        AlertType.SUCCESS,
+        AlertCategory.STRATEGY,
+    ),
+    (
+        "VIX spike detected - review positions",
+        AlertType.WARNING,
+        AlertCategory.MARKET,
+    ),
+    (
+        "Daily loss limit warning - 80% of limit reached",
+        AlertType.DANGER,
+        AlertCategory.RISK,
+    ),
+    (
+        "Auto-refresh enabled - updating every 30 seconds",
+        AlertType.INFO,
+        AlertCategory.SYSTEM,
+    ),
+    (
+        "BANKNIFTY expiry day - increased gamma risk",
+        AlertType.WARNING,
+        AlertCategory.RISK,
+    ),
+)
+
+
+@dataclass(slots=True, eq=False)
 class Alert:
     """
     Data class representing an alert.
@@ -50,6 +150,14 @@ class Alert:
     timestamp: datetime = field(default_factory=datetime.now)
     is_read: bool = False
     metadata: Dict[str, Any] = field(default_factory=dict)
+    _time_str: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    
+    @property
+    def time_str(self) -> str:
+        """Alert time as HH:MM:SS, formatted on first use."""
+        if self._time_str is None:
+            self._time_str = self.timestamp.strftime("%H:%M:%S")
+        return self._time_str
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert alert to dictionary."""
@@ -67,7 +175,8 @@ class AlertManager:
     """
     Manages alerts and notifications for the trading dashboard.
     
-    Uses Streamlit session state to persist alerts across reruns.
+    Uses Streamlit session state to persist alerts across reruns; the
+    session's alert state is created on first access, not in __init__.
     
     Attributes:
         max_alerts: Maximum number of alerts to keep in history
@@ -81,14 +190,23 @@ class AlertManager:
             max_alerts: Maximum number of alerts to store
         """
         self.max_alerts = max_alerts
-        self._initialize_session_state()
     
     def _initialize_session_state(self) -> None:
         """Initialize session state for alerts."""
         if "alerts" not in st.session_state:
-            st.session_state.alerts = []
-        if "alert_sound_enabled" not in st.session_state:
-            st.session_state.alert_sound_enabled = True
+            st.session_state.alerts = deque(maxlen=self.max_alerts)
+            st.session_state.alerts_by_category = {c: deque() for c in AlertCategory}
+            st.session_state.unread_count = 0
+        st.session_state.setdefault("alert_sound_enabled", True)
+    
+    @property
+    def _alerts(self) -> Deque[Alert]:
+        """Alert history of the current session, created on first access."""
+        alerts = st.session_state.get("alerts")
+        if alerts is None:
+            self._initialize_session_state()
+            alerts = st.session_state.alerts
+        return alerts
     
     def add_alert(
         self,
@@ -117,11 +235,24 @@ class AlertManager:
             metadata=metadata or {},
         )
         
-        st.session_state.alerts.insert(0, alert)
+        alerts = self._alerts
+        by_category = st.session_state.alerts_by_category
+        unread = st.session_state.unread_count + 1
+        
+        # The bounded deque drops the oldest alert once full; it is also
+        # the oldest alert of its category
+        if len(alerts) == alerts.maxlen:
+            if not alerts:
+                # max_alerts=0 keeps no history
+                return alert
+            dropped = alerts[-1]
+            by_category[dropped.category].pop()
+            if not dropped.is_read:
+                unread -= 1
         
-        # Trim to max alerts
-        if len(st.session_state.alerts) > self.max_alerts:
-            st.session_state.alerts = st.session_state.alerts[:self.max_alerts]
+        alerts.appendleft(alert)
+        by_category[category].appendleft(alert)
+        st.session_state.unread_count = unread
         
         return alert
     
@@ -162,40 +293,58 @@ class AlertManager:
         Returns:
             List of Alert objects
         """
-        alerts = st.session_state.alerts
+        alerts = self._alerts
         
         if category:
-            alerts = [a for a in alerts if a.category == category]
+            alerts = st.session_state.alerts_by_category[category]
         
         if unread_only:
-            alerts = [a for a in alerts if not a.is_read]
+            alerts = (a for a in alerts if not a.is_read)
         
-        return alerts[:limit]
+        return list(islice(alerts, limit))
     
     def get_unread_count(self) -> int:
         """Get count of unread alerts."""
-        return len([a for a in st.session_state.alerts if not a.is_read])
+        return st.session_state.get("unread_count", 0)
     
     def mark_as_read(self, index: int) -> None:
         """Mark an alert as read by index."""
-        if 0 <= index < len(st.session_state.alerts):
-            st.session_state.alerts[index].is_read = True
+        alerts = self._alerts
+        if 0 <= index < len(alerts) and not alerts[index].is_read:
+            alerts[index].is_read = True
+            st.session_state.unread_count -= 1
     
     def mark_all_as_read(self) -> None:
         """Mark all alerts as read."""
-        for alert in st.session_state.alerts:
+        for alert in self._alerts:
             alert.is_read = True
+        st.session_state.unread_count = 0
     
     def clear_alerts(self) -> None:
         """Clear all alerts."""
-        st.session_state.alerts = []
+        self._alerts.clear()
+        for category_alerts in st.session_state.alerts_by_category.values():
+            category_alerts.clear()
+        st.session_state.unread_count = 0
     
     def toggle_sound(self) -> bool:
         """Toggle alert sounds and return new state."""
-        st.session_state.alert_sound_enabled = not st.session_state.alert_sound_enabled
+        st.session_state.alert_sound_enabled = not st.session_state.get("alert_sound_enabled", True)
         return st.session_state.alert_sound_enabled
 
 
+def get_alert_manager() -> AlertManager:
+    """
+    Get the session's AlertManager, creating it on first use.
+    
+    Returns:
+        AlertManager instance stored in session state
+    """
+    if "alert_manager" not in st.session_state:
+        st.session_state.alert_manager = AlertManager()
+    return st.session_state.alert_manager
+
+
 def render_alerts(
     alert_manager: AlertManager,
     max_display: int = 10,
@@ -209,44 +358,52 @@ def render_alerts(
         max_display: Maximum alerts to display
         show_filters: Whether to show filter controls
     """
+    _alerts_fragment(alert_manager, max_display, show_filters)
+
+
+@st.fragment
+def _alerts_fragment(
+    alert_manager: AlertManager,
+    max_display: int,
+    show_filters: bool,
+) -> None:
+    """Render the alerts panel; its widgets rerun only this fragment."""
     st.markdown("### 🔔 Alerts & Notifications")
     
-    # Controls row
+    # Nothing to count, filter or clear yet. The lookup also sets up this
+    # session's alert state, so the keys below can be read directly.
+    if not alert_manager.get_alerts(limit=1):
+        st.info("No alerts to display")
+        return
+    
+    # Controls row; button actions run as callbacks so the counts below
+    # are already up to date when the fragment reruns
     col1, col2, col3, col4 = st.columns([2, 2, 1, 1])
     
     with col1:
-        unread = alert_manager.get_unread_count()
+        unread = st.session_state.unread_count
         st.markdown(f"**{unread}** unread alerts")
     
     with col2:
-        sound_icon = "🔊" if st.session_state.get("alert_sound_enabled", True) else "🔇"
-        if st.button(f"{sound_icon} Sound", key="toggle_sound"):
-            alert_manager.toggle_sound()
+        sound_icon = "🔊" if st.session_state.alert_sound_enabled else "🔇"
+        st.button(f"{sound_icon} Sound", key="toggle_sound", on_click=alert_manager.toggle_sound)
     
     with col3:
-        if st.button("✓ Read All", key="mark_all_read"):
-            alert_manager.mark_all_as_read()
-            st.rerun()
+        st.button("✓ Read All", key="mark_all_read", on_click=alert_manager.mark_all_as_read)
     
     with col4:
-        if st.button("🗑️ Clear", key="clear_alerts"):
-            alert_manager.clear_alerts()
-            st.rerun()
+        st.button("🗑️ Clear", key="clear_alerts", on_click=alert_manager.clear_alerts)
     
     # Category filter
     if show_filters:
-        category_options = ["All"] + [c.value.title() for c in AlertCategory]
         selected_category = st.selectbox(
             "Filter by category",
-            category_options,
+            _CATEGORY_OPTIONS,
             key="alert_category_filter",
             label_visibility="collapsed"
         )
         
-        if selected_category != "All":
-            category_filter = AlertCategory(selected_category.lower())
-        else:
-            category_filter = None
+        category_filter = _TITLE_TO_CATEGORY.get(selected_category)
     else:
         category_filter = None
     
@@ -257,68 +414,38 @@ def render_alerts(
         st.info("No alerts to display")
         return
     
-    # Display alerts
-    for i, alert in enumerate(alerts):
-        render_single_alert(alert, i)
+    # Display all alerts as one element
+    st.markdown(
+        "".join(_alert_html(alert, i) for i, alert in enumerate(alerts)),
+        unsafe_allow_html=True
+    )
 
 
-def render_single_alert(alert: Alert, index: int) -> None:
+def _alert_html(alert: Alert, index: int) -> str:
     """
-    Render a single alert item.
+    Build the HTML for a single alert item.
     
     Args:
         alert: Alert object to render
-        index: Alert index (for unique keys)
+        index: Alert index, stored as a data attribute
+    
+    Returns:
+        Alert HTML markup
     """
-    # Determine styling based on alert type
-    type_config = {
-        AlertType.INFO: {"icon": "ℹ️", "color": "#2196f3"},
-        AlertType.SUCCESS: {"icon": "✅", "color": "#00c853"},
-        AlertType.WARNING: {"icon": "⚠️", "color": "#ffc107"},
-        AlertType.DANGER: {"icon": "🚨", "color": "#ff5252"},
-    }
-    
-    config = type_config.get(alert.alert_type, type_config[AlertType.INFO])
-    
-    # Category icons
-    category_icons = {
-        AlertCategory.STRATEGY: "📈",
-        AlertCategory.RISK: "⚠️",
-        AlertCategory.ORDER: "📝",
-        AlertCategory.SYSTEM: "⚙️",
-        AlertCategory.MARKET: "📊",
-    }
-    
-    category_icon = category_icons.get(alert.category, "📌")
-    
-    # Format timestamp
-    time_str = alert.timestamp.strftime("%H:%M:%S")
+    config = _TYPE_CONFIG.get(alert.alert_type, _TYPE_CONFIG[AlertType.INFO])
+    category_icon = _CATEGORY_ICONS.get(alert.category, "📌")
     
     # Opacity for read alerts
     opacity = "0.6" if alert.is_read else "1.0"
     
-    # Render alert
-    st.markdown(
-        f"""
-        <div style="
-            padding: 0.75rem;
-            margin-bottom: 0.5rem;
-            border-left: 4px solid {config['color']};
-            background-color: {config['color']}20;
-            border-radius: 0.25rem;
-            opacity: {opacity};
-        ">
-            <div style="display: flex; justify-content: space-between; align-items: center;">
-                <span style="font-weight: bold;">
-                    {config['icon']} {category_icon} {alert.message}
-                </span>
-                <span style="font-size: 0.75rem; color: #888;">
-                    {time_str}
-                </span>
-            </div>
-        </div>
-        """,
-        unsafe_allow_html=True
+    return _ALERT_HTML.format(
+        config["color"],
+        opacity,
+        config["icon"],
+        category_icon,
+        alert.message,
+        alert.time_str,
+        index,
     )
 
 
@@ -330,14 +457,7 @@ def render_alert_toast(message: str, alert_type: AlertType = AlertType.INFO) ->
         message: Toast message
         alert_type: Type of toast
     """
-    if alert_type == AlertType.SUCCESS:
-        st.success(message)
-    elif alert_type == AlertType.WARNING:
-        st.warning(message)
-    elif alert_type == AlertType.DANGER:
-        st.error(message)
-    else:
-        st.info(message)
+    _TOAST_RENDERERS.get(alert_type, st.info)(message)
 
 
 def generate_sample_alerts(alert_manager: AlertManager) -> None:
@@ -347,54 +467,11 @@ def generate_sample_alerts(alert_manager: AlertManager) -> None:
     Args:
         alert_manager: AlertManager instance
     """
-    sample_alerts = [
-        {
-            "message": "IV Rank above 70% for NIFTY - Entry conditions met",
-            "type": AlertType.INFO,
-            "category": AlertCategory.STRATEGY,
-        },
-        {
-            "message": "Order filled: SELL 2 lots NIFTY 19500CE @ ₹125.50",
-            "type": AlertType.SUCCESS,
-            "category": AlertCategory.ORDER,
-        },
-        {
-            "message": "Margin utilization at 75% - approaching limit",
-            "type": AlertType.WARNING,
-            "category": AlertCategory.RISK,
-        },
-        {
-            "message": "Position profit target reached: NIFTY Strangle +50%",
-            "type": AlertType.SUCCESS,
-            "category": AlertCategory.STRATEGY,
-        },
-        {
-            "message": "VIX spike detected - review positions",
-            "type": AlertType.WARNING,
-            "category": AlertCategory.MARKET,
-        },
-        {
-            "message": "Daily loss limit warning - 80% of limit reached",
-            "type": AlertType.DANGER,
-            "category": AlertCategory.RISK,
-        },
-        {
-            "message": "Auto-refresh enabled - updating every 30 seconds",
-            "type": AlertType.INFO,
-            "category": AlertCategory.SYSTEM,
-        },
-        {
-            "message": "BANKNIFTY expiry day - increased gamma risk",
-            "type": AlertType.WARNING,
-            "category": AlertCategory.RISK,
-        },
-    ]
-    
-    # Only add if alerts have not been initialized
-    if "alerts" not in st.session_state:
-        for alert_data in sample_alerts:
+    # Only add to an empty history
+    if not st.session_state.get("alerts"):
+        for message, alert_type, category in _SAMPLE_ALERTS:
             alert_manager.add_alert(
-                message=alert_data["message"],
-                alert_type=alert_data["type"],
-                category=alert_data["category"],
+                message=message,
+                alert_type=alert_type,
+                category=category,
             )
@@ -9,17 +9,133 @@ Provides chart components for the trading dashboard including:
 """
 
 import streamlit as st
+from functools import lru_cache
+from types import MappingProxyType
 import plotly.graph_objects as go
-import plotly.express as px
-from plotly.subplots import make_subplots
 import pandas as pd
 import numpy as np
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Tuple
 from datetime import datetime, timedelta
 
 from ..utils.theme import ThemeManager
 
 
+# Configuration constants
+CHART_TARGET_PX = 1200  # Approximate plot width; more points than this are sub-pixel
+MAX_TRACE_POINTS = 2 * CHART_TARGET_PX  # Longer traces keep a min and max per pixel column
+RANGESLIDER_MAX_POINTS = 2000  # The P&L range slider is only shown below this size
+
+
+# Axis layout matching ``make_subplots(specs=[[{"secondary_y": True}]])``
+_SECONDARY_Y_XAXIS = MappingProxyType({"anchor": "y", "domain": [0.0, 0.94]})
+_SECONDARY_YAXIS = MappingProxyType({"anchor": "x", "overlaying": "y", "side": "right"})
+
+
+def _base_layout(template: Any, height: int) -> Dict[str, Any]:
+    """
+    Layout keys shared by the time-series charts.
+    
+    Args:
+        template: Plotly template for the active theme
+        height: Chart height in pixels
+        
+    Returns:
+        Layout dictionary to extend per chart
+    """
+    return {
+        "template": template,
+        "height": height,
+        "margin": dict(l=10, r=10, t=30, b=10),
+        "legend": dict(
+            orientation="h",
+            yanchor="bottom",
+            y=1.02,
+            xanchor="right",
+            x=1
+        ),
+    }
+
+
+def _minmax_downsample(
+    x: Any,
+    y: Any,
+    max_points: int = MAX_TRACE_POINTS,
+    dtype: Any = np.float64,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Reduce a long series to the lowest and highest point per bucket.
+    
+    Keeps peaks and troughs (e.g. the worst drawdown or the largest daily
+    loss) visible while capping the points sent to the browser at about
+    two per pixel column. Works for line and bar traces alike. Series at
+    or below max_points are kept whole.
+    
+    Both outputs are numpy arrays so Plotly serializes them from the
+    buffer instead of boxing every pandas value into a Python object.
+    
+    Args:
+        x: X values (dates or index)
+        y: Y values
+        max_points: Maximum number of points to keep
+        dtype: Float dtype for the y values; float32 halves the payload
+            where chart resolution is all that matters
+    
+    Returns:
+        Tuple of (x, y) arrays
+    """
+    x = np.asarray(x)
+    values = np.asarray(y, dtype=dtype)
+    n = len(values)
+    if n <= max_points:
+        return x, values
+    
+    n_buckets = max((max_points - 2) // 2, 1)  # Leave room for the end points
+    bucket_size = -(-n // n_buckets)
+    
+    # Pad the tail with its last value so the series splits into equal buckets
+    buckets = np.pad(values, (0, n_buckets * bucket_size - n), mode="edge")
+    buckets = buckets.reshape(n_buckets, bucket_size)
+    starts = np.arange(n_buckets) * bucket_size
+    
+    idx = np.concatenate((
+        starts + buckets.argmin(axis=1),
+        starts + buckets.argmax(axis=1),
+        [0, n - 1],
+    ))
+    idx = np.unique(np.minimum(idx, n - 1))
+    
+    return x[idx], values[idx]
+
+
+def _frame_fingerprint(df: pd.DataFrame) -> tuple:
+    """
+    Cache key for a time-series DataFrame.
+    
+    Hashes every row and the index, so an edit anywhere in the history
+    (not just an appended row) produces a new key.
+    """
+    return (
+        tuple(df.columns),
+        pd.util.hash_pandas_object(df, index=True).values.tobytes(),
+    )
+
+
+def _as_datetime(values: pd.Series) -> pd.Series:
+    """Return a date column as datetimes, skipping the parse if it already is."""
+    if pd.api.types.is_datetime64_any_dtype(values):
+        return values
+    return pd.to_datetime(values)
+
+
+# Figures are cached so an unchanged chart skips Plotly figure
+# construction on reruns; cache_data hands each caller its own copy
+_FIGURE_CACHE: Dict[str, Any] = {
+    "max_entries": 32,
+    "show_spinner": False,
+    "hash_funcs": {pd.DataFrame: _frame_fingerprint},
+}
+
+
 def render_pnl_chart(
     pnl_data: pd.DataFrame,
     height: int = 400,
@@ -39,82 +155,91 @@ def render_pnl_chart(
         st.info("No P&L data available")
         return
     
-    colors = ThemeManager.get_chart_colors()
-    template = ThemeManager.get_plotly_template()
-    
-    # Create figure with secondary y-axis
-    fig = make_subplots(specs=[[{"secondary_y": True}]])
+    fig = _pnl_figure(
+        pnl_data,
+        height,
+        show_daily,
+        show_cumulative,
+        ThemeManager.get_current_theme(),
+    )
+    st.plotly_chart(fig, use_container_width=True)
+
+
+@st.cache_data(**_FIGURE_CACHE)
+def _pnl_figure(
+    pnl_data: pd.DataFrame,
+    height: int,
+    show_daily: bool,
+    show_cumulative: bool,
+    theme: str,
+) -> go.Figure:
+    """Build the P&L figure; cached on data fingerprint, options and theme."""
+    colors = ThemeManager.get_chart_colors(theme)
+    template = ThemeManager.get_plotly_template(theme)
     
     # Ensure date column is datetime
     if 'date' in pnl_data.columns:
-        dates = pd.to_datetime(pnl_data['date'])
+        dates = _as_datetime(pnl_data['date'])
     else:
         dates = pnl_data.index
     
+    traces: List[Dict[str, Any]] = []
+    
     # Add daily P&L bars
     if show_daily and 'daily_pnl' in pnl_data.columns:
-        daily_pnl = pnl_data['daily_pnl']
-        bar_colors = [colors["profit"] if v >= 0 else colors["loss"] for v in daily_pnl]
+        bar_x, bar_y = _minmax_downsample(dates, pnl_data['daily_pnl'], dtype=np.float32)
+        bar_colors = np.where(np.asarray(bar_y) >= 0, colors["profit"], colors["loss"])
         
-        fig.add_trace(
-            go.Bar(
-                x=dates,
-                y=daily_pnl,
-                name="Daily P&L",
-                marker_color=bar_colors,
-                opacity=0.7,
-                hovertemplate="Date: %{x}<br>Daily P&L: ₹%{y:,.2f}<extra></extra>"
-            ),
-            secondary_y=False,
-        )
-    
-    # Add cumulative P&L line
+        traces.append({
+            "type": "bar",
+            "x": bar_x,
+            "y": bar_y,
+            "name": "Daily P&L",
+            "marker": {"color": bar_colors},
+            "opacity": 0.7,
+            "hovertemplate": "Date: %{x}<br>Daily P&L: ₹%{y:,.2f}<extra></extra>",
+        })
+    
+    # Add cumulative P&L line on the secondary y-axis
     if show_cumulative and 'cumulative_pnl' in pnl_data.columns:
-        fig.add_trace(
-            go.Scatter(
-                x=dates,
-                y=pnl_data['cumulative_pnl'],
-                name="Cumulative P&L",
-                mode="lines",
-                line=dict(color=colors["primary"], width=2),
-                hovertemplate="Date: %{x}<br>Cumulative P&L: ₹%{y:,.2f}<extra></extra>"
-            ),
-            secondary_y=True,
-        )
-    
-    # Update layout
-    fig.update_layout(
-        template=template,
-        height=height,
-        margin=dict(l=10, r=10, t=30, b=10),
-        legend=dict(
-            orientation="h",
-            yanchor="bottom",
-            y=1.02,
-            xanchor="right",
-            x=1
-        ),
-        hovermode="x unified",
-    )
-    
-    # Update axes
-    fig.update_yaxes(title_text="Daily P&L (₹)", secondary_y=False, tickformat=",")
-    fig.update_yaxes(title_text="Cumulative P&L (₹)", secondary_y=True, tickformat=",")
-    
-    # Add range slider
-    fig.update_xaxes(
-        rangeslider_visible=True,
-        rangeselector=dict(
-            buttons=list([
-                dict(count=7, label="1W", step="day", stepmode="backward"),
-                dict(count=1, label="1M", step="month", stepmode="backward"),
-                dict(count=3, label="3M", step="month", stepmode="backward"),
-                dict(step="all", label="All")
-            ])
-        )
-    )
-    
-    st.plotly_chart(fig, use_container_width=True)
+        line_x, line_y = _minmax_downsample(dates, pnl_data['cumulative_pnl'], dtype=np.float32)
+        traces.append({
+            "type": "scattergl",
+            "x": line_x,
+            "y": line_y,
+            "yaxis": "y2",
+            "name": "Cumulative P&L",
+            "mode": "lines",
+            "line": {"color": colors["primary"], "width": 2},
+            "hovertemplate": "Date: %{x}<br>Cumulative P&L: ₹%{y:,.2f}<extra></extra>",
+        })
+    
+    # Add range slider; for long series it would redraw the whole history
+    # a second time, so only the range selector buttons are kept
+    layout = {
+        **_base_layout(template, height),
+        "hovermode": "x unified",
+        "xaxis": {
+            **_SECONDARY_Y_XAXIS,
+            "rangeslider": {"visible": len(pnl_data) < RANGESLIDER_MAX_POINTS},
+            "rangeselector": {
+                "buttons": [
+                    dict(count=7, label="1W", step="day", stepmode="backward"),
+                    dict(count=1, label="1M", step="month", stepmode="backward"),
+                    dict(count=3, label="3M", step="month", stepmode="backward"),
+                    dict(step="all", label="All"),
+                ]
+            },
+        },
+        "yaxis": {"title": {"text": "Daily P&L (₹)"}, "tickformat": ","},
+        "yaxis2": {
+            **_SECONDARY_YAXIS,
+            "title": {"text": "Cumulative P&L (₹)"},
+            "tickformat": ",",
+        },
+    }
+    
+    return go.Figure(data=traces, layout=layout)
 
 
 def render_drawdown_chart(
@@ -132,30 +257,47 @@ def render_drawdown_chart(
         st.info("No equity data available")
         return
     
-    colors = ThemeManager.get_chart_colors()
-    template = ThemeManager.get_plotly_template()
+    fig = _drawdown_figure(
+        equity_data,
+        height,
+        ThemeManager.get_current_theme(),
+    )
+    st.plotly_chart(fig, use_container_width=True)
+
+
+@st.cache_data(**_FIGURE_CACHE)
+def _drawdown_figure(
+    equity_data: pd.DataFrame,
+    height: int,
+    theme: str,
+) -> go.Figure:
+    """Build the drawdown figure; cached on data fingerprint, height and theme."""
+    colors = ThemeManager.get_chart_colors(theme)
+    template = ThemeManager.get_plotly_template(theme)
     
     # Ensure date column
     if 'date' in equity_data.columns:
-        dates = pd.to_datetime(equity_data['date'])
+        dates = _as_datetime(equity_data['date'])
     else:
         dates = equity_data.index
     
-    # Calculate drawdown if not present
+    # Calculate drawdown (%) if not present
     if 'drawdown' not in equity_data.columns:
         equity = equity_data['equity']
-        peak = equity.expanding().max()
-        drawdown = (equity - peak) / peak
+        peak = equity.cummax()
+        drawdown_pct = (equity.to_numpy() / peak.to_numpy() - 1.0) * 100
     else:
-        drawdown = equity_data['drawdown']
+        drawdown_pct = equity_data['drawdown'].to_numpy() * 100
+    
+    line_x, line_y = _minmax_downsample(dates, drawdown_pct, dtype=np.float32)
     
     fig = go.Figure()
     
     # Add drawdown area
     fig.add_trace(
-        go.Scatter(
-            x=dates,
-            y=drawdown * 100,  # Convert to percentage
+        go.Scattergl(
+            x=line_x,
+            y=line_y,
             fill='tozeroy',
             mode='lines',
             name="Drawdown",
@@ -178,7 +320,7 @@ def render_drawdown_chart(
         hovermode="x unified",
     )
     
-    st.plotly_chart(fig, use_container_width=True)
+    return fig
 
 
 def render_equity_curve(
@@ -200,71 +342,78 @@ def render_equity_curve(
         st.info("No equity data available")
         return
     
-    colors = ThemeManager.get_chart_colors()
-    template = ThemeManager.get_plotly_template()
-    
-    fig = go.Figure()
+    fig = _equity_figure(
+        equity_data,
+        height,
+        show_benchmark,
+        benchmark_data,
+        ThemeManager.get_current_theme(),
+    )
+    st.plotly_chart(fig, use_container_width=True)
+
+
+@st.cache_data(**_FIGURE_CACHE)
+def _equity_figure(
+    equity_data: pd.DataFrame,
+    height: int,
+    show_benchmark: bool,
+    benchmark_data: Optional[pd.DataFrame],
+    theme: str,
+) -> go.Figure:
+    """Build the equity curve figure; cached on data fingerprint, options and theme."""
+    colors = ThemeManager.get_chart_colors(theme)
+    template = ThemeManager.get_plotly_template(theme)
     
     # Ensure date column
     if 'date' in equity_data.columns:
-        dates = pd.to_datetime(equity_data['date'])
+        dates = _as_datetime(equity_data['date'])
     else:
         dates = equity_data.index
     
-    # Add equity curve
-    fig.add_trace(
-        go.Scatter(
-            x=dates,
-            y=equity_data['equity'],
-            name="Portfolio",
-            mode="lines",
-            line=dict(color=colors["primary"], width=2),
-            hovertemplate="Date: %{x}<br>Equity: ₹%{y:,.2f}<extra></extra>"
-        )
-    )
+    # Add equity curve; equity and peak stay float64, as float32 cannot
+    # hold the paise shown in the hover at portfolio scale
+    line_x, line_y = _minmax_downsample(dates, equity_data['equity'])
+    traces: List[Dict[str, Any]] = [{
+        "type": "scattergl",
+        "x": line_x,
+        "y": line_y,
+        "name": "Portfolio",
+        "mode": "lines",
+        "line": {"color": colors["primary"], "width": 2},
+        "hovertemplate": "Date: %{x}<br>Equity: ₹%{y:,.2f}<extra></extra>",
+    }]
     
     # Add peak line
     if 'peak' in equity_data.columns:
-        fig.add_trace(
-            go.Scatter(
-                x=dates,
-                y=equity_data['peak'],
-                name="Peak",
-                mode="lines",
-                line=dict(color=colors["profit"], width=1, dash="dot"),
-                hovertemplate="Date: %{x}<br>Peak: ₹%{y:,.2f}<extra></extra>"
-            )
-        )
+        line_x, line_y = _minmax_downsample(dates, equity_data['peak'])
+        traces.append({
+            "type": "scattergl",
+            "x": line_x,
+            "y": line_y,
+            "name": "Peak",
+            "mode": "lines",
+            "line": {"color": colors["profit"], "width": 1, "dash": "dot"},
+            "hovertemplate": "Date: %{x}<br>Peak: ₹%{y:,.2f}<extra></extra>",
+        })
     
     # Add benchmark if provided
     if show_benchmark and benchmark_data is not None:
-        fig.add_trace(
-            go.Scatter(
-                x=benchmark_data.index,
-                y=benchmark_data.values,
-                name="Benchmark",
-                mode="lines",
-                line=dict(color="#888888", width=1, dash="dash"),
-            )
-        )
-    
-    # Update layout
-    fig.update_layout(
-        template=template,
-        height=height,
-        margin=dict(l=10, r=10, t=30, b=10),
-        legend=dict(
-            orientation="h",
-            yanchor="bottom",
-            y=1.02,
-            xanchor="right",
-            x=1
-        ),
-        yaxis=dict(title="Equity (₹)", tickformat=","),
-        hovermode="x unified",
-    )
-    
-    st.plotly_chart(fig, use_container_width=True)
+        traces.append({
+            "type": "scattergl",
+            "x": benchmark_data.index.to_numpy(),
+            "y": benchmark_data.to_numpy(),
+            "name": "Benchmark",
+            "mode": "lines",
+            "line": {"color": "#888888", "width": 1, "dash": "dash"},
+        })
+    
+    layout = {
+        **_base_layout(template, height),
+        "yaxis": {"title": {"text": "Equity (₹)"}, "tickformat": ","},
+        "hovermode": "x unified",
+    }
+    
+    return go.Figure(data=traces, layout=layout)
 
 
 def render_greeks_chart(
@@ -282,20 +431,39 @@ def render_greeks_chart(
         st.info("No positions to display Greeks")
         return
     
-    colors = ThemeManager.get_chart_colors()
-    template = ThemeManager.get_plotly_template()
+    # Aggregate Greeks in one pass: rows are [delta, gamma, theta, vega,
+    # quantity], and the quantity-weighted totals are one matrix product
+    greeks = np.array(
+        [(p.delta, p.gamma, p.theta, p.vega, p.quantity) for p in positions],
+        dtype=float,
+    )
+    totals = greeks[:, 4] @ greeks[:, :4]
     
-    # Aggregate Greeks
-    total_delta = sum(p.delta * p.quantity for p in positions)
-    total_gamma = sum(p.gamma * p.quantity for p in positions)
-    total_theta = sum(p.theta * p.quantity for p in positions)
-    total_vega = sum(p.vega * p.quantity for p in positions)
+    fig = _greeks_figure(
+        tuple(totals.tolist()),
+        height,
+        ThemeManager.get_current_theme(),
+    )
+    st.plotly_chart(fig, use_container_width=True)
+
+
+@st.cache_data(**_FIGURE_CACHE)
+def _greeks_figure(
+    totals: tuple,
+    height: int,
+    theme: str,
+) -> go.Figure:
+    """Build the Greeks bar chart; cached on the net Greek totals and theme."""
+    colors = ThemeManager.get_chart_colors(theme)
+    template = ThemeManager.get_plotly_template(theme)
+    
+    total_delta, total_gamma, total_theta, total_vega = totals
     
     greeks = ["Delta", "Gamma", "Theta", "Vega"]
     values = [total_delta, total_gamma * 100, total_theta, total_vega]  # Scale gamma for visibility
     
     # Create color based on positive/negative
-    bar_colors = [colors["profit"] if v >= 0 else colors["loss"] for v in values]
+    bar_colors = np.where(np.asarray(values) >= 0, colors["profit"], colors["loss"])
     
     fig = go.Figure(
         data=[
@@ -318,7 +486,7 @@ def render_greeks_chart(
         xaxis=dict(title="Greek"),
     )
     
-    st.plotly_chart(fig, use_container_width=True)
+    return fig
 
 
 def render_performance_chart(
@@ -332,20 +500,36 @@ def render_performance_chart(
         metrics: Dictionary of performance metrics
         height: Chart height in pixels
     """
-    colors = ThemeManager.get_chart_colors()
-    template = ThemeManager.get_plotly_template()
+    fig = _performance_figure(
+        metrics,
+        height,
+        ThemeManager.get_current_theme(),
+    )
+    st.plotly_chart(fig, use_container_width=True)
+
+
+@st.cache_data(**_FIGURE_CACHE)
+def _performance_figure(
+    metrics: Dict[str, float],
+    height: int,
+    theme: str,
+) -> go.Figure:
+    """Build the performance radar figure; cached on metrics, height and theme."""
+    colors = ThemeManager.get_chart_colors(theme)
+    template = ThemeManager.get_plotly_template(theme)
     
     # Define metrics to display (normalized to 0-100 scale)
     metric_names = ["Win Rate", "Profit Factor", "Sharpe", "Recovery", "Consistency"]
     
     # Get or calculate values (demo values)
-    values = [
+    raw = np.array([
         metrics.get("win_rate", 0.6) * 100,
-        min(metrics.get("profit_factor", 1.5) * 20, 100),
-        min(max(metrics.get("sharpe_ratio", 1.0) * 25, 0), 100),
-        max(100 - metrics.get("max_drawdown", 10), 0),
+        metrics.get("profit_factor", 1.5) * 20,
+        metrics.get("sharpe_ratio", 1.0) * 25,
+        100 - metrics.get("max_drawdown", 10),
         metrics.get("consistency", 70),
-    ]
+    ], dtype=float)
+    values = np.clip(raw, 0, 100).tolist()
     
     fig = go.Figure(
         data=go.Scatterpolar(
@@ -371,7 +555,7 @@ def render_performance_chart(
         showlegend=False,
     )
     
-    st.plotly_chart(fig, use_container_width=True)
+    return fig
 
 
 def render_iv_chart(
@@ -389,57 +573,83 @@ def render_iv_chart(
         st.info("No IV data available")
         return
     
-    colors = ThemeManager.get_chart_colors()
-    template = ThemeManager.get_plotly_template()
+    fig = _iv_figure(
+        iv_data,
+        height,
+        ThemeManager.get_current_theme(),
+    )
+    st.plotly_chart(fig, use_container_width=True)
+
+
+@st.cache_data(**_FIGURE_CACHE)
+def _iv_figure(
+    iv_data: pd.DataFrame,
+    height: int,
+    theme: str,
+) -> go.Figure:
+    """Build the IV and IV Rank figure; cached on data fingerprint, height and theme."""
+    colors = ThemeManager.get_chart_colors(theme)
+    template = ThemeManager.get_plotly_template(theme)
     
-    fig = make_subplots(specs=[[{"secondary_y": True}]])
+    iv_dates = iv_data.index.to_numpy()
+    traces: List[Dict[str, Any]] = []
     
     # Add IV line
     if 'iv' in iv_data.columns:
-        fig.add_trace(
-            go.Scatter(
-                x=iv_data.index,
-                y=iv_data['iv'] * 100,
-                name="IV",
-                mode="lines",
-                line=dict(color=colors["primary"], width=2),
-            ),
-            secondary_y=False,
-        )
-    
-    # Add IV Rank
+        traces.append({
+            "type": "scattergl",
+            "x": iv_dates,
+            "y": iv_data['iv'].to_numpy(dtype=np.float32) * 100,
+            "name": "IV",
+            "mode": "lines",
+            "line": {"color": colors["primary"], "width": 2},
+        })
+    
+    # Add IV Rank on the secondary y-axis
     if 'iv_rank' in iv_data.columns:
-        fig.add_trace(
-            go.Scatter(
-                x=iv_data.index,
-                y=iv_data['iv_rank'],
-                name="IV Rank",
-                mode="lines",
-                line=dict(color=colors["profit"], width=2),
-            ),
-            secondary_y=True,
-        )
-    
-    # Add threshold line for IV Rank
-    fig.add_hline(
-        y=70,
-        line_dash="dash",
-        line_color="yellow",
-        annotation_text="Entry Threshold",
-        secondary_y=True,
-    )
-    
-    fig.update_layout(
-        template=template,
-        height=height,
-        margin=dict(l=10, r=10, t=30, b=10),
-        legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1),
-    )
-    
-    fig.update_yaxes(title_text="IV (%)", secondary_y=False)
-    fig.update_yaxes(title_text="IV Rank", range=[0, 100], secondary_y=True)
-    
-    st.plotly_chart(fig, use_container_width=True)
+        traces.append({
+            "type": "scattergl",
+            "x": iv_dates,
+            "y": iv_data['iv_rank'].to_numpy(dtype=np.float32),
+            "yaxis": "y2",
+            "name": "IV Rank",
+            "mode": "lines",
+            "line": {"color": colors["profit"], "width": 2},
+        })
+    
+    layout = {
+        **_base_layout(template, height),
+        "xaxis": dict(_SECONDARY_Y_XAXIS),
+        "yaxis": {"title": {"text": "IV (%)"}},
+        "yaxis2": {
+            **_SECONDARY_YAXIS,
+            "title": {"text": "IV Rank"},
+            "range": [0, 100],
+        },
+        # Threshold line for IV Rank, spanning the full plot width
+        "shapes": [{
+            "type": "line",
+            "xref": "x domain",
+            "x0": 0,
+            "x1": 1,
+            "yref": "y2",
+            "y0": 70,
+            "y1": 70,
+            "line": {"color": "yellow", "dash": "dash"},
+        }],
+        "annotations": [{
+            "text": "Entry Threshold",
+            "showarrow": False,
+            "xref": "x domain",
+            "x": 1,
+            "xanchor": "right",
+            "yref": "y2",
+            "y": 70,
+            "yanchor": "bottom",
+        }],
+    }
+    
+    return go.Figure(data=traces, layout=layout)
 
 
 def render_mini_sparkline(
@@ -473,16 +683,26 @@ def render_mini_sparkline(
     width = max(10, min(int(width), 1000))
     height = max(10, min(int(height), 500))
     
+    values = data.to_numpy(dtype=np.float64)
+    return _sparkline_svg(values.tobytes(), color, width, height)
+
+
+@lru_cache(maxsize=256)
+def _sparkline_svg(values: bytes, color: str, width: int, height: int) -> str:
+    """Build the sparkline SVG; cached since the same series is often redrawn."""
+    data = np.frombuffer(values, dtype=np.float64)
+    
     # Normalize data to fit in the height
     min_val = data.min()
     max_val = data.max()
     range_val = max_val - min_val if max_val != min_val else 1
     
-    normalized = ((data - min_val) / range_val * (height - 4) + 2).tolist()
+    normalized = (data - min_val) / range_val * (height - 4) + 2
     
     # Create SVG path
     x_step = width / (len(normalized) - 1) if len(normalized) > 1 else width
-    points = " ".join([f"{i * x_step},{height - y}" for i, y in enumerate(normalized)])
+    xs = np.arange(len(normalized)) * x_step
+    points = " ".join(map("{},{}".format, xs.tolist(), (height - normalized).tolist()))
     
     svg = f'''
     <svg width="{width}" height="{height}">
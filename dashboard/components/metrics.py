@@ -8,7 +8,9 @@ Provides components for displaying risk metrics and market data including:
 """
 
 import streamlit as st
-from typing import Any, Dict, Optional, Callable, List
+from functools import lru_cache
+from dataclasses import fields, is_dataclass
+from typing import Any, Dict, Optional, Callable, List, Mapping
 from datetime import datetime
 
 from ..utils.theme import ThemeManager
@@ -21,7 +23,43 @@ MARGIN_DANGER_THRESHOLD = 80  # Margin % above this shows red warning
 DRAWDOWN_WARNING_THRESHOLD = 5  # Drawdown % above this shows indicator
 DRAWDOWN_DANGER_THRESHOLD = 10  # Drawdown % above this shows warning color
 
+# Demo KPI cards for render_strategy_metrics as (label, value, delta),
+# laid out in one flex row and styled by the metric-card classes of the
+# custom CSS
+_STRATEGY_KPIS = (
+    ("Win Rate", "65.8%", "+2.3%"),
+    ("Profit Factor", "2.15", "+0.12"),
+    ("Sharpe Ratio", "1.85", "+0.05"),
+    ("Avg Trade", "₹2,450", "₹+125"),
+)
 
+_STRATEGY_KPI_HTML = (
+    "<div style='display: flex; gap: 1rem;'>"
+    + "".join(
+        "<div class='metric-card' style='flex: 1;'>"
+        f"<div class='metric-label'>{label}</div>"
+        f"<div class='metric-value'>{value}</div>"
+        f"<div class='profit'>↑ {delta}</div>"
+        "</div>"
+        for label, value, delta in _STRATEGY_KPIS
+    )
+    + "</div>"
+)
+
+# Demo recent-performance table for render_strategy_metrics. It is static,
+# so it is rendered once as a markdown table rather than sent as a
+# dataframe on every rerun.
+_RECENT_PERFORMANCE_TABLE = """\
+| Period | P&L | Trades | Win Rate |
+|:--|--:|--:|--:|
+| Today | ₹3,250 | 2 | 100% |
+| This Week | ₹12,800 | 8 | 75% |
+| This Month | ₹45,600 | 32 | 68% |
+| YTD | ₹156,000 | 145 | 66% |
+"""
+
+
+@lru_cache(maxsize=2048)
 def format_compact_number(value: float, currency: bool = True, decimals: int = 1) -> str:
     """
     Format a number in compact form (K for thousands, L for lakhs, Cr for crores).
@@ -48,6 +86,48 @@ def format_compact_number(value: float, currency: bool = True, decimals: int = 1
         return f"{sign}{prefix}{abs_value:,.{decimals}f}"
 
 
+def _as_mapping(values: Any) -> Mapping[str, Any]:
+    """
+    View a dataclass, plain object or dict of display values as a mapping.
+    
+    Lets the render functions read every field with a single .get()
+    instead of probing each attribute with hasattr().
+    
+    Args:
+        values: Dataclass instance, object with attributes, or mapping
+    
+    Returns:
+        Mapping of field name to value
+    """
+    if isinstance(values, Mapping):
+        return values
+    if is_dataclass(values):
+        return {f.name: getattr(values, f.name) for f in fields(values)}
+    return vars(values)
+
+
+@lru_cache(maxsize=256)
+def _format_pnl_block(label: str, value: float, color: str, label_color: str) -> str:
+    """
+    Build the HTML for one centered P&L summary value.
+    
+    Args:
+        label: Caption shown above the value
+        value: Amount to display in compact currency form
+        color: Color of the value
+        label_color: Color of the caption
+        
+    Returns:
+        HTML block sized to share a flex row
+    """
+    return (
+        f"<div style='flex: 1; text-align: center; overflow: hidden;'>"
+        f"<p style='margin-bottom: 0; color: {label_color};'>{label}</p>"
+        f"<p style='font-size: 1.25rem; font-weight: bold; color: {color}; white-space: nowrap;'>{format_compact_number(value)}</p>"
+        f"</div>"
+    )
+
+
 def render_risk_metrics(risk_metrics: Any) -> None:
     """
     Render a risk metrics display panel.
@@ -56,6 +136,7 @@ def render_risk_metrics(risk_metrics: Any) -> None:
         risk_metrics: RiskMetrics object with current risk values
     """
     colors = ThemeManager.get_colors()
+    risk = _as_mapping(risk_metrics)
     
     st.markdown("### ⚠️ Risk Metrics")
     
@@ -63,7 +144,7 @@ def render_risk_metrics(risk_metrics: Any) -> None:
     col1, col2, col3, col4 = st.columns(4)
     
     with col1:
-        var_value = risk_metrics.var_95 if hasattr(risk_metrics, 'var_95') else risk_metrics.get('var_95', 0)
+        var_value = risk.get('var_95', 0)
         st.metric(
             "VaR (95%)",
             format_compact_number(var_value, currency=True, decimals=0),
@@ -71,7 +152,7 @@ def render_risk_metrics(risk_metrics: Any) -> None:
         )
     
     with col2:
-        margin = risk_metrics.margin_used if hasattr(risk_metrics, 'margin_used') else risk_metrics.get('margin_used', 0)
+        margin = risk.get('margin_used', 0)
         delta = "⚠️" if margin > MARGIN_DANGER_THRESHOLD else ("🟡" if margin > MARGIN_WARNING_THRESHOLD else "✅")
         st.metric(
             "Margin",
@@ -82,7 +163,7 @@ def render_risk_metrics(risk_metrics: Any) -> None:
         )
     
     with col3:
-        exposure = risk_metrics.max_exposure if hasattr(risk_metrics, 'max_exposure') else risk_metrics.get('max_exposure', 0)
+        exposure = risk.get('max_exposure', 0)
         st.metric(
             "Exposure",
             format_compact_number(exposure, currency=True, decimals=0),
@@ -90,7 +171,7 @@ def render_risk_metrics(risk_metrics: Any) -> None:
         )
     
     with col4:
-        drawdown = risk_metrics.drawdown if hasattr(risk_metrics, 'drawdown') else risk_metrics.get('drawdown', 0)
+        drawdown = risk.get('drawdown', 0)
         dd_color = colors["loss_color"] if drawdown > DRAWDOWN_DANGER_THRESHOLD else colors["text"]
         st.metric(
             "Drawdown",
@@ -100,62 +181,40 @@ def render_risk_metrics(risk_metrics: Any) -> None:
             help="Current drawdown from peak"
         )
     
-    # P&L section
+    # P&L section, sent as one flex row instead of three columns
     st.markdown("#### 💰 P&L Summary")
-    col1, col2, col3 = st.columns(3)
-    
-    with col1:
-        daily_pnl = risk_metrics.daily_pnl if hasattr(risk_metrics, 'daily_pnl') else risk_metrics.get('daily_pnl', 0)
-        pnl_color = colors["profit_color"] if daily_pnl >= 0 else colors["loss_color"]
-        st.markdown(
-            f"<div style='text-align: center; overflow: hidden;'>"
-            f"<p style='margin-bottom: 0; color: {colors['secondary']};'>Daily P&L</p>"
-            f"<p style='font-size: 1.25rem; font-weight: bold; color: {pnl_color}; white-space: nowrap;'>{format_compact_number(daily_pnl)}</p>"
-            f"</div>",
-            unsafe_allow_html=True
-        )
-    
-    with col2:
-        total_pnl = risk_metrics.total_pnl if hasattr(risk_metrics, 'total_pnl') else risk_metrics.get('total_pnl', 0)
-        pnl_color = colors["profit_color"] if total_pnl >= 0 else colors["loss_color"]
-        st.markdown(
-            f"<div style='text-align: center; overflow: hidden;'>"
-            f"<p style='margin-bottom: 0; color: {colors['secondary']};'>Total P&L</p>"
-            f"<p style='font-size: 1.25rem; font-weight: bold; color: {pnl_color}; white-space: nowrap;'>{format_compact_number(total_pnl)}</p>"
-            f"</div>",
-            unsafe_allow_html=True
-        )
-    
-    with col3:
-        cvar = risk_metrics.cvar_95 if hasattr(risk_metrics, 'cvar_95') else risk_metrics.get('cvar_95', 0)
-        st.markdown(
-            f"<div style='text-align: center; overflow: hidden;'>"
-            f"<p style='margin-bottom: 0; color: {colors['secondary']};'>CVaR (95%)</p>"
-            f"<p style='font-size: 1.25rem; font-weight: bold; color: {colors['loss_color']}; white-space: nowrap;'>{format_compact_number(cvar)}</p>"
-            f"</div>",
-            unsafe_allow_html=True
-        )
+    daily_pnl = risk.get('daily_pnl', 0)
+    total_pnl = risk.get('total_pnl', 0)
+    cvar = risk.get('cvar_95', 0)
+    st.markdown(
+        "<div style='display: flex; gap: 1rem;'>"
+        + _format_pnl_block("Daily P&L", daily_pnl, colors["profit_color"] if daily_pnl >= 0 else colors["loss_color"], colors["secondary"])
+        + _format_pnl_block("Total P&L", total_pnl, colors["profit_color"] if total_pnl >= 0 else colors["loss_color"], colors["secondary"])
+        + _format_pnl_block("CVaR (95%)", cvar, colors["loss_color"], colors["secondary"])
+        + "</div>",
+        unsafe_allow_html=True
+    )
     
     # Greeks exposure section
     st.markdown("#### 📐 Greeks Exposure")
     col1, col2, col3, col4 = st.columns(4)
     
     with col1:
-        delta = risk_metrics.delta_exposure if hasattr(risk_metrics, 'delta_exposure') else risk_metrics.get('delta_exposure', 0)
+        delta = risk.get('delta_exposure', 0)
         delta_color = colors["profit_color"] if abs(delta) < DELTA_EXPOSURE_THRESHOLD else colors["warning"]
         st.metric("Delta", f"{delta:,.4f}", help="Net delta exposure")
     
     with col2:
-        gamma = risk_metrics.gamma_exposure if hasattr(risk_metrics, 'gamma_exposure') else risk_metrics.get('gamma_exposure', 0)
+        gamma = risk.get('gamma_exposure', 0)
         st.metric("Gamma", f"{gamma:,.6f}", help="Net gamma exposure")
     
     with col3:
-        theta = risk_metrics.theta_exposure if hasattr(risk_metrics, 'theta_exposure') else risk_metrics.get('theta_exposure', 0)
+        theta = risk.get('theta_exposure', 0)
         theta_color = colors["profit_color"] if theta < 0 else colors["loss_color"]  # Negative theta is good for sellers
         st.metric("Theta", format_compact_number(theta), help="Daily theta decay")
     
     with col4:
-        vega = risk_metrics.vega_exposure if hasattr(risk_metrics, 'vega_exposure') else risk_metrics.get('vega_exposure', 0)
+        vega = risk.get('vega_exposure', 0)
         st.metric("Vega", f"{vega:,.2f}", help="Net vega exposure")
 
 
@@ -168,16 +227,16 @@ def render_market_data(market_data: Any, underlying: str = "NIFTY") -> None:
         underlying: Name of the underlying asset
     """
     colors = ThemeManager.get_colors()
+    data = _as_mapping(market_data)
     
-    st.markdown(f"### 📈 {underlying} Market Data")
-    
-    # Main price display
-    spot = market_data.spot_price if hasattr(market_data, 'spot_price') else market_data.get('spot_price', 0)
-    change = market_data.change if hasattr(market_data, 'change') else market_data.get('change', 0)
+    # Heading and main price display in one block
+    spot = data.get('spot_price', 0)
+    change = data.get('change', 0)
     change_color = colors["profit_color"] if change >= 0 else colors["loss_color"]
     change_arrow = "▲" if change >= 0 else "▼"
     
     st.markdown(
+        f"### 📈 {underlying} Market Data\n\n"
         f"<div style='text-align: center; padding: 1rem; background: {colors['secondary_background']}; border-radius: 0.5rem;'>"
         f"<p style='font-size: 2.5rem; font-weight: bold; margin-bottom: 0;'>₹{spot:,.2f}</p>"
         f"<p style='font-size: 1.2rem; color: {change_color};'>{change_arrow} {abs(change):.2f}%</p>"
@@ -189,29 +248,45 @@ def render_market_data(market_data: Any, underlying: str = "NIFTY") -> None:
     col1, col2, col3, col4 = st.columns(4)
     
     with col1:
-        bid = market_data.bid if hasattr(market_data, 'bid') else market_data.get('bid', 0)
+        bid = data.get('bid', 0)
         st.metric("Bid", f"₹{bid:,.2f}")
     
     with col2:
-        ask = market_data.ask if hasattr(market_data, 'ask') else market_data.get('ask', 0)
+        ask = data.get('ask', 0)
         st.metric("Ask", f"₹{ask:,.2f}")
     
     with col3:
-        iv = market_data.iv if hasattr(market_data, 'iv') else market_data.get('iv', 0)
+        iv = data.get('iv', 0)
         st.metric("IV", f"{iv * 100:.1f}%", help="Implied Volatility")
     
     with col4:
-        iv_rank = market_data.iv_rank if hasattr(market_data, 'iv_rank') else market_data.get('iv_rank', 0)
+        iv_rank = data.get('iv_rank', 0)
         rank_color = colors["profit_color"] if iv_rank > 70 else (colors["warning"] if iv_rank > 40 else colors["loss_color"])
         st.metric("IV Rank", f"{iv_rank:.0f}", help="IV Rank (0-100)")
     
     # Volume
-    volume = market_data.volume if hasattr(market_data, 'volume') else market_data.get('volume', 0)
-    timestamp = market_data.timestamp if hasattr(market_data, 'timestamp') else market_data.get('timestamp', datetime.now())
+    volume = data.get('volume', 0)
+    timestamp = data.get('timestamp') or datetime.now()
     
     st.caption(f"Volume: {volume:,} | Last update: {timestamp.strftime('%H:%M:%S')}")
 
 
+# Instrument configuration is static for the life of the app, so the order
+# form reads it through these caches instead of the data handler on every
+# widget interaction. The handler argument is not part of the cache key;
+# cache_data hands each caller its own copy of the shared config.
+@st.cache_data(ttl=300, show_spinner=False)
+def _order_underlyings(_data_handler: Any) -> List[str]:
+    """Return the underlyings offered on the order form."""
+    return _data_handler.get_available_underlyings()
+
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _order_instrument_config(_data_handler: Any, underlying: str) -> Dict[str, Any]:
+    """Return the lot size and strike interval for an underlying."""
+    return _data_handler.get_instrument_config(underlying)
+
+
 def render_order_entry(
     data_handler: Any,
     on_order_submit: Optional[Callable] = None,
@@ -232,21 +307,22 @@ def render_order_entry(
         
         with col1:
             # Underlying selection
-            underlyings = data_handler.get_available_underlyings()
+            underlyings = _order_underlyings(data_handler)
             underlying = st.selectbox("Underlying", underlyings, key="order_underlying")
             
             # Get instrument config for lot size
-            config = data_handler.get_instrument_config(underlying)
+            config = _order_instrument_config(data_handler, underlying)
             lot_size = config.get("lot_size", 50)
+            strike_interval = config.get("strike_interval", 50)
             
-            # Strike price
+            # Strike price; market data is the only live read on the form
             market_data = data_handler.get_market_data(underlying)
-            atm_strike = round(market_data.spot_price / config.get("strike_interval", 50)) * config.get("strike_interval", 50)
+            atm_strike = round(market_data.spot_price / strike_interval) * strike_interval
             
             strike = st.number_input(
                 "Strike Price",
                 value=int(atm_strike),
-                step=config.get("strike_interval", 50),
+                step=strike_interval,
                 key="order_strike"
             )
             
@@ -352,35 +428,12 @@ def render_strategy_metrics(strategy: Dict[str, Any], trades: List[Dict] = None)
     st.markdown(f"**{strategy_name}** {status_icon}")
     
     # Performance metrics (demo values if no trades)
-    col1, col2, col3, col4 = st.columns(4)
-    
-    with col1:
-        st.metric("Win Rate", "65.8%", delta="+2.3%")
-    
-    with col2:
-        st.metric("Profit Factor", "2.15", delta="+0.12")
-    
-    with col3:
-        st.metric("Sharpe Ratio", "1.85", delta="+0.05")
-    
-    with col4:
-        st.metric("Avg Trade", "₹2,450", delta="₹+125")
+    st.html(_STRATEGY_KPI_HTML)
     
     # Recent performance
     st.markdown("#### Recent Performance")
     
-    perf_data = {
-        "Period": ["Today", "This Week", "This Month", "YTD"],
-        "P&L": ["₹3,250", "₹12,800", "₹45,600", "₹156,000"],
-        "Trades": [2, 8, 32, 145],
-        "Win Rate": ["100%", "75%", "68%", "66%"],
-    }
-    
-    st.dataframe(
-        perf_data,
-        use_container_width=True,
-        hide_index=True,
-    )
+    st.markdown(_RECENT_PERFORMANCE_TABLE)
 
 
 def render_capital_metrics(
@@ -9,72 +9,81 @@ Provides sidebar UI components for the trading dashboard including:
 """
 
 import streamlit as st
+import pandas as pd
 from typing import Dict, Any, List, Optional, Callable
 from datetime import datetime
+from uuid import uuid4
 
 from ..utils.theme import ThemeManager, get_custom_css
 from ..utils.export import ExportManager
+from .alerts import get_alert_manager
+
+
+def _session_token() -> str:
+    """Return a token that identifies the current session for cache keys."""
+    return st.session_state.setdefault("session_token", uuid4().hex)
+
+
+@st.cache_data(ttl=5, show_spinner=False)
+def _sidebar_strategies(_data_handler: Any, session_token: str) -> List[Dict[str, Any]]:
+    """
+    Return the strategy list shown in the sidebar.
+    
+    Every widget interaction reruns the sidebar, so the list is fetched at
+    most once every few seconds per session. The handler itself is not
+    hashed; session_token keeps sessions apart, and each caller gets its
+    own copy of the list.
+    """
+    return _data_handler.get_strategies()
 
 
 def render_sidebar(
     data_handler: Any,
     on_strategy_change: Optional[Callable] = None,
     on_export: Optional[Callable] = None,
-) -> Dict[str, Any]:
+) -> None:
     """
     Render the complete sidebar with all controls.
     
+    The strategy, export and quick action sections are fragments, which
+    rerun on their own and cannot hand values back to the page; their
+    widget values are read from session state by key.
+    
     Args:
         data_handler: DashboardDataHandler instance
         on_strategy_change: Callback for strategy changes
         on_export: Callback for export actions
-    
-    Returns:
-        Dictionary containing sidebar selections and actions
     """
-    sidebar_state = {
-        "selected_strategy": None,
-        "strategy_params": {},
-        "export_action": None,
-        "theme": ThemeManager.get_current_theme(),
-    }
-    
-    st.sidebar.title("📊 Trading Dashboard")
-    st.sidebar.markdown("---")
-    
-    # Theme toggle
-    sidebar_state["theme"] = render_theme_toggle()
-    
-    st.sidebar.markdown("---")
-    
-    # Strategy selector
-    strategy_selection = render_strategy_selector(data_handler)
-    sidebar_state["selected_strategy"] = strategy_selection["selected"]
-    sidebar_state["strategy_params"] = strategy_selection["params"]
-    
-    st.sidebar.markdown("---")
-    
-    # Strategy controls
-    render_strategy_controls(strategy_selection["selected"])
-    
-    st.sidebar.markdown("---")
-    
-    # Export controls
-    sidebar_state["export_action"] = render_export_controls(data_handler)
-    
-    st.sidebar.markdown("---")
-    
-    # Quick actions
-    render_quick_actions()
-    
-    # Footer
-    st.sidebar.markdown("---")
-    st.sidebar.markdown(
-        f"<small>Last updated: {datetime.now().strftime('%H:%M:%S')}</small>",
-        unsafe_allow_html=True
-    )
-    
-    return sidebar_state
+    # Sections are drawn through `st.` inside this block so that the
+    # fragments below can rerun on their own within the sidebar
+    with st.sidebar:
+        st.title("📊 Trading Dashboard")
+        st.markdown("---")
+        
+        # Theme toggle
+        render_theme_toggle()
+        
+        st.markdown("---")
+        
+        # Strategy selector and controls
+        _render_strategy_section(data_handler)
+        
+        st.markdown("---")
+        
+        # Export controls
+        render_export_controls(data_handler)
+        
+        st.markdown("---")
+        
+        # Quick actions
+        render_quick_actions()
+        
+        # Footer
+        st.markdown("---")
+        st.markdown(
+            f"<small>Last updated: {datetime.now().strftime('%H:%M:%S')}</small>",
+            unsafe_allow_html=True
+        )
 
 
 def render_theme_toggle() -> str:
@@ -84,22 +93,66 @@ def render_theme_toggle() -> str:
     Returns:
         Current theme name
     """
-    st.sidebar.subheader("🎨 Theme")
+    st.subheader("🎨 Theme")
     
     current_theme = ThemeManager.get_current_theme()
     theme_label = "🌙 Dark" if current_theme == "dark" else "☀️ Light"
     
-    col1, col2 = st.sidebar.columns([2, 1])
+    col1, col2 = st.columns([2, 1])
     with col1:
         st.markdown(f"Current: **{theme_label}**")
     with col2:
-        if st.button("Toggle", key="theme_toggle", use_container_width=True):
-            ThemeManager.toggle_theme()
-            st.rerun()
+        # The callback runs before the rerun the click triggers, so the
+        # page is drawn once, already in the new theme
+        st.button(
+            "Toggle",
+            key="theme_toggle",
+            on_click=ThemeManager.toggle_theme,
+            use_container_width=True,
+        )
     
     return ThemeManager.get_current_theme()
 
 
+def _range_input(label: str, value: tuple, key: str) -> tuple:
+    """Render a (min, max) parameter as two number inputs."""
+    st.markdown(f"**{label}**")
+    return (
+        st.number_input("Min", value=value[0], step=0.01, key=f"{key}_min"),
+        st.number_input("Max", value=value[1], step=0.01, key=f"{key}_max"),
+    )
+
+
+# Input widget per strategy parameter type, called as (label, value, key).
+# Looked up by exact type, so bool parameters never fall through to int.
+_PARAM_WIDGETS: Dict[type, Callable[[str, Any, str], Any]] = {
+    bool: lambda label, value, key: st.checkbox(label, value=value, key=key),
+    int: lambda label, value, key: st.number_input(label, value=value, step=1, key=key),
+    float: lambda label, value, key: st.number_input(
+        label, value=value, step=0.01, format="%.2f", key=key
+    ),
+    tuple: _range_input,
+}
+
+
+@st.fragment
+def _render_strategy_section(data_handler: Any) -> None:
+    """
+    Render the strategy selector and its controls as one fragment.
+    
+    The controls depend on the selected strategy's status, so both rerun
+    together when either changes, without rerunning the page.
+    
+    Args:
+        data_handler: DashboardDataHandler instance
+    """
+    strategy_selection = render_strategy_selector(data_handler)
+    
+    st.markdown("---")
+    
+    render_strategy_controls(strategy_selection["selected"])
+
+
 def render_strategy_selector(data_handler: Any) -> Dict[str, Any]:
     """
     Render the strategy selector dropdown and parameter inputs.
@@ -110,12 +163,12 @@ def render_strategy_selector(data_handler: Any) -> Dict[str, Any]:
     Returns:
         Dictionary with selected strategy and parameters
     """
-    st.sidebar.subheader("📈 Strategy")
+    st.subheader("📈 Strategy")
     
-    strategies = data_handler.get_strategies()
+    strategies = _sidebar_strategies(data_handler, _session_token())
     strategy_names = [s["name"] for s in strategies]
     
-    selected_idx = st.sidebar.selectbox(
+    selected_idx = st.selectbox(
         "Select Strategy",
         range(len(strategy_names)),
         format_func=lambda x: strategy_names[x],
@@ -125,46 +178,26 @@ def render_strategy_selector(data_handler: Any) -> Dict[str, Any]:
     selected_strategy = strategies[selected_idx]
     
     # Display strategy description
-    st.sidebar.markdown(f"*{selected_strategy['description']}*")
+    st.markdown(f"*{selected_strategy['description']}*")
     
     # Status indicator
     status = selected_strategy.get("status", "inactive")
     status_color = "🟢" if status == "active" else "🔴"
-    st.sidebar.markdown(f"Status: {status_color} {status.title()}")
+    st.markdown(f"Status: {status_color} {status.title()}")
     
     # Strategy parameters
     params = {}
-    with st.sidebar.expander("⚙️ Parameters", expanded=False):
+    with st.expander("⚙️ Parameters", expanded=False):
         for param_name, param_value in selected_strategy["parameters"].items():
-            if isinstance(param_value, bool):
-                params[param_name] = st.checkbox(
-                    param_name.replace("_", " ").title(),
-                    value=param_value,
-                    key=f"param_{param_name}"
-                )
-            elif isinstance(param_value, int):
-                params[param_name] = st.number_input(
-                    param_name.replace("_", " ").title(),
-                    value=param_value,
-                    step=1,
-                    key=f"param_{param_name}"
-                )
-            elif isinstance(param_value, float):
-                params[param_name] = st.number_input(
+            widget = _PARAM_WIDGETS.get(type(param_value))
+            if widget is None:
+                params[param_name] = param_value
+            else:
+                params[param_name] = widget(
                     param_name.replace("_", " ").title(),
-                    value=param_value,
-                    step=0.01,
-                    format="%.2f",
-                    key=f"param_{param_name}"
-                )
-            elif isinstance(param_value, tuple):
-                st.markdown(f"**{param_name.replace('_', ' ').title()}**")
-                params[param_name] = (
-                    st.number_input(f"Min", value=param_value[0], step=0.01, key=f"param_{param_name}_min"),
-                    st.number_input(f"Max", value=param_value[1], step=0.01, key=f"param_{param_name}_max"),
+                    param_value,
+                    f"param_{param_name}",
                 )
-            else:
-                params[param_name] = param_value
     
     return {
         "selected": selected_strategy,
@@ -172,6 +205,11 @@ def render_strategy_selector(data_handler: Any) -> Dict[str, Any]:
     }
 
 
+def _set_strategy_status(status: str) -> None:
+    """Button callback storing the requested strategy status."""
+    st.session_state["strategy_status"] = status
+
+
 def render_strategy_controls(strategy: Dict[str, Any]) -> None:
     """
     Render strategy control buttons (Start/Stop/Pause).
@@ -179,91 +217,118 @@ def render_strategy_controls(strategy: Dict[str, Any]) -> None:
     Args:
         strategy: Selected strategy dictionary
     """
-    st.sidebar.subheader("🎮 Controls")
+    st.subheader("🎮 Controls")
     
     status = strategy.get("status", "inactive")
     
-    col1, col2 = st.sidebar.columns(2)
+    col1, col2 = st.columns(2)
     
     with col1:
         if status == "inactive":
-            if st.button("▶️ Start", key="start_strategy", use_container_width=True):
-                st.session_state["strategy_status"] = "active"
+            if st.button("▶️ Start", key="start_strategy", on_click=_set_strategy_status,
+                         args=("active",), use_container_width=True):
                 st.success("Strategy started!")
         else:
-            if st.button("⏸️ Pause", key="pause_strategy", use_container_width=True):
-                st.session_state["strategy_status"] = "paused"
+            if st.button("⏸️ Pause", key="pause_strategy", on_click=_set_strategy_status,
+                         args=("paused",), use_container_width=True):
                 st.info("Strategy paused")
     
     with col2:
-        if st.button("⏹️ Stop", key="stop_strategy", use_container_width=True):
-            st.session_state["strategy_status"] = "inactive"
+        if st.button("⏹️ Stop", key="stop_strategy", on_click=_set_strategy_status,
+                     args=("inactive",), use_container_width=True):
             st.warning("Strategy stopped")
     
     # Additional controls
-    with st.sidebar.expander("🔧 Advanced", expanded=False):
+    with st.expander("🔧 Advanced", expanded=False):
         st.checkbox("Auto-trade", value=False, key="auto_trade")
         st.checkbox("Paper trading", value=True, key="paper_trading")
         st.slider("Risk level", 1, 10, 5, key="risk_level")
 
 
-def render_export_controls(data_handler: Any) -> Optional[str]:
+@st.cache_data(ttl=30, show_spinner=False)
+def _pnl_csv(pnl_data: pd.DataFrame) -> bytes:
+    """Export the P&L history; repeat clicks on unchanged history are free."""
+    return ExportManager.export_pnl_csv(pnl_data)
+
+
+def _stage_download(
+    kind: str,
+    label: str,
+    data: bytes,
+    file_prefix: str,
+    stamp: str,
+    mime: str = "text/csv",
+    extension: str = "csv",
+) -> None:
+    """
+    Keep a generated export in session state until it is replaced.
+    
+    The download button is then drawn on every rerun from the stored
+    bytes, instead of vanishing after the click that created it.
+    
+    Args:
+        kind: Export name, also used for the download button key
+        label: Download button label
+        data: File contents
+        file_prefix: File name prefix
+        stamp: Timestamp added to the file name
+        mime: MIME type of the file
+        extension: File name extension
+    """
+    st.session_state.setdefault("export_downloads", {})[kind] = {
+        "label": label,
+        "data": data,
+        "file_name": f"{file_prefix}_{stamp}.{extension}",
+        "mime": mime,
+    }
+
+
+@st.fragment
+def render_export_controls(data_handler: Any) -> None:
     """
     Render export functionality controls.
     
+    Data is only fetched and exported when a button is pressed; the
+    result stays downloadable until that export is run again.
+    
     Args:
         data_handler: DashboardDataHandler instance
-    
-    Returns:
-        Export action taken or None
     """
-    st.sidebar.subheader("📥 Export")
+    st.subheader("📥 Export")
     
-    export_action = None
+    stamp = datetime.now().strftime('%Y%m%d_%H%M%S')
     
-    col1, col2 = st.sidebar.columns(2)
+    col1, col2 = st.columns(2)
     
     with col1:
         if st.button("📊 Positions", key="export_positions", use_container_width=True):
             positions = data_handler.get_positions()
-            csv_data = ExportManager.export_positions_csv(positions)
-            st.sidebar.download_button(
-                label="⬇️ Download CSV",
-                data=csv_data,
-                file_name=f"positions_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
-                mime="text/csv",
-                key="download_positions"
+            _stage_download(
+                "positions",
+                "⬇️ Download CSV",
+                ExportManager.export_positions_csv(positions),
+                "positions",
+                stamp,
             )
-            export_action = "positions"
     
     with col2:
         if st.button("📜 Orders", key="export_orders", use_container_width=True):
             orders = data_handler.get_order_history()
-            csv_data = ExportManager.export_orders_csv(orders)
-            st.sidebar.download_button(
-                label="⬇️ Download CSV",
-                data=csv_data,
-                file_name=f"orders_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
-                mime="text/csv",
-                key="download_orders"
+            _stage_download(
+                "orders",
+                "⬇️ Download CSV",
+                ExportManager.export_orders_csv(orders),
+                "orders",
+                stamp,
             )
-            export_action = "orders"
     
     # P&L Export
-    if st.sidebar.button("💰 P&L Statement", key="export_pnl", use_container_width=True):
+    if st.button("💰 P&L Statement", key="export_pnl", use_container_width=True):
         pnl_data = data_handler.get_pnl_history()
-        csv_data = ExportManager.export_pnl_csv(pnl_data)
-        st.sidebar.download_button(
-            label="⬇️ Download P&L CSV",
-            data=csv_data,
-            file_name=f"pnl_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
-            mime="text/csv",
-            key="download_pnl"
-        )
-        export_action = "pnl"
+        _stage_download("pnl", "⬇️ Download P&L CSV", _pnl_csv(pnl_data), "pnl", stamp)
     
     # Full Report
-    if st.sidebar.button("📋 Full Report", key="export_report", use_container_width=True):
+    if st.button("📋 Full Report", key="export_report", use_container_width=True):
         pnl_data = data_handler.get_pnl_history()
         positions = data_handler.get_positions()
         risk_metrics = data_handler.get_risk_metrics()
@@ -272,33 +337,48 @@ def render_export_controls(data_handler: Any) -> Optional[str]:
             pnl_data, positions, risk_metrics
         )
         
-        st.sidebar.download_button(
-            label="⬇️ Download Report",
-            data=report.encode('utf-8'),
-            file_name=f"trading_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt",
+        _stage_download(
+            "report",
+            "⬇️ Download Report",
+            report.encode('utf-8'),
+            "trading_report",
+            stamp,
             mime="text/plain",
-            key="download_report"
+            extension="txt",
         )
-        export_action = "report"
     
-    return export_action
+    # Downloads prepared by this or an earlier run
+    for kind, download in st.session_state.get("export_downloads", {}).items():
+        st.download_button(key=f"download_{kind}", **download)
+
+
+def _clear_alerts() -> None:
+    """
+    Button callback clearing the session's alerts.
+    
+    Clears through the manager so the category index and unread count
+    stay in step with the bounded history. The rerun replaces the click's
+    fragment rerun with one full rerun, so the alerts tab and unread
+    count drop the cleared alerts too.
+    """
+    get_alert_manager().clear_alerts()
+    st.rerun()
 
 
+@st.fragment
 def render_quick_actions() -> None:
     """Render quick action buttons."""
-    st.sidebar.subheader("⚡ Quick Actions")
+    st.subheader("⚡ Quick Actions")
     
-    col1, col2 = st.sidebar.columns(2)
+    col1, col2 = st.columns(2)
     
     with col1:
         if st.button("🔄 Refresh", key="sidebar_refresh_data", use_container_width=True):
             st.rerun()
     
     with col2:
-        if st.button("🗑️ Clear Alerts", key="sidebar_clear_alerts", use_container_width=True):
-            if "alerts" in st.session_state:
-                st.session_state.alerts = []
-            st.success("Alerts cleared")
+        st.button("🗑️ Clear Alerts", key="sidebar_clear_alerts",
+                  on_click=_clear_alerts, use_container_width=True)
 
 
 def render_underlying_selector(data_handler: Any) -> str:
@@ -331,19 +411,20 @@ def render_date_range_selector() -> tuple:
     """
     st.sidebar.subheader("📅 Date Range")
     
+    now = datetime.now()
     col1, col2 = st.sidebar.columns(2)
     
     with col1:
         start_date = st.date_input(
             "Start",
-            value=datetime.now().replace(day=1),
+            value=now.replace(day=1),
             key="start_date"
         )
     
     with col2:
         end_date = st.date_input(
             "End",
-            value=datetime.now(),
+            value=now,
             key="end_date"
         )
     
@@ -9,13 +9,139 @@ Provides table components for the trading dashboard including:
 
 import streamlit as st
 import pandas as pd
-from typing import List, Dict, Any, Optional, Callable
+import numpy as np
+from functools import lru_cache
+from operator import attrgetter
+from types import MappingProxyType
+from typing import List, Dict, Any, Optional, Callable, Mapping, Tuple
 from datetime import datetime
 
 from ..utils.theme import ThemeManager
 from .metrics import format_compact_number
 
 
+@lru_cache(maxsize=2)
+def _table_styles(theme: str) -> Mapping[str, Any]:
+    """
+    Build the cell CSS used by the tables once per theme.
+    
+    Args:
+        theme: Theme name ('dark' or 'light')
+    
+    Returns:
+        Read-only mapping of sign styles and side/status lookups
+    """
+    colors = ThemeManager.get_colors(theme)
+    profit = f"color: {colors['profit_color']}"
+    loss = f"color: {colors['loss_color']}"
+    
+    return MappingProxyType({
+        "profit": profit,
+        "loss": loss,
+        "profit_bold": f"{profit}; font-weight: bold;",
+        "loss_bold": f"{loss}; font-weight: bold;",
+        "side": MappingProxyType({
+            "BUY": f"{profit}; font-weight: bold;",
+            "SELL": f"{loss}; font-weight: bold;",
+        }),
+        "status": MappingProxyType({
+            "Filled": f"{profit};",
+            "Cancelled": f"{loss};",
+            "Pending": f"color: {colors['warning']};",
+        }),
+    })
+
+
+def _sign_styles(col: pd.Series, positive: str, negative: str) -> np.ndarray:
+    """
+    Style a whole numeric column by sign for Styler.apply.
+    
+    Zero and non-numeric cells are left unstyled.
+    
+    Args:
+        col: Column being styled
+        positive: CSS for values above zero
+        negative: CSS for values below zero
+    
+    Returns:
+        Array of CSS strings, one per cell
+    """
+    values = pd.to_numeric(col, errors="coerce")
+    return np.select([values > 0, values < 0], [positive, negative], default="")
+
+
+def _value_styles(col: pd.Series, styles: Mapping[str, str]) -> pd.Series:
+    """
+    Style a column by looking each value up in styles, for Styler.apply.
+    
+    Args:
+        col: Column being styled
+        styles: CSS per cell value; other values are left unstyled
+    
+    Returns:
+        Series of CSS strings, one per cell
+    """
+    return col.map(styles).fillna("")
+
+
+# Position fields shown in the tables, with the value used when a
+# position dict leaves one out
+_POSITION_DEFAULTS = {
+    "symbol": "",
+    "position_type": "",
+    "quantity": 0,
+    "entry_price": 0.0,
+    "current_price": 0.0,
+    "unrealized_pnl": 0.0,
+    "delta": 0.0,
+    "gamma": 0.0,
+    "theta": 0.0,
+    "vega": 0.0,
+    "expiry": None,
+}
+_POSITION_FIELDS = tuple(_POSITION_DEFAULTS)
+_get_position_fields = attrgetter(*_POSITION_FIELDS)
+
+
+def _positions_frame(positions: List[Any]) -> pd.DataFrame:
+    """
+    Collect position fields into one column-per-field DataFrame.
+    
+    Checks once whether the positions are dicts or objects (such as
+    PositionData) rather than probing every field of every row.
+    
+    Args:
+        positions: Non-empty list of PositionData objects or dicts
+    
+    Returns:
+        DataFrame with one column per entry in _POSITION_FIELDS
+    """
+    if isinstance(positions[0], Mapping):
+        df = pd.DataFrame.from_records(positions).reindex(columns=_POSITION_FIELDS)
+        df = df.fillna({k: v for k, v in _POSITION_DEFAULTS.items() if v is not None})
+        return df.astype({"quantity": "int64"})
+    
+    return _position_rows_frame(tuple(_get_position_fields(pos) for pos in positions))
+
+
+@st.cache_data(ttl=2, max_entries=8, show_spinner=False)
+def _position_rows_frame(rows: Tuple[tuple, ...]) -> pd.DataFrame:
+    """
+    Build the positions frame, reused while the position values are unchanged.
+    
+    Keyed on the field values themselves, so reruns from unrelated widget
+    interactions skip the DataFrame construction. Each caller gets its
+    own copy of the cached frame.
+    
+    Args:
+        rows: One tuple of _POSITION_FIELDS values per position
+    
+    Returns:
+        DataFrame with one column per entry in _POSITION_FIELDS
+    """
+    return pd.DataFrame.from_records(list(rows), columns=_POSITION_FIELDS)
+
+
 def render_position_table(
     positions: List[Any],
     on_close_position: Optional[Callable] = None,
@@ -31,51 +157,36 @@ def render_position_table(
         st.info("📭 No open positions")
         return
     
-    colors = ThemeManager.get_colors()
-    
-    # Convert positions to DataFrame
-    data = []
-    for pos in positions:
-        # Determine P&L color
-        pnl = pos.unrealized_pnl if hasattr(pos, 'unrealized_pnl') else pos.get('unrealized_pnl', 0)
-        pnl_color = colors["profit_color"] if pnl >= 0 else colors["loss_color"]
-        
-        # Format expiry
-        expiry = pos.expiry if hasattr(pos, 'expiry') else pos.get('expiry')
-        if expiry:
-            days_to_expiry = (expiry - datetime.now()).days
-            expiry_str = f"{expiry.strftime('%d %b')} ({days_to_expiry}d)"
-        else:
-            expiry_str = "N/A"
-        
-        data.append({
-            "Symbol": pos.symbol if hasattr(pos, 'symbol') else pos.get('symbol', ''),
-            "Type": pos.position_type if hasattr(pos, 'position_type') else pos.get('position_type', ''),
-            "Qty": pos.quantity if hasattr(pos, 'quantity') else pos.get('quantity', 0),
-            "Entry": f"₹{pos.entry_price:,.2f}" if hasattr(pos, 'entry_price') else f"₹{pos.get('entry_price', 0):,.2f}",
-            "Current": f"₹{pos.current_price:,.2f}" if hasattr(pos, 'current_price') else f"₹{pos.get('current_price', 0):,.2f}",
-            "P&L": pnl,
-            "Δ": pos.delta if hasattr(pos, 'delta') else pos.get('delta', 0),
-            "Γ": pos.gamma if hasattr(pos, 'gamma') else pos.get('gamma', 0),
-            "Θ": pos.theta if hasattr(pos, 'theta') else pos.get('theta', 0),
-            "V": pos.vega if hasattr(pos, 'vega') else pos.get('vega', 0),
-            "Expiry": expiry_str,
-        })
-    
-    df = pd.DataFrame(data)
-    
-    # Format columns
-    def format_pnl(val):
-        color = colors["profit_color"] if val >= 0 else colors["loss_color"]
-        return f'<span style="color: {color}; font-weight: bold;">₹{val:,.2f}</span>'
+    styles = _table_styles(ThemeManager.get_current_theme())
+    
+    # Convert positions to DataFrame; prices stay numeric for the Styler
+    positions_df = _positions_frame(positions)
+    expiry = pd.to_datetime(positions_df["expiry"])
+    days_to_expiry = (expiry - datetime.now()).dt.days.astype("Int64").astype(str)
+    expiry_str = (expiry.dt.strftime("%d %b") + " (" + days_to_expiry + "d)").fillna("N/A")
+    
+    df = pd.DataFrame({
+        "Symbol": positions_df["symbol"],
+        "Type": positions_df["position_type"],
+        "Qty": positions_df["quantity"],
+        "Entry": positions_df["entry_price"],
+        "Current": positions_df["current_price"],
+        "P&L": positions_df["unrealized_pnl"],
+        "Δ": positions_df["delta"],
+        "Γ": positions_df["gamma"],
+        "Θ": positions_df["theta"],
+        "V": positions_df["vega"],
+        "Expiry": expiry_str,
+    })
     
     # Create styled table
     st.markdown("### 📊 Open Positions")
     
     # Display summary metrics
-    total_pnl = sum(d["P&L"] for d in data)
-    total_delta = sum(d["Δ"] for d in data)
-    total_theta = sum(d["Θ"] for d in data)
+    totals = df[["P&L", "Δ", "Θ"]].sum()
+    total_pnl = totals["P&L"]
+    total_delta = totals["Δ"]
+    total_theta = totals["Θ"]
     
     col1, col2, col3, col4 = st.columns(4)
     with col1:
@@ -92,16 +203,18 @@ def render_position_table(
     # Display the table with custom styling
     st.dataframe(
         df.style.format({
+            "Entry": "₹{:,.2f}",
+            "Current": "₹{:,.2f}",
             "P&L": "₹{:,.2f}",
             "Δ": "{:.4f}",
             "Γ": "{:.6f}",
             "Θ": "{:.2f}",
             "V": "{:.2f}",
-        }).applymap(
-            lambda x: f"color: {colors['profit_color']}" if isinstance(x, (int, float)) and x > 0 else (
-                f"color: {colors['loss_color']}" if isinstance(x, (int, float)) and x < 0 else ""
-            ),
-            subset=["P&L"]
+        }).apply(
+            _sign_styles,
+            positive=styles["profit"],
+            negative=styles["loss"],
+            subset=["P&L"],
         ),
         use_container_width=True,
         hide_index=True,
@@ -111,13 +224,47 @@ def render_position_table(
     if on_close_position:
         st.markdown("#### Quick Close")
         cols = st.columns(min(len(positions), 4))
-        for i, pos in enumerate(positions):
+        for i, symbol in enumerate(positions_df["symbol"]):
             with cols[i % 4]:
-                symbol = pos.symbol if hasattr(pos, 'symbol') else pos.get('symbol', '')
                 if st.button(f"Close {symbol[:20]}...", key=f"close_{symbol}", use_container_width=True):
                     on_close_position(symbol)
 
 
+# Order fields shown in the order log, with the value used when an order
+# dict leaves one out
+_ORDER_DEFAULTS = {
+    "order_id": "",
+    "timestamp": None,
+    "symbol": "",
+    "side": "",
+    "quantity": 0,
+    "order_type": "",
+    "price": 0.0,
+    "status": "",
+}
+
+
+# Lookback for the order log's period filters, counted from midnight today
+_ORDER_LOOKBACKS = {
+    "Last 7 Days": pd.Timedelta(days=7),
+    "Last 30 Days": pd.Timedelta(days=30),
+}
+
+
+def _orders_frame(orders: List[Dict[str, Any]]) -> pd.DataFrame:
+    """
+    Load order dicts into one DataFrame for masking and display.
+    
+    Args:
+        orders: Non-empty list of order dictionaries
+    
+    Returns:
+        DataFrame with one column per entry in _ORDER_DEFAULTS
+    """
+    df = pd.DataFrame.from_records(orders).reindex(columns=list(_ORDER_DEFAULTS))
+    return df.fillna({k: v for k, v in _ORDER_DEFAULTS.items() if v is not None})
+
+
 def render_order_log(
     orders: List[Dict[str, Any]],
     max_rows: int = 50,
@@ -135,10 +282,16 @@ def render_order_log(
         st.info("📭 No orders in history")
         return
     
-    colors = ThemeManager.get_colors()
+    styles = _table_styles(ThemeManager.get_current_theme())
     
     st.markdown("### 📜 Order Log")
     
+    now = datetime.now()
+    orders_df = _orders_frame(orders)
+    # Missing or unparseable timestamps become NaT: shown blank and never
+    # matched by the period filters
+    timestamps = pd.to_datetime(orders_df["timestamp"], errors="coerce")
+    
     # Filters
     if show_filters:
         col1, col2, col3 = st.columns(3)
@@ -164,84 +317,69 @@ def render_order_log(
                 key="order_period_filter"
             )
         
-        # Apply filters
-        filtered_orders = orders.copy()
+        # Apply filters as boolean masks; with every filter on "All" the
+        # frame is used as-is instead of being copied through a full mask
+        masks = []
         
         if status_filter != "All":
-            filtered_orders = [o for o in filtered_orders if o.get("status") == status_filter]
+            masks.append(orders_df["status"] == status_filter)
         
         if side_filter != "All":
-            filtered_orders = [o for o in filtered_orders if o.get("side") == side_filter]
+            masks.append(orders_df["side"] == side_filter)
         
         if days_filter == "Today":
-            today = datetime.now().date()
-            filtered_orders = [o for o in filtered_orders 
-                             if o.get("timestamp", datetime.now()).date() == today]
-        elif days_filter == "Last 7 Days":
-            cutoff = datetime.now().replace(hour=0, minute=0, second=0) - pd.Timedelta(days=7)
-            filtered_orders = [o for o in filtered_orders 
-                             if o.get("timestamp", datetime.now()) >= cutoff]
-        elif days_filter == "Last 30 Days":
-            cutoff = datetime.now().replace(hour=0, minute=0, second=0) - pd.Timedelta(days=30)
-            filtered_orders = [o for o in filtered_orders 
-                             if o.get("timestamp", datetime.now()) >= cutoff]
-    else:
-        filtered_orders = orders
+            masks.append(timestamps.dt.date == now.date())
+        elif days_filter in _ORDER_LOOKBACKS:
+            midnight = now.replace(hour=0, minute=0, second=0, microsecond=0)
+            masks.append(timestamps >= midnight - _ORDER_LOOKBACKS[days_filter])
+        
+        if masks:
+            mask = np.logical_and.reduce(masks)
+            orders_df = orders_df[mask]
+            timestamps = timestamps[mask]
     
     # Limit rows
-    filtered_orders = filtered_orders[:max_rows]
+    orders_df = orders_df.head(max_rows)
     
-    if not filtered_orders:
+    if orders_df.empty:
         st.info("No orders match the selected filters")
         return
     
-    # Convert to DataFrame
-    df = pd.DataFrame([{
-        "Order ID": o.get("order_id", ""),
-        "Time": o.get("timestamp", "").strftime("%Y-%m-%d %H:%M") if isinstance(o.get("timestamp"), datetime) else str(o.get("timestamp", "")),
-        "Symbol": o.get("symbol", ""),
-        "Side": o.get("side", ""),
-        "Qty": o.get("quantity", 0),
-        "Type": o.get("order_type", ""),
-        "Price": o.get("price", 0),
-        "Status": o.get("status", ""),
-    } for o in filtered_orders])
+    # Convert to display DataFrame
+    df = pd.DataFrame({
+        "Order ID": orders_df["order_id"],
+        "Time": timestamps.head(max_rows).dt.strftime("%Y-%m-%d %H:%M").fillna(""),
+        "Symbol": orders_df["symbol"],
+        "Side": orders_df["side"],
+        "Qty": orders_df["quantity"],
+        "Type": orders_df["order_type"],
+        "Price": orders_df["price"],
+        "Status": orders_df["status"],
+    })
     
     # Style based on side and status
-    def style_side(val):
-        if val == "BUY":
-            return f"color: {colors['profit_color']}; font-weight: bold;"
-        elif val == "SELL":
-            return f"color: {colors['loss_color']}; font-weight: bold;"
-        return ""
-    
-    def style_status(val):
-        if val == "Filled":
-            return f"color: {colors['profit_color']};"
-        elif val == "Cancelled":
-            return f"color: {colors['loss_color']};"
-        elif val == "Pending":
-            return f"color: {colors['warning']};"
-        return ""
+    styled = (
+        df.style.format({"Price": "₹{:,.2f}"})
+        .apply(_value_styles, styles=styles["side"], subset=["Side"])
+        .apply(_value_styles, styles=styles["status"], subset=["Status"])
+    )
     
     # Display table
     st.dataframe(
-        df.style.format({
-            "Price": "₹{:,.2f}",
-        }).applymap(style_side, subset=["Side"]).applymap(style_status, subset=["Status"]),
+        styled,
         use_container_width=True,
         hide_index=True,
-        height=min(len(filtered_orders) * 35 + 38, 400),
+        height=min(len(df) * 35 + 38, 400),
     )
     
     # Summary
-    filled_orders = [o for o in filtered_orders if o.get("status") == "Filled"]
-    buy_orders = [o for o in filled_orders if o.get("side") == "BUY"]
-    sell_orders = [o for o in filled_orders if o.get("side") == "SELL"]
+    filled = df["Status"] == "Filled"
+    filled_sides = df.loc[filled, "Side"].value_counts()
     
     st.caption(
-        f"Showing {len(filtered_orders)} of {len(orders)} orders | "
-        f"Filled: {len(filled_orders)} | Buys: {len(buy_orders)} | Sells: {len(sell_orders)}"
+        f"Showing {len(df)} of {len(orders)} orders | "
+        f"Filled: {filled.sum()} | Buys: {filled_sides.get('BUY', 0)} | "
+        f"Sells: {filled_sides.get('SELL', 0)}"
     )
 
 
@@ -260,7 +398,7 @@ def render_trade_history(
         st.info("📭 No completed trades")
         return
     
-    colors = ThemeManager.get_colors()
+    styles = _table_styles(ThemeManager.get_current_theme())
     
     st.markdown("### 📈 Trade History")
     
@@ -287,11 +425,11 @@ def render_trade_history(
             "Exit": "₹{:,.2f}",
             "P&L": "₹{:,.2f}",
             "Return": "{:.2%}",
-        }).applymap(
-            lambda x: f"color: {colors['profit_color']}; font-weight: bold;" if isinstance(x, (int, float)) and x > 0 else (
-                f"color: {colors['loss_color']}; font-weight: bold;" if isinstance(x, (int, float)) and x < 0 else ""
-            ),
-            subset=["P&L", "Return"]
+        }).apply(
+            _sign_styles,
+            positive=styles["profit_bold"],
+            negative=styles["loss_bold"],
+            subset=["P&L", "Return"],
         ),
         use_container_width=True,
         hide_index=True,
@@ -299,12 +437,13 @@ def render_trade_history(
     
     # Trade statistics
     if trades:
-        total_pnl = sum(t.get("pnl", 0) for t in trades)
-        winning_trades = [t for t in trades if t.get("pnl", 0) > 0]
-        win_rate = len(winning_trades) / len(trades) * 100 if trades else 0
-        avg_winner = sum(t.get("pnl", 0) for t in winning_trades) / len(winning_trades) if winning_trades else 0
-        losing_trades = [t for t in trades if t.get("pnl", 0) < 0]
-        avg_loser = sum(t.get("pnl", 0) for t in losing_trades) / len(losing_trades) if losing_trades else 0
+        pnl = df["P&L"]
+        winners = pnl[pnl > 0]
+        losers = pnl[pnl < 0]
+        total_pnl = pnl.sum()
+        win_rate = len(winners) / len(pnl) * 100
+        avg_winner = winners.mean() if len(winners) else 0
+        avg_loser = losers.mean() if len(losers) else 0
         
         col1, col2, col3, col4 = st.columns(4)
         with col1:
@@ -330,32 +469,21 @@ def render_greeks_table(positions: List[Any]) -> None:
     
     st.markdown("### 🔢 Greeks Breakdown")
     
-    data = []
-    for pos in positions:
-        qty = pos.quantity if hasattr(pos, 'quantity') else pos.get('quantity', 0)
-        data.append({
-            "Position": pos.symbol if hasattr(pos, 'symbol') else pos.get('symbol', ''),
-            "Delta": pos.delta if hasattr(pos, 'delta') else pos.get('delta', 0),
-            "Gamma": pos.gamma if hasattr(pos, 'gamma') else pos.get('gamma', 0),
-            "Theta": pos.theta if hasattr(pos, 'theta') else pos.get('theta', 0),
-            "Vega": pos.vega if hasattr(pos, 'vega') else pos.get('vega', 0),
-            "Position Delta": (pos.delta if hasattr(pos, 'delta') else pos.get('delta', 0)) * qty,
-            "Position Theta": (pos.theta if hasattr(pos, 'theta') else pos.get('theta', 0)) * qty,
-        })
+    positions_df = _positions_frame(positions)
+    df = pd.DataFrame({
+        "Position": positions_df["symbol"],
+        "Delta": positions_df["delta"],
+        "Gamma": positions_df["gamma"],
+        "Theta": positions_df["theta"],
+        "Vega": positions_df["vega"],
+        "Position Delta": positions_df["delta"] * positions_df["quantity"],
+        "Position Theta": positions_df["theta"] * positions_df["quantity"],
+    })
     
     # Add totals row
-    total_row = {
-        "Position": "**TOTAL**",
-        "Delta": sum(d["Delta"] for d in data),
-        "Gamma": sum(d["Gamma"] for d in data),
-        "Theta": sum(d["Theta"] for d in data),
-        "Vega": sum(d["Vega"] for d in data),
-        "Position Delta": sum(d["Position Delta"] for d in data),
-        "Position Theta": sum(d["Position Theta"] for d in data),
-    }
-    data.append(total_row)
-    
-    df = pd.DataFrame(data)
+    total_row = df.drop(columns="Position").sum().to_dict()
+    total_row["Position"] = "**TOTAL**"
+    df.loc[len(df)] = total_row
     
     st.dataframe(
         df.style.format({
@@ -29,6 +29,7 @@ logger = logging.getLogger(__name__)
 
 # Configuration constants for demo data generation
 PRICE_NOISE_FACTOR = 0.001  # Noise factor for simulating price movements
+VECTORIZE_MIN_POSITIONS = 16  # Below this, plain Python sums beat numpy call overhead
 DEMO_RANDOM_SEED = 42  # Random seed for reproducible demo data
 
 
@@ -164,8 +165,9 @@ class DashboardDataHandler:
         self.initial_capital = initial_capital
         self.current_capital = initial_capital
         
-        # Cache for performance
-        self._data_cache: Dict[str, pd.DataFrame] = {}
+        # Frames built from the P&L history, one (history length, frame)
+        # entry per kind; cleared whenever history rows change
+        self._data_cache: Dict[str, Tuple[int, pd.DataFrame]] = {}
         self._last_update: Optional[datetime] = None
         
         # Simulated data for demo
@@ -173,6 +175,13 @@ class DashboardDataHandler:
         self._order_history: List[Dict[str, Any]] = []
         self._positions: List[PositionData] = []
         
+        # Column-wise Greeks for self._positions, one row per position:
+        # [delta, gamma, theta, vega, quantity], plus unrealized P&L.
+        # Kept in step with self._positions so totals are a single
+        # vectorized reduction.
+        self._greeks_soa: np.ndarray = np.empty((0, 5))
+        self._unrealized_pnl: np.ndarray = np.empty(0)
+        
         # Real-time data support
         self._use_realtime = use_realtime
         self._realtime_manager = None
@@ -319,20 +328,27 @@ class DashboardDataHandler:
     def _initialize_sample_data(self) -> None:
         """Initialize sample data for demonstration."""
         np.random.seed(DEMO_RANDOM_SEED)
+        now = datetime.now()
         
         # Generate sample P&L history
-        dates = pd.date_range(end=datetime.now(), periods=60, freq='D')
-        cumulative_pnl = 0
+        dates = pd.date_range(end=now, periods=60, freq='D')
+        daily_pnl = np.random.normal(2000, 5000, len(dates))
+        cumulative_pnl = np.cumsum(daily_pnl)
+        equity = self.initial_capital + cumulative_pnl
         
-        for i, date in enumerate(dates):
-            daily_pnl = np.random.normal(2000, 5000)
-            cumulative_pnl += daily_pnl
-            self._pnl_history.append({
+        self._pnl_history.extend(
+            {
                 "date": date,
-                "daily_pnl": daily_pnl,
-                "cumulative_pnl": cumulative_pnl,
-                "equity": self.initial_capital + cumulative_pnl,
-            })
+                "daily_pnl": daily,
+                "cumulative_pnl": cumulative,
+                "equity": eq,
+            }
+            for date, daily, cumulative, eq in zip(
+                dates, daily_pnl.tolist(), cumulative_pnl.tolist(), equity.tolist()
+            )
+        )
+        
+        self._data_cache.clear()
         
         # Update current capital
         if self._pnl_history:
@@ -344,7 +360,7 @@ class DashboardDataHandler:
         instruments = ["NIFTY", "BANKNIFTY"]
         
         for i in range(20):
-            order_date = datetime.now() - timedelta(days=np.random.randint(1, 30))
+            order_date = now - timedelta(days=np.random.randint(1, 30))
             instrument = np.random.choice(instruments)
             lot_size = INSTRUMENT_CONFIG[instrument]["lot_size"]
             
@@ -364,10 +380,15 @@ class DashboardDataHandler:
         self._order_history.sort(key=lambda x: x["timestamp"], reverse=True)
         
         # Generate sample positions
-        self._generate_sample_positions()
+        self._generate_sample_positions(now)
     
-    def _generate_sample_positions(self) -> None:
-        """Generate sample positions for demonstration."""
+    def _generate_sample_positions(self, now: datetime) -> None:
+        """
+        Generate sample positions for demonstration.
+        
+        Args:
+            now: Reference time for entry and expiry dates
+        """
         # Sample strangle positions
         positions = [
             {
@@ -381,7 +402,7 @@ class DashboardDataHandler:
                 "gamma": 0.002,
                 "theta": -8.5,
                 "vega": 12.3,
-                "expiry": datetime.now() + timedelta(days=15),
+                "expiry": now + timedelta(days=15),
             },
             {
                 "symbol": "BANKNIFTY_25DEC_44500C_42500P",
@@ -394,7 +415,7 @@ class DashboardDataHandler:
                 "gamma": 0.001,
                 "theta": -12.2,
                 "vega": 18.5,
-                "expiry": datetime.now() + timedelta(days=22),
+                "expiry": now + timedelta(days=22),
             },
             {
                 "symbol": "NIFTY_25DEC_20000C_18000P",
@@ -407,7 +428,7 @@ class DashboardDataHandler:
                 "gamma": 0.003,
                 "theta": -6.8,
                 "vega": 9.2,
-                "expiry": datetime.now() + timedelta(days=8),
+                "expiry": now + timedelta(days=8),
             },
         ]
         
@@ -425,9 +446,55 @@ class DashboardDataHandler:
                 gamma=pos["gamma"],
                 theta=pos["theta"],
                 vega=pos["vega"],
-                entry_date=datetime.now() - timedelta(days=np.random.randint(5, 20)),
+                entry_date=now - timedelta(days=np.random.randint(5, 20)),
                 expiry=pos["expiry"],
             ))
+        
+        self._rebuild_position_arrays()
+    
+    def _rebuild_position_arrays(self) -> None:
+        """Rebuild the column-wise Greeks and P&L arrays from self._positions."""
+        self._greeks_soa = np.array(
+            [(p.delta, p.gamma, p.theta, p.vega, p.quantity) for p in self._positions],
+            dtype=float,
+        ).reshape(-1, 5)
+        self._unrealized_pnl = np.array(
+            [p.unrealized_pnl for p in self._positions], dtype=float
+        )
+    
+    def get_unrealized_pnl_total(self) -> float:
+        """
+        Get unrealized P&L summed over open positions.
+        
+        Returns:
+            Total unrealized P&L
+        """
+        return float(self._unrealized_pnl.sum())
+    
+    def get_greek_totals(self) -> Tuple[float, float, float, float]:
+        """
+        Get quantity-weighted Greeks summed over open positions.
+        
+        Returns:
+            Tuple of (delta, gamma, theta, vega) totals
+        """
+        greeks = self._greeks_soa
+        if not len(greeks):
+            return 0.0, 0.0, 0.0, 0.0
+        
+        if len(greeks) < VECTORIZE_MIN_POSITIONS:
+            delta = gamma = theta = vega = 0.0
+            for p in self._positions:
+                delta += p.delta * p.quantity
+                gamma += p.gamma * p.quantity
+                theta += p.theta * p.quantity
+                vega += p.vega * p.quantity
+            return delta, gamma, theta, vega
+        
+        # Quantities (N,) @ Greeks (N, 4): one matrix-vector product,
+        # no (N, 4) temporary
+        totals = greeks[:, 4] @ greeks[:, :4]
+        return tuple(float(t) for t in totals)
     
     def get_market_data(self, underlying: str = "NIFTY") -> MarketData:
         """
@@ -493,12 +560,13 @@ class DashboardDataHandler:
             List of PositionData objects
         """
         # Update positions with slight price movement for demo
-        for pos in self._positions:
+        for i, pos in enumerate(self._positions):
             price_change = np.random.normal(0, pos.current_price * 0.02)
             pos.current_price = round(pos.current_price + price_change, 2)
             pos.unrealized_pnl = round(
                 (pos.entry_price - pos.current_price) * pos.quantity, 2
             )
+            self._unrealized_pnl[i] = pos.unrealized_pnl
         
         return self._positions
     
@@ -522,13 +590,10 @@ class DashboardDataHandler:
             cvar_95 = 0.0
         
         # Calculate total Greeks exposure
-        total_delta = sum(p.delta * p.quantity for p in self._positions)
-        total_gamma = sum(p.gamma * p.quantity for p in self._positions)
-        total_theta = sum(p.theta * p.quantity for p in self._positions)
-        total_vega = sum(p.vega * p.quantity for p in self._positions)
+        total_delta, total_gamma, total_theta, total_vega = self.get_greek_totals()
         
         # Calculate other metrics
-        total_unrealized_pnl = sum(p.unrealized_pnl for p in self._positions)
+        total_unrealized_pnl = self.get_unrealized_pnl_total()
         daily_pnl = self._pnl_history[-1]["daily_pnl"] if self._pnl_history else 0
         total_pnl = self._pnl_history[-1]["cumulative_pnl"] if self._pnl_history else 0
         
@@ -539,7 +604,7 @@ class DashboardDataHandler:
         # Calculate drawdown
         if self._pnl_history:
             equity_series = pd.Series([p["equity"] for p in self._pnl_history])
-            peak = equity_series.expanding().max()
+            peak = equity_series.cummax()
             drawdown = ((equity_series - peak) / peak).min()
         else:
             drawdown = 0.0
@@ -559,17 +624,40 @@ class DashboardDataHandler:
             vega_exposure=round(total_vega, 2),
         )
     
+    def _history_frame(self, kind: str, build: Callable[[], pd.DataFrame]) -> pd.DataFrame:
+        """
+        Return a cached history frame, rebuilt when the history length changes.
+        
+        Only the latest frame per kind is kept, so the cache does not grow
+        with the history.
+        
+        Args:
+            kind: Cache entry name
+            build: Builds the frame from the current history
+        
+        Returns:
+            Cached or freshly built DataFrame
+        """
+        length = len(self._pnl_history)
+        cached = self._data_cache.get(kind)
+        if cached is None or cached[0] != length:
+            cached = self._data_cache[kind] = (length, build())
+        return cached[1]
+    
     def get_pnl_history(self) -> pd.DataFrame:
         """
         Get P&L history as DataFrame.
         
+        The frame is cached until the history grows, so reruns reuse it;
+        callers must treat it as read-only.
+        
         Returns:
             DataFrame with P&L history
         """
         if not self._pnl_history:
             return pd.DataFrame()
         
-        return pd.DataFrame(self._pnl_history)
+        return self._history_frame("pnl_history", lambda: pd.DataFrame(self._pnl_history))
     
     def get_order_history(self) -> List[Dict[str, Any]]:
         """
@@ -584,18 +672,24 @@ class DashboardDataHandler:
         """
         Get equity curve data.
         
+        Cached like get_pnl_history(); callers must treat it as read-only.
+        
         Returns:
             DataFrame with equity curve data
         """
         if not self._pnl_history:
             return pd.DataFrame()
         
+        return self._history_frame("equity_curve", self._build_equity_curve)
+    
+    def _build_equity_curve(self) -> pd.DataFrame:
+        """Build the equity curve frame with its drawdown series."""
         df = pd.DataFrame(self._pnl_history)
         df["date"] = pd.to_datetime(df["date"])
         df.set_index("date", inplace=True)
         
         # Calculate drawdown series
-        df["peak"] = df["equity"].expanding().max()
+        df["peak"] = df["equity"].cummax()
         df["drawdown"] = (df["equity"] - df["peak"]) / df["peak"]
         
         return df
@@ -713,6 +807,8 @@ class DashboardDataHandler:
                 
                 # Remove position
                 self._positions.pop(i)
+                self._greeks_soa = np.delete(self._greeks_soa, i, axis=0)
+                self._unrealized_pnl = np.delete(self._unrealized_pnl, i)
                 
                 return order
         
@@ -6,7 +6,9 @@ Supports dark and light themes with persistent preference storage.
 """
 
 import streamlit as st
-from typing import Dict, Any
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Any, Mapping, Optional
 
 
 # Theme color schemes
@@ -108,52 +110,84 @@ class ThemeManager:
         return ThemeManager.get_current_theme() == "dark"
     
     @staticmethod
-    def get_colors() -> Dict[str, str]:
+    def get_colors(theme: Optional[str] = None) -> Dict[str, str]:
         """
-        Get color scheme for current theme.
+        Get color scheme for a theme.
+        
+        Args:
+            theme: Theme name ('dark' or 'light'). Uses current theme if None.
         
         Returns:
             Dictionary of color values
         """
-        return DARK_THEME if ThemeManager.is_dark_theme() else LIGHT_THEME
+        if theme is None:
+            theme = ThemeManager.get_current_theme()
+        return DARK_THEME if theme == "dark" else LIGHT_THEME
     
     @staticmethod
-    def get_plotly_template() -> str:
+    def get_plotly_template(theme: Optional[str] = None) -> str:
         """
-        Get Plotly template name for current theme.
+        Get Plotly template name for a theme.
+        
+        Args:
+            theme: Theme name ('dark' or 'light'). Uses current theme if None.
         
         Returns:
             Plotly template name
         """
-        return "plotly_dark" if ThemeManager.is_dark_theme() else "plotly_white"
+        if theme is None:
+            theme = ThemeManager.get_current_theme()
+        return "plotly_dark" if theme == "dark" else "plotly_white"
     
     @staticmethod
-    def get_chart_colors() -> Dict[str, str]:
+    def get_chart_colors(theme: Optional[str] = None) -> Mapping[str, str]:
         """
-        Get chart-specific colors for current theme.
+        Get chart-specific colors for a theme.
+        
+        Args:
+            theme: Theme name ('dark' or 'light'). Uses current theme if None.
         
         Returns:
-            Dictionary of chart colors
+            Read-only mapping of chart colors, shared between calls
         """
-        colors = ThemeManager.get_colors()
-        return {
-            "background": colors["chart_background"],
-            "grid": colors["grid_color"],
-            "profit": colors["profit_color"],
-            "loss": colors["loss_color"],
-            "text": colors["text"],
-            "primary": colors["primary"],
-        }
+        if theme is None:
+            theme = ThemeManager.get_current_theme()
+        return _chart_colors(theme)
 
 
-def get_custom_css() -> str:
+@lru_cache(maxsize=2)
+def _chart_colors(theme: str) -> Mapping[str, str]:
+    """Build the chart color mapping once per theme."""
+    colors = ThemeManager.get_colors(theme)
+    return MappingProxyType({
+        "background": colors["chart_background"],
+        "grid": colors["grid_color"],
+        "profit": colors["profit_color"],
+        "loss": colors["loss_color"],
+        "text": colors["text"],
+        "primary": colors["primary"],
+    })
+
+
+def get_custom_css(theme: Optional[str] = None) -> str:
     """
     Generate custom CSS based on current theme.
     
+    Args:
+        theme: Theme name ('dark' or 'light'). Uses current theme if None.
+    
     Returns:
         CSS string for styling
     """
-    colors = ThemeManager.get_colors()
+    if theme is None:
+        theme = ThemeManager.get_current_theme()
+    return _build_css(theme)
+
+
+@lru_cache(maxsize=2)
+def _build_css(theme: str) -> str:
+    """Render the CSS template once per theme."""
+    colors = ThemeManager.get_colors(theme)
     
     css = f"""
     <style>
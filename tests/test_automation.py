@@ -32,6 +32,7 @@ from src.automation.data_pipeline import DataPipeline, DataFetchJob
 from src.automation.engine import AutomationEngine, EngineMode, EngineState
 from config.automation_config import (
     AUTOMATION_CONFIG,
+    TRADING_CONFIG_VIEW,
     get_automation_config,
     get_trading_config,
     get_data_config,
@@ -804,6 +805,27 @@ class TestAutomationConfig:
         assert 'symbols' in config
         assert 'intervals' in config
     
+    def test_get_automation_config_read_only(self):
+        """Test default config view rejects mutation."""
+        config = get_trading_config()
+        
+        with pytest.raises(TypeError):
+            config['mode'] = 'live'
+    
+    def test_trading_config_view(self):
+        """Test TRADING_CONFIG_VIEW tracks the trading section."""
+        assert get_trading_config() is TRADING_CONFIG_VIEW
+        assert TRADING_CONFIG_VIEW['strategy_interval_seconds'] == (
+            AUTOMATION_CONFIG['trading']['strategy_interval_seconds']
+        )
+    
+    def test_get_automation_config_mutable_copy(self):
+        """Test mutable config is independent of AUTOMATION_CONFIG."""
+        config = get_automation_config(mutable=True)
+        config['trading']['mode'] = 'live'
+        
+        assert AUTOMATION_CONFIG['trading']['mode'] == 'paper'
+    
     def test_validate_automation_config_valid(self):
         """Test config validation with valid config."""
         config = get_automation_config()
@@ -811,7 +833,7 @@ class TestAutomationConfig:
     
     def test_validate_automation_config_invalid_mode(self):
         """Test config validation with invalid mode."""
-        config = get_automation_config()
+        config = get_automation_config(mutable=True)
         config['trading']['mode'] = 'invalid'
         
         with pytest.raises(ValueError):
@@ -819,7 +841,7 @@ class TestAutomationConfig:
     
     def test_validate_automation_config_invalid_interval(self):
         """Test config validation with invalid interval."""
-        config = get_automation_config()
+        config = get_automation_config(mutable=True)
         config['data']['intervals'] = ['invalid']
         
         with pytest.raises(ValueError):
@@ -827,7 +849,7 @@ class TestAutomationConfig:
     
     def test_validate_automation_config_live_unconfirmed(self):
         """Test config validation for unconfirmed live trading."""
-        config = get_automation_config()
+        config = get_automation_config(mutable=True)
         config['trading']['mode'] = 'live'
         config['trading']['live_trading_confirmed'] = False
         
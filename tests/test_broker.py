@@ -39,7 +39,14 @@ from src.execution.utils import (
     is_market_open,
     get_expiry_dates,
 )
-from config.broker_settings import get_broker_config, validate_config
+from config.broker_settings import (
+    ANGEL_ONE_TOKENS,
+    get_broker_config,
+    get_broker_config_view,
+    get_broker_runtime_config,
+    refresh_env,
+    validate_config,
+)
 
 
 class TestBrokerFactory:
@@ -621,6 +628,58 @@ class TestBrokerConfig:
         assert config['mode'] == "live"
         assert 'api_key' in config
     
+    def test_get_broker_config_returns_copy(self):
+        """Test mutating returned config does not leak into later calls."""
+        config = get_broker_config("paper")
+        config['initial_capital'] = 1
+        
+        assert get_broker_config("paper")['initial_capital'] != 1
+    
+    def test_get_broker_config_live_reads_env(self, monkeypatch):
+        """Test live credentials follow the environment after refresh."""
+        monkeypatch.setenv("ANGEL_ONE_API_KEY", "test-key")
+        refresh_env()
+        try:
+            assert get_broker_config("live")['api_key'] == "test-key"
+            assert get_broker_config_view("live")['api_key'] == "test-key"
+        finally:
+            monkeypatch.delenv("ANGEL_ONE_API_KEY")
+            refresh_env()
+    
+    def test_get_broker_config_view(self):
+        """Test read-only broker config view."""
+        view = get_broker_config_view("live")
+        
+        assert view['mode'] == "live"
+        assert 'api_key' in view
+        with pytest.raises(TypeError):
+            view['mode'] = "paper"
+    
+    def test_get_broker_config_live_tokens(self):
+        """Test live config picks up session tokens from the token store."""
+        assert get_broker_config("live")['feed_token'] is None
+        
+        ANGEL_ONE_TOKENS.update(feed_token="feed", jwt_token="jwt", refresh_token="refresh")
+        try:
+            assert get_broker_config("live")['feed_token'] == "feed"
+            assert get_broker_config_view("live")['jwt_token'] == "jwt"
+            assert 'feed_token' not in get_broker_config("paper")
+        finally:
+            ANGEL_ONE_TOKENS.clear()
+        
+        assert get_broker_config_view("live")['refresh_token'] is None
+    
+    def test_get_broker_runtime_config(self):
+        """Test named tuple runtime config matches the dict config."""
+        runtime = get_broker_runtime_config("live")
+        
+        assert runtime.mode == "live"
+        assert runtime.max_retries == get_broker_config("live")['max_retries']
+        assert get_broker_runtime_config("paper").mode == "paper"
+        assert get_broker_runtime_config("live") is runtime
+        with pytest.raises(AttributeError):
+            runtime.mode = "paper"
+    
     def test_validate_config_paper_valid(self):
         """Test validating paper config."""
         config = {
@@ -7,6 +7,8 @@ Tests for the trading dashboard including:
 - Theme management
 """
 
+import base64
+import json
 import pytest
 import pandas as pd
 import numpy as np
@@ -23,7 +25,7 @@ from dashboard.utils.data_handler import (
     PositionData,
 )
 from dashboard.utils.export import ExportManager
-from dashboard.utils.theme import ThemeManager, DARK_THEME, LIGHT_THEME
+from dashboard.utils.theme import ThemeManager, DARK_THEME, LIGHT_THEME, get_custom_css
 
 
 class TestDashboardDataHandler:
@@ -94,6 +96,20 @@ class TestDashboardDataHandler:
             assert "daily_pnl" in pnl_history.columns
             assert "cumulative_pnl" in pnl_history.columns
     
+    def test_pnl_history_cached(self, data_handler):
+        """Test the history frames are reused until the history grows."""
+        pnl_history = data_handler.get_pnl_history()
+        equity = data_handler.get_equity_curve()
+        
+        assert data_handler.get_pnl_history() is pnl_history
+        assert data_handler.get_equity_curve() is equity
+        
+        data_handler._pnl_history.append(dict(data_handler._pnl_history[-1]))
+        
+        assert len(data_handler.get_pnl_history()) == len(pnl_history) + 1
+        assert len(data_handler.get_equity_curve()) == len(equity) + 1
+        assert len(data_handler._data_cache) == 2
+    
     def test_get_order_history(self, data_handler):
         """Test getting order history."""
         orders = data_handler.get_order_history()
@@ -162,6 +178,45 @@ class TestDashboardDataHandler:
             new_positions = data_handler.get_positions()
             assert len(new_positions) == initial_count - 1
     
+    def test_get_greek_totals(self, data_handler):
+        """Test vectorized Greek totals match per-position sums."""
+        positions = data_handler.get_positions()
+        expected = sum(p.delta * p.quantity for p in positions)
+        
+        delta, gamma, theta, vega = data_handler.get_greek_totals()
+        assert delta == pytest.approx(expected)
+        assert vega == pytest.approx(sum(p.vega * p.quantity for p in positions))
+        
+        data_handler.close_position(positions[0].symbol)
+        remaining = data_handler.get_positions()
+        delta, _, _, _ = data_handler.get_greek_totals()
+        assert delta == pytest.approx(sum(p.delta * p.quantity for p in remaining))
+    
+    def test_get_unrealized_pnl_total(self, data_handler):
+        """Test unrealized P&L total tracks price updates and closes."""
+        positions = data_handler.get_positions()
+        assert data_handler.get_unrealized_pnl_total() == pytest.approx(
+            sum(p.unrealized_pnl for p in positions)
+        )
+        
+        data_handler.close_position(positions[0].symbol)
+        positions = data_handler.get_positions()
+        assert data_handler.get_unrealized_pnl_total() == pytest.approx(
+            sum(p.unrealized_pnl for p in positions)
+        )
+    
+    def test_get_greek_totals_vectorized(self, data_handler):
+        """Test large position lists use the vectorized path correctly."""
+        from dashboard.utils.data_handler import VECTORIZE_MIN_POSITIONS
+        
+        positions = data_handler.get_positions()
+        data_handler._positions = positions * VECTORIZE_MIN_POSITIONS
+        data_handler._rebuild_position_arrays()
+        
+        delta, gamma, theta, vega = data_handler.get_greek_totals()
+        expected = sum(p.theta * p.quantity for p in data_handler._positions)
+        assert theta == pytest.approx(expected)
+    
     def test_get_equity_curve(self, data_handler):
         """Test getting equity curve."""
         equity = data_handler.get_equity_curve()
@@ -358,6 +413,26 @@ class TestThemeManager:
         assert "profit" in chart_colors
         assert "loss" in chart_colors
         assert "text" in chart_colors
+    
+    def test_chart_colors_cached_per_theme(self):
+        """Test chart colors are built once per theme and read-only."""
+        dark = ThemeManager.get_chart_colors("dark")
+        
+        assert ThemeManager.get_chart_colors("dark") is dark
+        assert ThemeManager.get_chart_colors("light") is not dark
+        assert dark["profit"] == DARK_THEME["profit_color"]
+        
+        with pytest.raises(TypeError):
+            dark["profit"] = "#000000"
+    
+    def test_custom_css_per_theme(self):
+        """Test custom CSS is built per theme and reused."""
+        dark_css = get_custom_css("dark")
+        light_css = get_custom_css("light")
+        
+        assert DARK_THEME["background"] in dark_css
+        assert LIGHT_THEME["background"] in light_css
+        assert get_custom_css("dark") is dark_css
 
 
 class TestPositionData:
@@ -450,6 +525,40 @@ class TestRiskMetrics:
         assert metrics.var_95 == 0.0
         assert metrics.margin_used == 0.0
         assert metrics.drawdown == 0.0
+    
+    def test_as_mapping(self):
+        """Test risk metrics read the same from a dataclass or a dict."""
+        from dashboard.components.metrics import _as_mapping
+        
+        metrics = RiskMetrics(var_95=5000, drawdown=3.2)
+        as_dict = {"var_95": 5000}
+        
+        assert _as_mapping(metrics)["var_95"] == 5000
+        assert _as_mapping(metrics)["drawdown"] == 3.2
+        assert _as_mapping(as_dict) is as_dict
+    
+    def test_order_config_cached(self):
+        """Test the order form reads copies of the instrument config through a cache."""
+        from dashboard.components.metrics import _order_underlyings, _order_instrument_config
+        
+        handler = DashboardDataHandler()
+        
+        assert _order_underlyings(handler) == handler.get_available_underlyings()
+        assert _order_instrument_config(handler, "NIFTY") == handler.get_instrument_config("NIFTY")
+        
+        config = _order_instrument_config(handler, "NIFTY")
+        config["lot_size"] = 1
+        
+        assert _order_instrument_config(handler, "NIFTY") == handler.get_instrument_config("NIFTY")
+    
+    def test_format_pnl_block(self):
+        """Test P&L summary blocks are formatted once per value and color."""
+        from dashboard.components.metrics import _format_pnl_block
+        
+        block = _format_pnl_block("Daily P&L", 25000.0, "#00c853", "#888888")
+        
+        assert "₹25.0K" in block and "color: #00c853" in block
+        assert _format_pnl_block("Daily P&L", 25000.0, "#00c853", "#888888") is block
 
 
 class TestFormatCompactNumber:
@@ -507,5 +616,533 @@ class TestFormatCompactNumber:
         assert format_compact_number(5000, decimals=0) == "₹5K"
 
 
+class TestChartFigures:
+    """Tests for cached chart figure builders."""
+    
+    @pytest.fixture
+    def pnl_data(self):
+        """Create sample P&L history."""
+        return pd.DataFrame({
+            "date": pd.date_range("2024-01-01", periods=5),
+            "daily_pnl": [100.0, -50.0, 200.0, 75.0, -25.0],
+            "cumulative_pnl": [100.0, 50.0, 250.0, 325.0, 300.0],
+        })
+    
+    def test_pnl_figure_reused_for_same_data(self, pnl_data):
+        """Test unchanged data reuses the cached figure."""
+        from dashboard.components.charts import _pnl_figure
+        
+        fig = _pnl_figure(pnl_data, 400, True, True, "dark")
+        
+        assert _pnl_figure(pnl_data.copy(), 400, True, True, "dark") == fig
+        assert _pnl_figure(pnl_data, 400, True, True, "light") != fig
+    
+    def test_cached_figure_is_a_copy(self, pnl_data):
+        """Test changing a returned figure does not change the cached one."""
+        from dashboard.components.charts import _pnl_figure
+        
+        fig = _pnl_figure(pnl_data, 400, True, True, "dark")
+        fig.update_layout(title="changed")
+        
+        assert _pnl_figure(pnl_data, 400, True, True, "dark") != fig
+    
+    def test_pnl_figure_rebuilt_on_new_row(self, pnl_data):
+        """Test appending a row produces a new figure."""
+        from dashboard.components.charts import _pnl_figure
+        
+        fig = _pnl_figure(pnl_data, 400, True, True, "dark")
+        extended = pd.concat([pnl_data, pnl_data.tail(1)], ignore_index=True)
+        
+        assert _pnl_figure(extended, 400, True, True, "dark") != fig
+    
+    def test_pnl_figure_rebuilt_on_interior_edit(self, pnl_data):
+        """Test correcting a row in the middle produces a new figure."""
+        from dashboard.components.charts import _pnl_figure
+        
+        fig = _pnl_figure(pnl_data, 400, True, True, "dark")
+        corrected = pnl_data.copy()
+        corrected.loc[2, "cumulative_pnl"] = 260.0
+        
+        assert _pnl_figure(corrected, 400, True, True, "dark") != fig
+    
+    def test_iv_and_performance_figures_reused(self):
+        """Test the IV and performance figures are cached on their inputs."""
+        from dashboard.components.charts import _iv_figure, _performance_figure
+        
+        iv_data = pd.DataFrame(
+            {"iv": [0.15, 0.18, 0.16], "iv_rank": [55.0, 72.0, 64.0]},
+            index=pd.date_range("2024-01-01", periods=3),
+        )
+        metrics = {"win_rate": 0.65, "sharpe_ratio": 1.8}
+        
+        assert _iv_figure(iv_data.copy(), 300, "dark") == _iv_figure(iv_data, 300, "dark")
+        assert _performance_figure(dict(metrics), 300, "dark") == _performance_figure(metrics, 300, "dark")
+        assert _performance_figure({"win_rate": 0.5}, 300, "dark") != _performance_figure(metrics, 300, "dark")
+    
+    def test_performance_values_clipped(self):
+        """Test radar values are scaled and kept within 0-100."""
+        from dashboard.components.charts import _performance_figure
+        
+        metrics = {"win_rate": 0.5, "profit_factor": 9.0, "sharpe_ratio": -1.0, "max_drawdown": 150}
+        fig = _performance_figure(metrics, 300, "dark")
+        
+        assert list(fig.data[0].r) == [50.0, 100.0, 0.0, 0.0, 70.0]
+    
+    def test_render_greeks_chart_totals(self, monkeypatch):
+        """Test the Greeks chart is built from quantity-weighted totals."""
+        from dashboard.components import charts
+        
+        common = dict(
+            underlying="NIFTY",
+            position_type="Short Strangle",
+            entry_price=100,
+            current_price=90,
+            unrealized_pnl=10,
+            entry_date=datetime.now(),
+            expiry=datetime.now() + timedelta(days=7),
+        )
+        positions = [
+            PositionData(symbol="A", quantity=2, delta=0.5, gamma=0.01, theta=-2.0, vega=5.0, **common),
+            PositionData(symbol="B", quantity=-1, delta=-0.3, gamma=0.02, theta=-1.0, vega=3.0, **common),
+        ]
+        captured = {}
+        monkeypatch.setattr(charts, "_greeks_figure", lambda totals, *args: captured.setdefault("totals", totals))
+        monkeypatch.setattr(charts.st, "plotly_chart", lambda *args, **kwargs: None)
+        
+        charts.render_greeks_chart(positions)
+        
+        np.testing.assert_allclose(captured["totals"], (1.3, 0.0, -3.0, 7.0))
+    
+    def test_mini_sparkline_points(self):
+        """Test the sparkline scales the series into the SVG box."""
+        from dashboard.components.charts import render_mini_sparkline
+        
+        svg = render_mini_sparkline(pd.Series([1, 2, 3]), width=100, height=30)
+        
+        assert 'points="0.0,28.0 50.0,15.0 100.0,2.0"' in svg
+        assert render_mini_sparkline(pd.Series([1.0, 2.0, 3.0]), width=100, height=30) is svg
+    
+    def test_as_datetime(self, pnl_data):
+        """Test datetime columns pass through and strings are parsed."""
+        from dashboard.components.charts import _as_datetime
+        
+        dates = pnl_data["date"]
+        parsed = _as_datetime(dates.dt.strftime("%Y-%m-%d"))
+        
+        assert _as_datetime(dates) is dates
+        assert pd.api.types.is_datetime64_any_dtype(parsed)
+        assert (parsed == dates).all()
+    
+    def test_drawdown_figure_computes_drawdown(self):
+        """Test the drawdown is derived from equity when not provided."""
+        from dashboard.components.charts import _drawdown_figure
+        
+        equity = pd.DataFrame({
+            "date": pd.date_range("2024-01-01", periods=4),
+            "equity": [100.0, 120.0, 90.0, 130.0],
+        })
+        
+        fig = _drawdown_figure(equity, 250, "dark")
+        
+        np.testing.assert_allclose(fig.data[0].y, [0.0, 0.0, -25.0, 0.0])
+    
+    def test_pnl_range_slider_only_for_short_series(self, pnl_data):
+        """Test the range slider is dropped for long P&L histories."""
+        from dashboard.components.charts import _pnl_figure, RANGESLIDER_MAX_POINTS
+        
+        long_data = pd.DataFrame({
+            "date": pd.date_range("2000-01-01", periods=RANGESLIDER_MAX_POINTS),
+            "daily_pnl": 1.0,
+            "cumulative_pnl": 1.0,
+        })
+        
+        assert _pnl_figure(pnl_data, 400, True, True, "dark").layout.xaxis.rangeslider.visible
+        assert not _pnl_figure(long_data, 400, True, True, "dark").layout.xaxis.rangeslider.visible
+        assert _pnl_figure(long_data, 400, True, True, "dark").layout.xaxis.rangeselector.buttons
+    
+    def test_pnl_bars_downsampled(self):
+        """Test long daily P&L bars are capped but keep the extreme days."""
+        from dashboard.components.charts import _pnl_figure, MAX_TRACE_POINTS
+        
+        n = 3 * MAX_TRACE_POINTS
+        daily = np.sin(np.arange(n, dtype=float))
+        daily[777] = -50.0
+        long_data = pd.DataFrame({
+            "date": pd.date_range("2000-01-01", periods=n, freq="h"),
+            "daily_pnl": daily,
+            "cumulative_pnl": daily.cumsum(),
+        })
+        
+        bars = _pnl_figure(long_data, 400, True, True, "dark").data[0]
+        
+        assert len(bars.y) <= MAX_TRACE_POINTS
+        assert min(bars.y) == -50.0
+        assert len(bars.marker.color) == len(bars.y)
+    
+    def test_minmax_downsample_keeps_extremes(self):
+        """Test long series are capped while keeping their extremes."""
+        from dashboard.components.charts import _minmax_downsample
+        
+        dates = pd.date_range("2024-01-01", periods=10_000, freq="min")
+        values = np.sin(np.linspace(0, 20, 10_000))
+        values[1234] = -5.0
+        
+        x, y = _minmax_downsample(dates, values, max_points=500)
+        
+        assert len(y) <= 500
+        assert y.min() == -5.0
+        assert y.max() == values.max()
+        assert x[0] == dates[0] and x[-1] == dates[-1]
+    
+    def test_minmax_downsample_short_series_unchanged(self, pnl_data):
+        """Test short series are kept whole and handed over as numpy arrays."""
+        from dashboard.components.charts import _minmax_downsample
+        
+        dates = pnl_data["date"]
+        values = pnl_data["cumulative_pnl"]
+        
+        x, y = _minmax_downsample(dates, values)
+        
+        assert isinstance(x, np.ndarray) and isinstance(y, np.ndarray)
+        np.testing.assert_array_equal(x, dates.to_numpy())
+        np.testing.assert_array_equal(y, values.to_numpy())
+    
+    def test_pnl_traces_sent_as_float32(self, pnl_data):
+        """Test P&L traces are quantized to float32 for the browser."""
+        from dashboard.components.charts import _pnl_figure
+        
+        traces = json.loads(_pnl_figure(pnl_data, 400, True, True, "dark").to_json())["data"]
+        
+        assert [trace["y"]["dtype"] for trace in traces] == ["f4", "f4"]
+        cumulative = np.frombuffer(base64.b64decode(traces[1]["y"]["bdata"]), dtype=np.float32)
+        np.testing.assert_allclose(cumulative, pnl_data["cumulative_pnl"], rtol=1e-6)
+    
+    def test_equity_traces_keep_float64(self):
+        """Test equity and peak keep full precision for the paise in the hover."""
+        from dashboard.components.charts import _equity_figure
+        
+        equity = DashboardDataHandler().get_equity_curve()
+        traces = json.loads(_equity_figure(equity, 250, False, None, "dark").to_json())["data"]
+        
+        assert [trace["y"]["dtype"] for trace in traces] == ["f8", "f8"]
+    
+    def test_minmax_downsample_float32(self, pnl_data):
+        """Test the y values can be narrowed to float32."""
+        from dashboard.components.charts import _minmax_downsample
+        
+        _, y = _minmax_downsample(pnl_data["date"], pnl_data["cumulative_pnl"], dtype=np.float32)
+        
+        assert y.dtype == np.float32
+
+
+class TestAlertManager:
+    """Tests for the alert manager."""
+    
+    @pytest.fixture
+    def manager(self):
+        """Return the session's manager with an empty alert history."""
+        import streamlit as st
+        from dashboard.components.alerts import get_alert_manager
+        
+        keys = ("alert_manager", "alerts", "alerts_by_category", "unread_count")
+        for key in keys:
+            st.session_state.pop(key, None)
+        yield get_alert_manager()
+        for key in keys:
+            st.session_state.pop(key, None)
+    
+    def test_get_alert_manager_per_session(self, manager):
+        """Test the manager is kept in session state and reused."""
+        import streamlit as st
+        from dashboard.components.alerts import get_alert_manager
+        
+        assert get_alert_manager() is manager
+        assert st.session_state.alert_manager is manager
+    
+    def test_zero_max_alerts_keeps_no_history(self, manager):
+        """Test a manager with max_alerts=0 accepts alerts without storing them."""
+        from dashboard.components.alerts import AlertManager
+        
+        empty = AlertManager(max_alerts=0)
+        empty.add_system_alert("Dropped")
+        
+        assert empty.get_alerts() == []
+        assert empty.get_unread_count() == 0
+    
+    def test_alerts_created_on_first_use(self, manager):
+        """Test the alert history is created lazily for a new session."""
+        import streamlit as st
+        
+        assert manager.get_unread_count() == 0
+        
+        manager.add_system_alert("Started")
+        
+        assert len(st.session_state.alerts) == 1
+        assert manager.get_unread_count() == 1
+    
+    def test_history_bounded_newest_first(self, manager):
+        """Test the history keeps the newest max_alerts alerts."""
+        for i in range(manager.max_alerts + 5):
+            manager.add_system_alert(f"Alert {i}")
+        
+        alerts = manager.get_alerts(limit=3)
+        
+        assert [a.message for a in alerts] == [
+            f"Alert {manager.max_alerts + 4}",
+            f"Alert {manager.max_alerts + 3}",
+            f"Alert {manager.max_alerts + 2}",
+        ]
+        assert len(manager.get_alerts(limit=1000)) == manager.max_alerts
+    
+    def test_get_alerts_by_category(self, manager):
+        """Test category filtering stays in sync as old alerts drop out."""
+        from dashboard.components.alerts import AlertCategory
+        
+        manager.add_risk_alert("Old risk")
+        for i in range(manager.max_alerts - 1):
+            manager.add_system_alert(f"System {i}")
+        manager.add_risk_alert("New risk")
+        
+        risk = manager.get_alerts(category=AlertCategory.RISK)
+        
+        assert [a.message for a in risk] == ["New risk"]
+        assert len(manager.get_alerts(category=AlertCategory.SYSTEM, limit=3)) == 3
+        assert manager.get_alerts(category=AlertCategory.ORDER) == []
+        
+        manager.mark_as_read(0)
+        
+        assert manager.get_alerts(category=AlertCategory.RISK, unread_only=True) == []
+    
+    def test_alert_time_str(self):
+        """Test the alert time is formatted once and reused."""
+        from dashboard.components.alerts import Alert
+        
+        alert = Alert("Filled", timestamp=datetime(2024, 1, 15, 9, 30, 5))
+        
+        assert alert.time_str == "09:30:05"
+        assert alert.time_str is alert.time_str
+    
+    def test_alert_slotted(self):
+        """Test alerts use slots and compare by identity."""
+        from dashboard.components.alerts import Alert
+        
+        alert = Alert("Filled")
+        
+        assert not hasattr(alert, "__dict__")
+        assert alert != Alert("Filled")
+    
+    def test_generate_sample_alerts_once(self, manager):
+        """Test sample alerts fill an empty history only."""
+        from dashboard.components.alerts import generate_sample_alerts, _SAMPLE_ALERTS
+        
+        generate_sample_alerts(manager)
+        generate_sample_alerts(manager)
+        
+        alerts = manager.get_alerts(limit=100)
+        assert len(alerts) == len(_SAMPLE_ALERTS)
+        assert alerts[0].message == _SAMPLE_ALERTS[-1][0]
+    
+    def test_unread_count_tracks_changes(self, manager):
+        """Test the unread counter follows reads, trims and clears."""
+        for i in range(manager.max_alerts + 5):
+            manager.add_system_alert(f"Alert {i}")
+        
+        assert manager.get_unread_count() == manager.max_alerts
+        
+        manager.mark_as_read(0)
+        manager.mark_as_read(0)
+        
+        assert manager.get_unread_count() == manager.max_alerts - 1
+        
+        manager.mark_all_as_read()
+        manager.add_system_alert("New")
+        
+        assert manager.get_unread_count() == 1
+        
+        manager.clear_alerts()
+        
+        assert manager.get_unread_count() == 0
+
+
+class TestPositionTable:
+    """Tests for the position table helpers."""
+    
+    def test_positions_frame_from_objects(self):
+        """Test PositionData objects become one column per field."""
+        from dashboard.components.tables import _positions_frame, _POSITION_FIELDS
+        
+        positions = DashboardDataHandler().get_positions()
+        df = _positions_frame(positions)
+        
+        assert tuple(df.columns) == _POSITION_FIELDS
+        assert df["symbol"].tolist() == [p.symbol for p in positions]
+        assert df["unrealized_pnl"].tolist() == [p.unrealized_pnl for p in positions]
+    
+    def test_positions_frame_reused_while_unchanged(self):
+        """Test the positions frame is a copy that follows value changes."""
+        from dashboard.components.tables import _positions_frame
+        
+        positions = DashboardDataHandler().get_positions()
+        df = _positions_frame(positions)
+        df.loc[0, "symbol"] = "CHANGED"
+        
+        assert _positions_frame(positions)["symbol"].iloc[0] == positions[0].symbol
+        
+        positions[0].current_price += 1.0
+        
+        assert _positions_frame(positions)["current_price"].iloc[0] == positions[0].current_price
+    
+    def test_positions_frame_from_dicts(self):
+        """Test missing dict fields fall back to their defaults."""
+        from dashboard.components.tables import _positions_frame
+        
+        df = _positions_frame([
+            {"symbol": "A", "unrealized_pnl": 5.0},
+            {"symbol": "B", "quantity": 50, "expiry": datetime(2030, 1, 1)},
+        ])
+        
+        assert df["quantity"].tolist() == [0, 50]
+        assert df["delta"].tolist() == [0.0, 0.0]
+        assert df["unrealized_pnl"].tolist() == [5.0, 0.0]
+        assert pd.isna(df["expiry"][0])
+    
+    def test_greeks_table_totals(self, monkeypatch):
+        """Test the Greeks table totals row sums every numeric column."""
+        import streamlit as st
+        from dashboard.components.tables import render_greeks_table
+        
+        shown = []
+        monkeypatch.setattr(st, "markdown", lambda *args, **kwargs: None)
+        monkeypatch.setattr(st, "dataframe", lambda data, **kwargs: shown.append(data.data))
+        
+        positions = [
+            {"symbol": "A", "quantity": 50, "delta": -0.2, "theta": -5.0, "vega": 10.0},
+            {"symbol": "B", "quantity": 25, "delta": 0.1, "theta": -2.0, "vega": 4.0},
+        ]
+        render_greeks_table(positions)
+        
+        total = shown[0].iloc[-1]
+        assert total["Position"] == "**TOTAL**"
+        assert total["Vega"] == pytest.approx(14.0)
+        assert total["Position Delta"] == pytest.approx(-7.5)
+        assert total["Position Theta"] == pytest.approx(-300.0)
+    
+    def test_orders_frame_defaults(self):
+        """Test order dicts load into one frame with defaults for missing fields."""
+        from dashboard.components.tables import _orders_frame, _ORDER_DEFAULTS
+        
+        df = _orders_frame([
+            {"order_id": "ORD1", "side": "BUY", "status": "Filled", "timestamp": datetime(2024, 1, 2)},
+            {"order_id": "ORD2", "side": "SELL"},
+        ])
+        
+        assert list(df.columns) == list(_ORDER_DEFAULTS)
+        assert df["status"].tolist() == ["Filled", ""]
+        assert df["quantity"].tolist() == [0, 0]
+        assert pd.isna(df["timestamp"][1])
+    
+    def test_order_log_blank_time_for_missing_timestamps(self, monkeypatch):
+        """Test missing or unparseable timestamps are shown blank."""
+        import streamlit as st
+        from dashboard.components.tables import render_order_log
+        
+        shown = []
+        monkeypatch.setattr(st, "markdown", lambda *args, **kwargs: None)
+        monkeypatch.setattr(st, "caption", lambda *args, **kwargs: None)
+        monkeypatch.setattr(st, "dataframe", lambda data, **kwargs: shown.append(data.data))
+        
+        render_order_log([
+            {"order_id": "ORD1", "timestamp": datetime(2024, 1, 2, 9, 15)},
+            {"order_id": "ORD2"},
+            {"order_id": "ORD3", "timestamp": "not a time"},
+        ], show_filters=False)
+        
+        assert shown[0]["Time"].tolist() == ["2024-01-02 09:15", "", ""]
+    
+    def test_sign_styles(self):
+        """Test numeric columns are styled by sign in one pass."""
+        from dashboard.components.tables import _sign_styles
+        
+        styles = _sign_styles(pd.Series([5.0, -2.0, 0.0]), "color: green", "color: red")
+        
+        assert list(styles) == ["color: green", "color: red", ""]
+    
+    def test_table_styles_cached_per_theme(self):
+        """Test table cell styles are built once per theme and read-only."""
+        from dashboard.components.tables import _table_styles
+        
+        styles = _table_styles("dark")
+        
+        assert _table_styles("dark") is styles
+        assert _table_styles("light") is not styles
+        assert styles["side"]["BUY"] == styles["profit_bold"]
+        with pytest.raises(TypeError):
+            styles["profit"] = "color: blue"
+    
+    def test_value_styles(self):
+        """Test categorical columns are styled by lookup."""
+        from dashboard.components.tables import _value_styles
+        
+        styles = _value_styles(pd.Series(["BUY", "SELL", "HOLD"]), {"BUY": "a", "SELL": "b"})
+        
+        assert styles.tolist() == ["a", "b", ""]
+
+
+class TestSidebar:
+    """Tests for sidebar helpers."""
+    
+    def test_strategies_cached_per_session(self, monkeypatch):
+        """Test the strategy list is fetched once per session and copied per caller."""
+        from uuid import uuid4
+        from dashboard.components.sidebar import _sidebar_strategies
+        
+        session_a, session_b = uuid4().hex, uuid4().hex
+        handler = DashboardDataHandler()
+        calls = []
+        get_strategies = handler.get_strategies
+        monkeypatch.setattr(handler, "get_strategies", lambda: calls.append(1) or get_strategies())
+        
+        strategies = _sidebar_strategies(handler, session_a)
+        strategies[0]["name"] = "Changed"
+        
+        assert _sidebar_strategies(handler, session_a)[0]["name"] == get_strategies()[0]["name"]
+        assert len(calls) == 1
+        
+        _sidebar_strategies(handler, session_b)
+        
+        assert len(calls) == 2
+    
+    def test_staged_download_kept(self):
+        """Test a generated export stays available for later reruns."""
+        import streamlit as st
+        from dashboard.components.sidebar import _stage_download
+        
+        st.session_state.pop("export_downloads", None)
+        _stage_download("pnl", "⬇️ Download P&L CSV", b"date,pnl", "pnl", "20240102_093000")
+        
+        download = st.session_state.export_downloads["pnl"]
+        
+        assert download["data"] == b"date,pnl"
+        assert download["file_name"] == "pnl_20240102_093000.csv"
+        st.session_state.pop("export_downloads", None)
+    
+    def test_clear_alerts_callback(self, monkeypatch):
+        """Test the Clear Alerts callback empties the history and reruns once."""
+        import streamlit as st
+        from dashboard.components.alerts import get_alert_manager
+        from dashboard.components.sidebar import _clear_alerts
+        
+        reruns = []
+        monkeypatch.setattr(st, "rerun", lambda *args, **kwargs: reruns.append(args))
+        manager = get_alert_manager()
+        manager.add_system_alert("Started")
+        
+        _clear_alerts()
+        
+        assert manager.get_alerts() == []
+        assert manager.get_unread_count() == 0
+        assert reruns == [()]
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
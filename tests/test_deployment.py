@@ -0,0 +1,109 @@
+"""
+Tests for Deployment Configuration
+
+Tests for environment resolution and cached lookups in config.deployment.
+"""
+
+import pytest
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from config.deployment import (
+    Environment,
+    EnvironmentConfig,
+    DEVELOPMENT_CONFIG,
+    STAGING_CONFIG,
+    PRODUCTION_CONFIG,
+    get_config,
+    get_current_environment,
+    is_production,
+    is_development,
+    reset_config,
+)
+
+
+@pytest.fixture(autouse=True)
+def clear_cached_environment():
+    """Ensure each test reads ENVIRONMENT fresh."""
+    reset_config()
+    yield
+    reset_config()
+
+
+class TestGetConfig:
+    """Tests for get_config."""
+    
+    def test_explicit_environment(self):
+        """Test resolving explicit environment names."""
+        assert get_config("dev") is DEVELOPMENT_CONFIG
+        assert get_config("staging") is STAGING_CONFIG
+        assert get_config("PROD") is PRODUCTION_CONFIG
+    
+    def test_invalid_environment(self):
+        """Test invalid environment raises ValueError."""
+        with pytest.raises(ValueError):
+            get_config("qa")
+    
+    def test_default_from_env_var(self, monkeypatch):
+        """Test environment is read from ENVIRONMENT env var."""
+        monkeypatch.setenv("ENVIRONMENT", "staging")
+        assert get_config() is STAGING_CONFIG
+
+
+class TestCurrentEnvironment:
+    """Tests for current environment helpers."""
+    
+    def test_production(self, monkeypatch):
+        """Test production detection."""
+        monkeypatch.setenv("ENVIRONMENT", "production")
+        assert get_current_environment() is Environment.PRODUCTION
+        assert is_production()
+        assert not is_development()
+    
+    def test_cached_until_reset(self, monkeypatch):
+        """Test environment is cached until reset_config is called."""
+        monkeypatch.setenv("ENVIRONMENT", "dev")
+        assert is_development()
+        
+        monkeypatch.setenv("ENVIRONMENT", "prod")
+        assert is_development()
+        
+        reset_config()
+        assert is_production()
+
+
+class TestEnvironmentConfig:
+    """Tests for EnvironmentConfig dataclasses."""
+    
+    def test_configs_are_frozen(self):
+        """Test environment configs cannot be mutated."""
+        with pytest.raises(AttributeError):
+            PRODUCTION_CONFIG.paper_trading = True
+        with pytest.raises(AttributeError):
+            PRODUCTION_CONFIG.database.multi_az = False
+    
+    def test_default_resources_shared(self):
+        """Test default resource configs are shared between instances."""
+        config = EnvironmentConfig(name="test", environment=Environment.DEVELOPMENT)
+        other = EnvironmentConfig(name="other", environment=Environment.STAGING)
+        
+        assert config.trading_resources is other.trading_resources
+        assert config.trading_resources.cpu == 256
+        assert config.trading_resources.memory == 512
+    
+    def test_configs_are_slotted(self):
+        """Test config dataclasses use slots instead of an instance dict."""
+        assert not hasattr(PRODUCTION_CONFIG, "__dict__")
+        assert not hasattr(PRODUCTION_CONFIG.database, "__dict__")
+        assert not hasattr(PRODUCTION_CONFIG.trading_resources, "__dict__")
+    
+    def test_identical_configs_shared(self):
+        """Test equal sub-configs are shared across environments."""
+        assert DEVELOPMENT_CONFIG.database is EnvironmentConfig(
+            name="test", environment=Environment.DEVELOPMENT
+        ).database
+        assert DEVELOPMENT_CONFIG.dashboard_resources is STAGING_CONFIG.dashboard_resources
+        assert PRODUCTION_CONFIG.dashboard_resources is PRODUCTION_CONFIG.data_service_resources
+        assert DEVELOPMENT_CONFIG.database.instance_class == "db.t3.micro"
@@ -25,7 +25,11 @@ from config.realtime_settings import (
     get_provider_config,
     get_token_for_symbol,
     get_symbol_for_token,
+    register_symbol_token,
+    get_exchange_type,
+    ExchangeType,
 )
+import config.realtime_settings as realtime_settings
 
 
 class TestMockDataProvider:
@@ -509,6 +513,15 @@ class TestRealtimeSettings:
         unknown_config = get_provider_config('unknown')
         assert unknown_config == {}
     
+    def test_configs_are_read_only(self):
+        """Test config getters return read-only views."""
+        with pytest.raises(TypeError):
+            get_provider_config('mock')['tick_interval_ms'] = 1
+        with pytest.raises(TypeError):
+            get_realtime_config()['provider'] = 'angel_one'
+        
+        assert get_realtime_config()['mock_provider'] is get_provider_config('mock')
+    
     def test_get_token_for_symbol(self):
         """Test symbol to token mapping."""
         token = get_token_for_symbol('NIFTY')
@@ -526,6 +539,39 @@ class TestRealtimeSettings:
         # Unknown token returns itself
         unknown = get_symbol_for_token('12345')
         assert unknown == '12345'
+    
+    def test_get_exchange_type(self):
+        """Test exchange name to type code mapping."""
+        assert get_exchange_type('nfo') is ExchangeType.NFO
+        assert get_exchange_type('BSE') == 3
+        
+        # Unknown exchange falls back to NSE
+        assert get_exchange_type('UNKNOWN') == ExchangeType.NSE
+    
+    @pytest.fixture
+    def token_lookups(self):
+        """Clear the symbol/token lookup caches after the test."""
+        yield
+        get_token_for_symbol.cache_clear()
+        get_symbol_for_token.cache_clear()
+    
+    def test_register_symbol_token(self, monkeypatch, token_lookups):
+        """Test registering a mapping updates both lookup directions."""
+        monkeypatch.setattr(
+            realtime_settings, 'SYMBOL_TOKEN_MAP', dict(realtime_settings.SYMBOL_TOKEN_MAP)
+        )
+        monkeypatch.setattr(
+            realtime_settings, '_TOKEN_SYMBOL_MAP', dict(realtime_settings._TOKEN_SYMBOL_MAP)
+        )
+        
+        register_symbol_token('midcpnifty', '99926074')
+        assert get_token_for_symbol('MIDCPNIFTY') == '99926074'
+        assert get_symbol_for_token('99926074') == 'MIDCPNIFTY'
+        
+        # Re-registering drops the stale reverse entry
+        register_symbol_token('MIDCPNIFTY', '99926075')
+        assert get_symbol_for_token('99926075') == 'MIDCPNIFTY'
+        assert get_symbol_for_token('99926074') == '99926074'
 
 
 class TestIntegration: